@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Real-time factor of sequential vs batched decoding for long recordings.
+
+A speech WAV fixture (16kHz mono, 16-bit) is tiled to each target length and
+decoded through VoiceDaemon._decode() twice: once with batched decoding off
+(one sequential model.transcribe call) and once through the batched pipeline.
+Speech regions are computed up front with Silero, as the capture-time
+endpointer would, and handed to both paths.
+
+RTF = decode time / audio duration (lower is better).
+
+Usage:
+  python3 benchmarks/bench_batched.py fixture.wav [-m small] [--minutes 1 5 30] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import wave
+
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+import papagaio  # noqa: E402
+
+
+def load_wav(path):
+    with wave.open(path, "rb") as wav:
+        if wav.getframerate() != papagaio.SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected 16kHz mono 16-bit WAV")
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def speech_regions(audio):
+    from faster_whisper.vad import get_speech_timestamps, VadOptions
+    options = VadOptions(min_silence_duration_ms=papagaio.STREAMING_CUT_SILENCE_SECONDS * 1000, speech_pad_ms=0)
+    return [(ts["start"], ts["end"]) for ts in get_speech_timestamps(audio, options)]
+
+
+def timed_decode(daemon, audio, regions):
+    start = time.perf_counter()
+    text, info = daemon._decode(audio, speech_regions=regions)
+    return time.perf_counter() - start, text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched vs sequential decoding")
+    parser.add_argument("fixture", help="Speech WAV fixture (16kHz mono 16-bit)")
+    parser.add_argument("-m", "--model", default="small", choices=["tiny", "base", "small", "medium"])
+    parser.add_argument("--minutes", type=float, nargs="+", default=[1, 5, 30])
+    parser.add_argument("--batch-size", type=int, default=papagaio.BATCH_SIZE)
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--json", help="Write results to this path")
+    args = parser.parse_args()
+
+    fixture = load_wav(args.fixture)
+    daemon = papagaio.VoiceDaemon(model_size=args.model, transcription_language=args.language,
+                                  batch_size=args.batch_size)
+    daemon.initialize_model()
+
+    results = []
+    print(f"{'minutes':>8} {'sequential RTF':>15} {'batched RTF':>12} {'speedup':>8}")
+    for minutes in args.minutes:
+        samples = int(minutes * 60 * papagaio.SAMPLE_RATE)
+        audio = np.resize(fixture, samples)
+        regions = speech_regions(audio)
+
+        daemon.batched_decoding = False
+        sequential, _ = timed_decode(daemon, audio, regions)
+        daemon.batched_decoding = True
+        batched, _ = timed_decode(daemon, audio, regions)
+
+        duration = samples / papagaio.SAMPLE_RATE
+        row = {
+            "minutes": minutes,
+            "model": args.model,
+            "batch_size": args.batch_size,
+            "sequential_seconds": round(sequential, 2),
+            "batched_seconds": round(batched, 2),
+            "sequential_rtf": round(sequential / duration, 4),
+            "batched_rtf": round(batched / duration, 4),
+        }
+        results.append(row)
+        print(f"{minutes:>8g} {row['sequential_rtf']:>15.4f} {row['batched_rtf']:>12.4f} {sequential / batched:>7.1f}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
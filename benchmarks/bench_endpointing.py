@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Compare RMS and Silero endpointing on recorded samples.
+
+Each WAV file (16kHz mono, 16-bit) is replayed chunk by chunk through the
+same endpointers the daemon uses. The reference end of speech comes from an
+offline Silero pass over the whole file. For every detector we report:
+
+  delay       seconds between the reference end of speech and the stop
+  false stop  the detector stopped before the speaker had finished
+  no stop     the detector never stopped (noise kept it "speaking")
+
+Usage:
+  python3 benchmarks/bench_endpointing.py samples/*.wav [--pad 10] [--json out.json]
+
+Recordings should start with at least 0.5s of room noise, like a real
+session does while calibrating. --pad appends that much of the file's own
+leading noise so detectors that end late still get a chance to stop.
+"""
+
+import argparse
+import json
+import os
+import sys
+import wave
+
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+import papagaio  # noqa: E402
+
+
+def load_wav(path):
+    with wave.open(path, "rb") as wav:
+        if wav.getframerate() != papagaio.SAMPLE_RATE or wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: expected 16kHz mono 16-bit WAV")
+        return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+
+
+def reference_speech_end(samples):
+    """End of the last speech region (seconds) from an offline Silero pass"""
+    from faster_whisper.vad import get_speech_timestamps, VadOptions
+    options = VadOptions(min_silence_duration_ms=500, speech_pad_ms=0)
+    timestamps = get_speech_timestamps(samples.astype(np.float32) / 32768.0, options)
+    if not timestamps:
+        return None
+    return timestamps[-1]["end"] / papagaio.SAMPLE_RATE
+
+
+def run_detector(endpointer, samples, silence_duration):
+    """Replay samples through the record_audio() stop rule; return stop time or None"""
+    chunk = papagaio.CHUNK_SIZE
+    rate = papagaio.SAMPLE_RATE
+    max_silence_chunks = int(silence_duration * rate / chunk)
+    min_recording_chunks = int(papagaio.MIN_RECORDING_DURATION_SECONDS * rate / chunk)
+    started_speaking = False
+    silence_chunks = 0
+
+    for index in range(len(samples) // chunk):
+        data = samples[index * chunk:(index + 1) * chunk]
+        rms = float(np.sqrt(np.mean(data.astype(np.float32) ** 2)))
+        if endpointer.is_speech(data, rms):
+            started_speaking = True
+            silence_chunks = 0
+        elif started_speaking:
+            silence_chunks += 1
+        if started_speaking and silence_chunks > max_silence_chunks and index + 1 > min_recording_chunks:
+            return (index + 1) * chunk / rate
+    return None
+
+
+def calibrated_threshold(samples):
+    """Same rule as VoiceDaemon.calibrate_noise_floor()"""
+    chunk = papagaio.CHUNK_SIZE
+    count = int(papagaio.CALIBRATION_DURATION_SECONDS * papagaio.SAMPLE_RATE / chunk)
+    levels = [float(np.sqrt(np.mean(samples[i * chunk:(i + 1) * chunk].astype(np.float32) ** 2)))
+              for i in range(count)]
+    return max(100, int(sum(levels) / len(levels) * papagaio.SPEECH_OVER_NOISE)) if levels else papagaio.SILENCE_THRESHOLD_RMS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RMS vs Silero endpointing")
+    parser.add_argument("files", nargs="+", help="16kHz mono 16-bit WAV files")
+    parser.add_argument("--silence-duration", type=float, default=papagaio.SILENCE_DURATION_SECONDS)
+    parser.add_argument("--vad-threshold", type=float, default=papagaio.VAD_SPEECH_THRESHOLD)
+    parser.add_argument("--pad", type=float, default=10.0, help="Seconds of room noise appended to each file")
+    parser.add_argument("--json", help="Write per-file results to this path")
+    args = parser.parse_args()
+
+    calibration = int(papagaio.CALIBRATION_DURATION_SECONDS * papagaio.SAMPLE_RATE)
+    results = []
+    for path in args.files:
+        samples = load_wav(path)
+        noise = samples[:calibration]
+        if args.pad > 0 and len(noise):
+            repeats = int(np.ceil(args.pad * papagaio.SAMPLE_RATE / len(noise)))
+            samples = np.concatenate((samples, np.tile(noise, repeats)))
+
+        speech_end = reference_speech_end(samples)
+        if speech_end is None:
+            print(f"{path}: no speech found, skipped")
+            continue
+
+        detectors = {
+            "rms": papagaio.RmsEndpointer(calibrated_threshold(samples)),
+            "silero": papagaio.SileroEndpointer(args.vad_threshold),
+        }
+        row = {"file": path, "speech_end": round(speech_end, 3)}
+        # Detectors start after calibration, like a cold recording session
+        for name, detector in detectors.items():
+            stop = run_detector(detector, samples[calibration:], args.silence_duration)
+            if stop is not None:
+                stop += calibration / papagaio.SAMPLE_RATE
+            row[name] = {
+                "stop": None if stop is None else round(stop, 3),
+                "delay": None if stop is None else round(stop - speech_end, 3),
+                "false_stop": stop is not None and stop < speech_end,
+            }
+        results.append(row)
+
+    print(f"{'file':<40} {'detector':<8} {'delay (s)':>10}  outcome")
+    for row in results:
+        for name in ("rms", "silero"):
+            r = row[name]
+            outcome = "no stop" if r["stop"] is None else ("FALSE STOP" if r["false_stop"] else "ok")
+            delay = "-" if r["delay"] is None else f"{r['delay']:.2f}"
+            print(f"{os.path.basename(row['file']):<40} {name:<8} {delay:>10}  {outcome}")
+
+    print()
+    for name in ("rms", "silero"):
+        delays = [row[name]["delay"] for row in results if row[name]["stop"] is not None and not row[name]["false_stop"]]
+        false_stops = sum(row[name]["false_stop"] for row in results)
+        no_stops = sum(row[name]["stop"] is None for row in results)
+        median = f"{np.median(delays):.2f}s" if delays else "-"
+        print(f"{name:<8} median delay {median:>7}  false stops {false_stops}/{len(results)}  no stop {no_stops}/{len(results)}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
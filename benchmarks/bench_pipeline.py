@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+End-to-end latency of the dictation pipeline, offline.
+
+Each WAV fixture (16kHz mono, 16-bit) is played in real time through a fake
+PyAudio input stream into an unmodified VoiceDaemon: capture and calibration,
+endpointing, transcribe(), the _is_hallucination() filter and type_text()
+with a null typing backend. Nothing needs a microphone, a display or a
+notification daemon.
+
+Stages (seconds, reported as p50/p90/p95/max over all runs of a model):
+
+  endpoint    reference end of speech -> record_audio() returned
+  decode      transcribe() minus the hallucination filter
+  filter      _is_hallucination()
+  type        type_text() through the null backend
+  total       reference end of speech -> text typed
+
+Per model we also report the real-time factor (decode / recorded seconds),
+model load time, CPU time (user + system, including any worker process) and
+peak RSS. Every model runs in its own process so peak RSS is not shared.
+
+Usage:
+  python3 benchmarks/bench_pipeline.py samples/*.wav [-m tiny base small] [--runs 3] [--json out.json]
+
+Fixtures should start with at least 0.5s of room noise (used for calibration,
+like a real session) and are followed by more of it so the endpointer can
+stop. The reference end of speech comes from an offline Silero pass.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+import papagaio  # noqa: E402
+from bench_endpointing import load_wav, reference_speech_end  # noqa: E402
+
+STAGES = ("endpoint", "decode", "filter", "type", "total")
+
+
+class FakeStream:
+    """Plays samples through a PortAudio-style callback at the given speed"""
+
+    def __init__(self, player, callback, frames_per_buffer):
+        self.player = player
+        self.callback = callback
+        self.chunk = frames_per_buffer
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start_stream(self):
+        self._thread.start()
+
+    def _run(self):
+        samples = self.player.samples
+        interval = self.chunk / papagaio.SAMPLE_RATE / self.player.speed
+        next_time = time.perf_counter()
+        index = 0
+        while not self._stop.is_set():
+            start = index * self.chunk
+            data = samples[start:start + self.chunk]
+            if len(data) < self.chunk:
+                data = self.player.tail(self.chunk)
+            self.callback(data.tobytes(), self.chunk, {}, 0)
+            if self.player.speech_end_time is None and start + self.chunk >= self.player.speech_end:
+                self.player.speech_end_time = time.perf_counter()
+            index += 1
+            next_time += interval
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+    def is_active(self):
+        return self._thread.is_alive()
+
+    def stop_stream(self):
+        self._stop.set()
+        self._thread.join(timeout=1)
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    """Stands in for pyaudio.PyAudio; plays the current fixture"""
+
+    player = None
+
+    def open(self, rate, frames_per_buffer, stream_callback, **kwargs):
+        return FakeStream(FakePyAudio.player, stream_callback, frames_per_buffer)
+
+    def terminate(self):
+        pass
+
+
+class Player:
+    """One fixture: calibration noise + file, then the file's leading noise on repeat"""
+
+    def __init__(self, samples, speech_end, speed):
+        calibration = int(papagaio.CALIBRATION_DURATION_SECONDS * papagaio.SAMPLE_RATE)
+        self.noise = samples[:calibration]
+        self.samples = np.concatenate((self.noise, samples))
+        self.speech_end = len(self.noise) + int(speech_end * papagaio.SAMPLE_RATE)
+        self.speed = speed
+        self.speech_end_time = None
+        self._tail = 0
+
+    def tail(self, n):
+        if not len(self.noise):
+            return np.zeros(n, dtype=np.int16)
+        index = (self._tail + np.arange(n)) % len(self.noise)
+        self._tail += n
+        return self.noise[index]
+
+
+def cpu_seconds():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def percentiles(values):
+    if not values:
+        return None
+    return {
+        "p50": round(float(np.percentile(values, 50)), 4),
+        "p90": round(float(np.percentile(values, 90)), 4),
+        "p95": round(float(np.percentile(values, 95)), 4),
+        "max": round(float(max(values)), 4),
+        "mean": round(float(np.mean(values)), 4),
+    }
+
+
+def run_model(args):
+    """Benchmark one model in this process and return its result dict"""
+    papagaio.pyaudio.PyAudio = FakePyAudio
+
+    filter_time = [0.0]
+    is_hallucination = papagaio._is_hallucination
+
+    def timed_filter(text):
+        start = time.perf_counter()
+        try:
+            return is_hallucination(text)
+        finally:
+            filter_time[0] += time.perf_counter() - start
+
+    papagaio._is_hallucination = timed_filter
+
+    daemon = papagaio.VoiceDaemon(model_size=args.model[0], transcription_language=args.language,
+                                  silence_duration=args.silence_duration, endpointing=args.endpointing,
+                                  worker_process=args.worker_process)
+    daemon.show_notification = lambda *a, **k: None
+    typed = []
+    daemon._type_text_impl = typed.append  # Null typing backend
+
+    cpu_start = cpu_seconds()
+    start = time.perf_counter()
+    daemon.initialize_model()
+    daemon.create_endpointer(daemon.SILENCE_THRESHOLD)  # Preload VAD, as start() does
+    load_seconds = time.perf_counter() - start
+
+    stages = {stage: [] for stage in STAGES}
+    rtf = []
+    runs = []
+    audio_seconds = 0.0
+    for path in args.files:
+        samples = load_wav(path)
+        speech_end = reference_speech_end(samples)
+        if speech_end is None:
+            print(f"{path}: no speech found, skipped", file=sys.stderr)
+            continue
+
+        for _ in range(args.runs):
+            player = Player(samples, speech_end, args.speed)
+            FakePyAudio.player = player
+            filter_time[0] = 0.0
+
+            recording = daemon.record_audio()
+            recorded = time.perf_counter()
+            if recording is None or player.speech_end_time is None:
+                runs.append({"file": path, "error": "nothing recorded"})
+                continue
+
+            start = time.perf_counter()
+            text = daemon.transcribe(recording.audio, recording.speech_regions)
+            transcribe_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if text and len(text) > papagaio.MIN_VALID_TRANSCRIPTION_LENGTH:
+                daemon.type_text(text)
+            typed_at = time.perf_counter()
+
+            run = {
+                "file": path,
+                "recorded_seconds": round(recording.duration, 3),
+                "endpoint": recorded - player.speech_end_time,
+                "decode": transcribe_seconds - filter_time[0],
+                "filter": filter_time[0],
+                "type": typed_at - start,
+                "total": typed_at - player.speech_end_time,
+                "overflows": daemon.session_stats.get("overflows", 0),
+                "text": text,
+            }
+            rtf.append(run["decode"] / recording.duration)
+            for stage in STAGES:
+                stages[stage].append(run[stage])
+                run[stage] = round(run[stage], 4)
+            audio_seconds += recording.duration
+            runs.append(run)
+
+    if isinstance(daemon.model, papagaio.WorkerWhisperModel):
+        daemon.model.close()
+
+    return {
+        "model": args.model[0],
+        "endpointing": daemon.endpointing,
+        "worker_process": args.worker_process,
+        "speed": args.speed,
+        "load_seconds": round(load_seconds, 3),
+        "audio_seconds": round(audio_seconds, 3),
+        "cpu_seconds": round(cpu_seconds() - cpu_start, 3),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "rtf": percentiles(rtf),
+        "stages": {stage: percentiles(values) for stage, values in stages.items()},
+        "runs": runs,
+    }
+
+
+def child_command(args, model, output):
+    command = [sys.executable, os.path.abspath(__file__), *args.files, "-m", model, "--json", output, "--child",
+               "--runs", str(args.runs), "--speed", str(args.speed), "--language", args.language,
+               "--silence-duration", str(args.silence_duration), "--endpointing", args.endpointing]
+    if args.worker_process:
+        command.append("--worker-process")
+    return command
+
+
+def print_summary(results):
+    print(f"\n{'model':<8} {'stage':<9} {'p50':>8} {'p90':>8} {'p95':>8} {'max':>8}")
+    for result in results:
+        for stage in STAGES:
+            p = result["stages"][stage]
+            if p:
+                print(f"{result['model']:<8} {stage:<9} {p['p50']:>8.3f} {p['p90']:>8.3f} {p['p95']:>8.3f} {p['max']:>8.3f}")
+    print(f"\n{'model':<8} {'RTF p50':>8} {'load (s)':>9} {'CPU (s)':>8} {'peak RSS':>10}")
+    for result in results:
+        rtf = f"{result['rtf']['p50']:.3f}" if result["rtf"] else "-"
+        print(f"{result['model']:<8} {rtf:>8} {result['load_seconds']:>9.2f} {result['cpu_seconds']:>8.1f} "
+              f"{result['peak_rss_mb']:>8.0f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end dictation latency")
+    parser.add_argument("files", nargs="+", help="16kHz mono 16-bit WAV fixtures")
+    parser.add_argument("-m", "--model", nargs="+", default=["tiny", "base", "small"],
+                        choices=["tiny", "base", "small", "medium", "large-v3"])
+    parser.add_argument("--runs", type=int, default=3, help="Runs per fixture")
+    parser.add_argument("--speed", type=float, default=1.0, help="Playback speed (1 = real time)")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--silence-duration", type=float, default=papagaio.SILENCE_DURATION_SECONDS)
+    parser.add_argument("--endpointing", choices=["silero", "rms"], default=papagaio.ENDPOINTING_MODE)
+    parser.add_argument("--worker-process", action="store_true", help="Decode in the worker process")
+    parser.add_argument("--json", help="Write results to this path")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        with open(args.json, "w") as f:
+            json.dump(run_model(args), f)
+        return
+
+    # One process per model so peak RSS and CPU time are the model's own
+    results = []
+    for model in args.model:
+        with tempfile.NamedTemporaryFile(suffix=".json") as output:
+            subprocess.run(child_command(args, model, output.name), check=True)
+            results.append(json.load(output))
+
+    print_summary(results)
+    if args.json:
+        report = {
+            "version": papagaio.__version__,
+            "machine": os.uname().machine,
+            "cpu_count": os.cpu_count(),
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
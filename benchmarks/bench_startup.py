@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Import time of papagaio.py and of the heavy modules it defers.
+
+Each measurement runs in a fresh interpreter with `python -X importtime`,
+so nothing is shared between runs (bytecode caches excepted: one untimed
+warm-up run writes them first). Reports, as the median over --runs:
+
+  import papagaio     cumulative import time of the module
+  --version          wall time of `papagaio.py --version`
+  per module         cumulative time of each module imported directly by
+                     papagaio (the top entries of -X importtime)
+  deferred           cost of each heavy module on its own; papagaio only
+                     pays it on the code path that needs it
+
+--budget-ms makes the exit status 1 when importing papagaio takes longer,
+for use as a regression check.
+
+Usage:
+  python3 benchmarks/bench_startup.py [--runs 5] [--budget-ms 150] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+DEFERRED = ("numpy", "pyaudio", "pynput.keyboard", "faster_whisper", "ctranslate2", "evdev",
+            "plyer", "gi", "torch")
+
+
+def importtime(statement):
+    """{module: cumulative microseconds} for modules imported by statement in a new interpreter"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])),
+               PYNPUT_BACKEND=os.environ.get("PYNPUT_BACKEND", "dummy"))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, env=env, timeout=120)
+    if result.returncode != 0:
+        return None
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # Header line
+        depth = (len(name) - len(name.lstrip())) // 2
+        times.setdefault(name.strip(), (int(cumulative), depth))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark papagaio startup import time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Modules to list")
+    parser.add_argument("--budget-ms", type=float, help="Fail if importing papagaio takes longer")
+    parser.add_argument("--json", help="Write results to this path")
+    args = parser.parse_args()
+
+    if importtime("import papagaio") is None:
+        sys.exit("Importing papagaio failed (missing dependencies?)")
+
+    totals, children = [], {}
+    for _ in range(args.runs):
+        times = importtime("import papagaio")
+        totals.append(times["papagaio"][0] / 1000)
+        for name, (micros, depth) in times.items():
+            if depth == 1:
+                children.setdefault(name, []).append(micros / 1000)
+
+    version = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(ROOT, "papagaio.py"), "--version"],
+                       capture_output=True, timeout=120)
+        version.append((time.perf_counter() - start) * 1000)
+
+    deferred = {}
+    for module in DEFERRED:
+        times = importtime(f"import {module}")
+        if times and module in times:
+            deferred[module] = round(times[module][0] / 1000, 1)
+
+    results = {
+        "import_ms": round(statistics.median(totals), 1),
+        "version_ms": round(statistics.median(version), 1),
+        "modules_ms": {name: round(statistics.median(values), 1) for name, values in
+                       sorted(children.items(), key=lambda item: -statistics.median(item[1]))},
+        "deferred_ms": deferred,
+        "runs": args.runs,
+    }
+
+    print(f"import papagaio  {results['import_ms']:>8.1f}ms")
+    print(f"--version        {results['version_ms']:>8.1f}ms (wall, includes interpreter start)")
+    print(f"\n{'imported by papagaio':<28} {'ms':>8}")
+    for name, ms in list(results["modules_ms"].items())[:args.top]:
+        print(f"{name:<28} {ms:>8.1f}")
+    print(f"\n{'deferred (own import)':<28} {'ms':>8}")
+    for name, ms in deferred.items():
+        print(f"{name:<28} {ms:>8.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.budget_ms is not None and results["import_ms"] > args.budget_ms:
+        print(f"\nOver budget: {results['import_ms']:.1f}ms > {args.budget_ms:g}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
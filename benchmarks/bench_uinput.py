@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Per-operation latency of the in-process uinput keyboard vs spawning ydotool.
+
+Runs the keystroke operations the daemon performs per dictation on Wayland
+through UInputKeyboard (one virtual device, created once) and through the
+equivalent ydotool command, and reports milliseconds per call:
+
+  key    ydotool key <code>:1 <code>:0 (default Left Shift: types nothing)
+  type   ydotool type <--text>  (only with --type)
+
+--type sends real keystrokes to the focused window: focus a scratch editor
+before the countdown ends. Needs write access to /dev/uinput.
+
+Usage:
+  python3 benchmarks/bench_uinput.py [--runs 50] [--type] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+import papagaio  # noqa: E402
+
+
+def timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50_ms": round(float(np.percentile(times, 50)), 3),
+        "p95_ms": round(float(np.percentile(times, 95)), 3),
+        "mean_ms": round(float(np.mean(times)), 3),
+    }
+
+
+def ydotool(*args):
+    return lambda: subprocess.run(["ydotool", *args], check=True, capture_output=True, timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-process uinput vs ydotool")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--type", action="store_true", help="Also benchmark typing (sends keystrokes!)")
+    parser.add_argument("--text", default="The quick brown fox jumps over the lazy dog. ")
+    parser.add_argument("--json", help="Write results to this path")
+    args = parser.parse_args()
+
+    if not papagaio.HAS_EVDEV:
+        sys.exit("Needs python-evdev")
+    has_ydotool = bool(shutil.which("ydotool"))
+
+    # Includes creating the device, paid once per daemon lifetime
+    start = time.perf_counter()
+    keyboard = papagaio.UInputKeyboard()
+    setup_ms = (time.perf_counter() - start) * 1000
+    time.sleep(0.5)  # Give the compositor time to pick up the new device
+
+    shift = papagaio.evdev.ecodes.KEY_LEFTSHIFT
+    operations = {"key": (lambda: keyboard.key("shift"), ydotool("key", f"{shift}:1", f"{shift}:0"))}
+    if args.type:
+        print("Typing starts in 3s, focus a scratch window...")
+        time.sleep(3)
+        operations["type"] = (lambda: keyboard.type(args.text), ydotool("type", "--", args.text))
+
+    results = {"setup_ms": round(setup_ms, 3), "runs": args.runs, "operations": {}}
+    print(f"{'operation':<10} {'uinput p50':>11} {'ydotool p50':>12} {'speedup':>8}")
+    for name, (in_process, spawned) in operations.items():
+        runs = max(1, args.runs // 10) if name == "type" else args.runs
+        row = {"uinput": timed(in_process, runs)}
+        if has_ydotool:
+            row["ydotool"] = timed(spawned, runs)
+        results["operations"][name] = row
+        ours = row["uinput"]["p50_ms"]
+        theirs = row["ydotool"]["p50_ms"] if has_ydotool else None
+        speedup = f"{theirs / ours:.0f}x" if theirs and ours else "-"
+        theirs = f"{theirs:.2f}ms" if theirs is not None else "-"
+        print(f"{name:<10} {ours:>9.2f}ms {theirs:>12} {speedup:>8}")
+    print(f"\nUInputKeyboard setup: {setup_ms:.1f}ms (once per daemon)")
+
+    keyboard.close()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
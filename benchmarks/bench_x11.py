@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Per-operation latency of the in-process X11 backend vs spawning xdotool.
+
+Runs each operation the daemon performs per dictation through X11Session
+(one persistent XTEST connection) and through the equivalent xdotool
+command, and reports milliseconds per call:
+
+  active_window      xdotool getactivewindow
+  activate           xdotool windowactivate <active window>
+  release_modifiers  xdotool keyup ctrl shift alt super
+  key                xdotool key <--key> (default Shift_L: types nothing)
+  type               xdotool type --delay 2 <--text>  (only with --type)
+
+--type sends real keystrokes to the focused window: focus a scratch editor
+before the countdown ends.
+
+Usage:
+  python3 benchmarks/bench_x11.py [--runs 50] [--type] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("PYNPUT_BACKEND", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np  # noqa: E402
+import papagaio  # noqa: E402
+
+
+def timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50_ms": round(float(np.percentile(times, 50)), 3),
+        "p95_ms": round(float(np.percentile(times, 95)), 3),
+        "mean_ms": round(float(np.mean(times)), 3),
+    }
+
+
+def xdotool(*args):
+    return lambda: subprocess.run(["xdotool", *args], check=True, capture_output=True, timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-process X11 vs xdotool")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--key", default="Shift_L", help="Key tapped by the key benchmark")
+    parser.add_argument("--type", action="store_true", help="Also benchmark typing (sends keystrokes!)")
+    parser.add_argument("--text", default="The quick brown fox jumps over the lazy dog. ")
+    parser.add_argument("--json", help="Write results to this path")
+    args = parser.parse_args()
+
+    if not papagaio.HAS_XLIB or not os.environ.get("DISPLAY"):
+        sys.exit("Needs python-xlib and an X display")
+    has_xdotool = bool(shutil.which("xdotool"))
+
+    # Includes connecting and the keymap scan, paid once per daemon lifetime
+    start = time.perf_counter()
+    x11 = papagaio.X11Session()
+    connect_ms = (time.perf_counter() - start) * 1000
+    window = x11.active_window()
+
+    operations = {
+        "active_window": (x11.active_window, xdotool("getactivewindow")),
+        "activate": (lambda: x11.activate(window), xdotool("windowactivate", str(window))),
+        "release_modifiers": (x11.release_modifiers, xdotool("keyup", "ctrl", "shift", "alt", "super")),
+        "key": (lambda: x11.key(args.key), xdotool("key", args.key)),
+    }
+    if args.type:
+        print("Typing starts in 3s, focus a scratch window...")
+        time.sleep(3)
+        operations["type"] = (lambda: x11.type(args.text), xdotool("type", "--delay", "2", "--", args.text))
+
+    results = {"connect_ms": round(connect_ms, 3), "runs": args.runs, "operations": {}}
+    print(f"{'operation':<18} {'XTest p50':>10} {'xdotool p50':>12} {'speedup':>8}")
+    for name, (in_process, spawned) in operations.items():
+        if name == "activate" and not window:
+            continue
+        runs = max(1, args.runs // 10) if name == "type" else args.runs
+        row = {"xtest": timed(in_process, runs)}
+        if has_xdotool:
+            row["xdotool"] = timed(spawned, runs)
+        results["operations"][name] = row
+        ours = row["xtest"]["p50_ms"]
+        theirs = row["xdotool"]["p50_ms"] if has_xdotool else None
+        speedup = f"{theirs / ours:.0f}x" if theirs and ours else "-"
+        theirs = f"{theirs:.2f}ms" if theirs is not None else "-"
+        print(f"{name:<18} {ours:>8.2f}ms {theirs:>12} {speedup:>8}")
+    print(f"\nX11Session setup: {connect_ms:.1f}ms (once per daemon)")
+
+    x11.close()
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -309,12 +309,16 @@ install_files() {
     cp "$SCRIPT_DIR/papagaio-ctl" "$INSTALL_DIR/papagaio-ctl"
     chmod +x "$INSTALL_DIR/papagaio-ctl"
 
+    cp "$SCRIPT_DIR/papagaio-send" "$INSTALL_DIR/papagaio-send"
+    chmod +x "$INSTALL_DIR/papagaio-send"
+
     if [ -f "$SCRIPT_DIR/requirements.txt" ]; then
         cp "$SCRIPT_DIR/requirements.txt" "$INSTALL_DIR/requirements.txt"
     fi
 
     # Symlink papagaio-ctl into PATH
     ln -sf "$INSTALL_DIR/papagaio-ctl" "$BIN_DIR/papagaio-ctl"
+    ln -sf "$INSTALL_DIR/papagaio-send" "$BIN_DIR/papagaio-send"
 
     print_success "Files installed to $INSTALL_DIR"
 }
@@ -420,7 +424,7 @@ cleanup_on_error() {
     systemctl --user stop papagaio 2>/dev/null || true
     systemctl --user disable papagaio 2>/dev/null || true
     rm -rf "$INSTALL_DIR" 2>/dev/null || true
-    rm -f "$BIN_DIR/papagaio-ctl" 2>/dev/null || true
+    rm -f "$BIN_DIR/papagaio-ctl" "$BIN_DIR/papagaio-send" 2>/dev/null || true
     rm -f "$SERVICE_DIR/papagaio.service" 2>/dev/null || true
 
     exit 1
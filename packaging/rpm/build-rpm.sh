@@ -104,6 +104,7 @@ create_tarball() {
     cp "$PROJECT_ROOT/papagaio-settings.py" "$srcdir/"
     cp "$PROJECT_ROOT/papagaio-tray.py" "$srcdir/"
     cp "$PROJECT_ROOT/papagaio-ctl" "$srcdir/"
+    cp "$PROJECT_ROOT/papagaio-send" "$srcdir/"
     cp "$PROJECT_ROOT/papagaio-settings.desktop" "$srcdir/"
     cp "$PROJECT_ROOT/papagaio-tray.desktop" "$srcdir/"
     cp "$PROJECT_ROOT/requirements.txt" "$srcdir/"
@@ -61,6 +61,7 @@ install -m 755 papagaio.py %{buildroot}%{_libexecdir}/%{name}/
 install -m 755 papagaio-settings.py %{buildroot}%{_libexecdir}/%{name}/
 install -m 755 papagaio-tray.py %{buildroot}%{_libexecdir}/%{name}/
 install -m 755 papagaio-ctl %{buildroot}%{_libexecdir}/%{name}/
+install -m 755 papagaio-send %{buildroot}%{_bindir}/papagaio-send
 
 # Create wrapper scripts
 cat > %{buildroot}%{_bindir}/papagaio << 'EOF'
@@ -145,6 +146,7 @@ systemctl --user daemon-reload 2>/dev/null || true
 %doc README.md
 %{_bindir}/papagaio
 %{_bindir}/papagaio-ctl
+%{_bindir}/papagaio-send
 %{_bindir}/papagaio-settings
 %{_bindir}/papagaio-tray
 %{_libexecdir}/%{name}/
@@ -39,7 +39,7 @@ class PapagaioSettings:
         self.root.geometry("500x450")
         self.root.resizable(False, False)
 
-        self.config = configparser.ConfigParser()
+        self.config = configparser.ConfigParser(inline_comment_prefixes=('#',))
         self.load_config()
 
         self.create_widgets()
@@ -156,7 +156,7 @@ class PapagaioSettings:
         button_frame.pack(fill='x', padx=10, pady=(0, 10))
 
         ttk.Button(button_frame, text="Save", command=self.save_config).pack(side='right', padx=(5, 0))
-        ttk.Button(button_frame, text="Save & Restart", command=self.save_and_restart).pack(side='right', padx=(5, 0))
+        ttk.Button(button_frame, text="Save & Apply", command=self.save_and_apply).pack(side='right', padx=(5, 0))
         ttk.Button(button_frame, text="Cancel", command=self.root.quit).pack(side='right')
 
         # Status
@@ -184,10 +184,19 @@ class PapagaioSettings:
         self.status_var.set("Saved!")
         self.root.after(2000, lambda: self.status_var.set(""))
 
-    def save_and_restart(self):
-        """Save configuration and restart the daemon"""
+    def save_and_apply(self):
+        """Save configuration and apply it to the running daemon"""
         self.save_config()
 
+        # The daemon reloads config.ini in place (the model stays loaded);
+        # only restart it if it cannot be reached
+        try:
+            if subprocess.run(["papagaio-send", "reload"], capture_output=True, timeout=5).returncode == 0:
+                messagebox.showinfo("Success", "Configuration saved and applied!")
+                return
+        except (subprocess.SubprocessError, FileNotFoundError):
+            pass
+
         try:
             subprocess.run(["systemctl", "--user", "restart", "papagaio"], check=True)
             messagebox.showinfo("Success", "Configuration saved and daemon restarted!")
@@ -4,9 +4,13 @@ Papagaio System Tray - Graphical Control Interface
 Provides system tray icon with menu for controlling the daemon
 """
 
+import ctypes
+import os
+import socket
 import subprocess
 import sys
-import os
+import threading
+import time
 
 # Check for pystray availability
 try:
@@ -21,6 +25,19 @@ except ImportError:
 INSTALL_DIR = os.path.expanduser("~/.local/bin/papagaio")
 SERVICE_NAME = "papagaio"
 
+# Daemon state -> (icon color, label); "stopped" means no daemon is listening
+STATES = {
+    "stopped": ("gray", "Stopped"),
+    "idle": ("green", "Ready"),
+    "recording": ("red", "Recording"),
+    "transcribing": ("orange", "Transcribing"),
+    "typing": ("blue", "Typing"),
+    "error": ("yellow", "Error"),
+}
+
+# Latest state pushed by the daemon (menu callbacks only read this)
+daemon_state = {"state": "stopped", "detail": ""}
+
 
 def create_icon_image(color="gray"):
     """Create a simple microphone icon"""
@@ -32,7 +49,9 @@ def create_icon_image(color="gray"):
         "gray": "#808080",
         "green": "#4CAF50",
         "red": "#F44336",
-        "orange": "#FF9800"
+        "orange": "#FF9800",
+        "blue": "#2196F3",
+        "yellow": "#FFC107"
     }
     fill_color = colors.get(color, "#808080")
 
@@ -47,23 +66,95 @@ def create_icon_image(color="gray"):
     return image
 
 
+def control_socket_path():
+    """Keep in sync with control_socket_path() in papagaio.py"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "papagaio.sock")
+    import tempfile
+    return os.path.join(tempfile.gettempdir(), f"papagaio-{os.getuid()}.sock")
+
+
 def is_daemon_running():
-    """Check if the daemon is running"""
+    """Check if the daemon is running (from the last pushed state)"""
+    return daemon_state["state"] != "stopped"
+
+
+def wait_for_socket(path):
+    """Block until the daemon creates its control socket (inotify, no polling)"""
+    IN_CREATE, IN_MOVED_TO, IN_CLOEXEC = 0x100, 0x80, 0o2000000
     try:
-        result = subprocess.run(
-            ["systemctl", "--user", "is-active", SERVICE_NAME],
-            capture_output=True, text=True
-        )
-        return result.stdout.strip() == "active"
-    except Exception:
-        return False
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(IN_CLOEXEC)
+    except (OSError, AttributeError):
+        fd = -1
+    if fd < 0:
+        # No inotify (not Linux): check back now and then
+        while not os.path.exists(path):
+            time.sleep(2)
+        return
+
+    try:
+        directory = os.path.dirname(path)
+        if libc.inotify_add_watch(fd, directory.encode(), IN_CREATE | IN_MOVED_TO) < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        while not os.path.exists(path):
+            os.read(fd, 4096)  # Something was created: check for the socket again
+    finally:
+        os.close(fd)
+
+
+def subscribe(path):
+    """Connect to the daemon and ask for state pushes; returns a line reader"""
+    for _ in range(20):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(path)
+            sock.sendall(b"subscribe\n")
+            return sock.makefile()
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Socket created but not listening yet
+            sock.close()
+            time.sleep(0.1)
+    return None
+
+
+def set_state(icon, state, detail=""):
+    daemon_state["state"] = state if state in STATES else "idle"
+    daemon_state["detail"] = detail
+    update_icon(icon)
+    icon.update_menu()
+
+
+def watch_daemon(icon):
+    """Follow the daemon's pushed state for as long as the tray runs"""
+    path = control_socket_path()
+    while True:
+        if not os.path.exists(path):
+            wait_for_socket(path)
+        reader = subscribe(path)
+        if reader is None:
+            time.sleep(1)  # Stale socket file, wait for the daemon to replace it
+            continue
+        try:
+            for line in reader:
+                kind, _, rest = line.strip().partition(" ")
+                if kind == "state":
+                    state, _, detail = rest.partition(" ")
+                    set_state(icon, state, detail)
+        except OSError:
+            pass
+        finally:
+            reader.close()
+        set_state(icon, "stopped")
+        # Give a stopping daemon time to remove its socket
+        time.sleep(0.5)
 
 
 def start_daemon(icon, item):
     """Start the daemon"""
     try:
         subprocess.run(["systemctl", "--user", "start", SERVICE_NAME], check=True)
-        update_icon(icon)
         show_notification("Papagaio", "Daemon started")
     except subprocess.CalledProcessError:
         show_notification("Papagaio", "Failed to start daemon", error=True)
@@ -73,7 +164,6 @@ def stop_daemon(icon, item):
     """Stop the daemon"""
     try:
         subprocess.run(["systemctl", "--user", "stop", SERVICE_NAME], check=True)
-        update_icon(icon)
         show_notification("Papagaio", "Daemon stopped")
     except subprocess.CalledProcessError:
         show_notification("Papagaio", "Failed to stop daemon", error=True)
@@ -83,7 +173,6 @@ def restart_daemon(icon, item):
     """Restart the daemon"""
     try:
         subprocess.run(["systemctl", "--user", "restart", SERVICE_NAME], check=True)
-        update_icon(icon)
         show_notification("Papagaio", "Daemon restarted")
     except subprocess.CalledProcessError:
         show_notification("Papagaio", "Failed to restart daemon", error=True)
@@ -134,20 +223,16 @@ def show_notification(title, message, error=False):
 
 
 def update_icon(icon):
-    """Update icon based on daemon status"""
-    if is_daemon_running():
-        icon.icon = create_icon_image("green")
-        icon.title = "Papagaio - Running"
-    else:
-        icon.icon = create_icon_image("gray")
-        icon.title = "Papagaio - Stopped"
+    """Update icon based on daemon state"""
+    color, label = STATES[daemon_state["state"]]
+    icon.icon = create_icon_image(color)
+    detail = f": {daemon_state['detail']}" if daemon_state["detail"] else ""
+    icon.title = f"Papagaio - {label}{detail}"
 
 
 def get_status_text(item):
     """Get current status for menu"""
-    if is_daemon_running():
-        return "Status: Running"
-    return "Status: Stopped"
+    return f"Status: {STATES[daemon_state['state']][1]}"
 
 
 def quit_app(icon, item):
@@ -189,20 +274,17 @@ def create_menu():
 
 def main():
     """Main entry point"""
-    # Determine initial icon color
-    color = "green" if is_daemon_running() else "gray"
-    title = "Papagaio - Running" if is_daemon_running() else "Papagaio - Stopped"
-
     icon = pystray.Icon(
         name="papagaio",
-        icon=create_icon_image(color),
-        title=title,
+        icon=create_icon_image("gray"),
+        title="Papagaio - Stopped",
         menu=create_menu()
     )
 
-    # Update icon periodically
+    # State changes are pushed by the daemon over its control socket
     def setup(icon):
         icon.visible = True
+        threading.Thread(target=watch_daemon, args=(icon,), daemon=True).start()
 
     icon.run(setup)
 
@@ -11,6 +11,16 @@ import threading
 import time
 import platform
 import shutil
+import queue
+import collections
+import itertools
+import json
+import socket
+import struct
+import ctypes
+import functools
+import importlib
+import importlib.util
 
 # Platform detection
 IS_WINDOWS = platform.system() == 'Windows'
@@ -23,33 +33,73 @@ if IS_WINDOWS:
 else:
     import fcntl
 
-try:
-    from faster_whisper import WhisperModel
-    from pynput import keyboard
-    from pynput.keyboard import Controller as KeyboardController, Key, KeyCode
-    import pyaudio
-    import numpy as np
-except ImportError as e:
-    print(f"Missing required dependency: {e.name}")
-    print("Please install dependencies: pip install faster-whisper pynput pyaudio numpy")
-    sys.exit(1)
-
-HAS_EVDEV = False
-try:
-    import evdev
+
+class _LazyModule:
+    """Stand-in for a heavy module, imported on first attribute access.
+
+    Keeps `--version`, `--help`, `stats` and the control clients from paying
+    for faster-whisper, PortAudio or numpy. Once loaded, the module replaces
+    its stand-in in this module's globals.
+    """
+
+    def __init__(self, name, alias):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_alias", alias)
+
+    def _load(self):
+        module = importlib.import_module(self._name)
+        if globals().get(self._alias) is self:
+            globals()[self._alias] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+        delattr(self._load(), attr)
+
+
+for _name in ("faster_whisper", "pynput", "pyaudio", "numpy"):
+    if importlib.util.find_spec(_name) is None:
+        print(f"Missing required dependency: {_name}")
+        print("Please install dependencies: pip install faster-whisper pynput pyaudio numpy")
+        sys.exit(1)
+del _name
+
+keyboard = _LazyModule("pynput.keyboard", "keyboard")
+pyaudio = _LazyModule("pyaudio", "pyaudio")
+np = _LazyModule("numpy", "np")
+
+HAS_EVDEV = importlib.util.find_spec("evdev") is not None
+if HAS_EVDEV:
     import select as _select_mod
-    HAS_EVDEV = True
-except ImportError:
-    pass
+    evdev = _LazyModule("evdev", "evdev")  # Pulls in asyncio
 
-# Optional: GPU acceleration
-HAS_CUDA = False
+HAS_XLIB = False
 try:
-    import torch
-    HAS_CUDA = torch.cuda.is_available()
+    import Xlib.error
+    from Xlib import X, XK
+    from Xlib import display as xlib_display
+    from Xlib.ext import xtest
+    from Xlib.protocol import event as xlib_event
+    HAS_XLIB = True
 except ImportError:
     pass
 
+
+@functools.lru_cache(maxsize=None)
+def _has_cuda():
+    """Whether CTranslate2 can decode on an NVIDIA GPU (asked once, on first use)"""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+
 # Hallucination patterns - common Whisper artifacts to filter out
 _HALLUCINATION_PATTERNS = {
     # English artifacts
@@ -103,28 +153,43 @@ def _is_hallucination(text):
     return False
 
 
-# Optional: cross-platform notifications
-try:
-    from plyer import notification as plyer_notification
-    HAS_PLYER = True
-except ImportError:
-    HAS_PLYER = False
+def _collapse_stutters(text):
+    """Reduce a word repeated 3+ times in a row ("as as as as") to one"""
+    kept = []
+    for _, run in itertools.groupby(text.split(), key=lambda w: w.lower().strip(".,!?")):
+        run = list(run)
+        if len(run) >= 3:
+            # First copy's casing, last copy's punctuation ("Go go go." -> "Go.")
+            last = run[-1]
+            run = [run[0].rstrip(".,!?") + last[len(last.rstrip(".,!?")):]]
+        kept.extend(run)
+    return " ".join(kept)
 
-# Optional: GTK for edit dialog
-HAS_GTK = False
-if IS_LINUX:
-    try:
-        import gi
-        gi.require_version('Gtk', '3.0')
-        from gi.repository import Gtk, GLib
-        HAS_GTK = True
-    except (ImportError, ValueError):
-        pass
+
+def _segment_rejection(segment):
+    """Why Whisper's own scores say a decoded segment is garbage, or None to keep it"""
+    if segment.no_speech_prob > NO_SPEECH_PROB_THRESHOLD and segment.avg_logprob < LOGPROB_THRESHOLD:
+        return f"no speech ({segment.no_speech_prob:.0%})"
+    if segment.compression_ratio > COMPRESSION_RATIO_THRESHOLD:
+        return f"repetitive (compression {segment.compression_ratio:.1f})"
+    if segment.avg_logprob < MIN_SEGMENT_LOGPROB:
+        return f"low confidence (logprob {segment.avg_logprob:.2f})"
+    text = segment.text.strip().lower().rstrip(".!?,")
+    if text in _HALLUCINATION_PATTERNS:
+        return "known hallucination"
+    return None
+
+
+# Optional: cross-platform notifications (imported when first used)
+HAS_PLYER = importlib.util.find_spec("plyer") is not None
+
+# Optional: GTK for edit dialog (imported when the dialog first opens)
+HAS_GTK = IS_LINUX and importlib.util.find_spec("gi") is not None
 
 
 # Audio configuration constants
 CHUNK_SIZE = 1024  # Smaller chunks = faster detection (~64ms at 16kHz)
-AUDIO_FORMAT = pyaudio.paInt16
+AUDIO_FORMAT = 8  # pyaudio.paInt16, without importing PortAudio
 CHANNELS = 1
 SAMPLE_RATE = 16000
 SILENCE_THRESHOLD_RMS = 200  # Lower threshold for better detection
@@ -134,6 +199,36 @@ MIN_VALID_TRANSCRIPTION_LENGTH = 3
 TYPING_DELAY_SECONDS = 0.03  # Minimal delay before typing
 MIN_RECORDING_DURATION_SECONDS = 0.3  # Shorter minimum
 CALIBRATION_DURATION_SECONDS = 0.5  # Time to calibrate ambient noise
+PREROLL_MS = 500  # Audio kept from before the hotkey in warm microphone mode
+NOISE_FLOOR_WINDOW_SECONDS = 5.0  # Idle audio used for background noise tracking
+ENDPOINTING_MODE = "silero"  # "silero" (neural VAD) or "rms" (volume threshold)
+VAD_SPEECH_THRESHOLD = 0.5  # Silero speech probability that counts as speech
+VAD_CONTEXT_SECONDS = 0.5  # Audio re-scored per chunk (the model is stateless between calls)
+SPEECH_REGION_PAD_SECONDS = 0.2  # Audio kept around each capture-time speech region
+BATCHED_MIN_SECONDS = 60  # Recordings at least this long are decoded in batches
+BATCH_SIZE = 8  # Clips decoded together by the batched pipeline
+BATCH_CLIP_SECONDS = 28  # Whisper windows are 30s; leave room for the region pads
+CAPTURE_BLOCK_SECONDS = 30  # Capture buffer grows in blocks of this length
+STREAMING_CUT_SILENCE_SECONDS = 0.6  # Pause that closes a streaming segment
+STREAMING_MIN_SEGMENT_SECONDS = 4.0  # Shorter segments lose too much context
+STREAMING_MAX_SEGMENT_SECONDS = 20.0  # Force a cut on any quiet chunk after this
+NO_SPEECH_PROB_THRESHOLD = 0.6  # Segment is silence if this likely and LOGPROB_THRESHOLD not met
+LOGPROB_THRESHOLD = -1.0  # Whisper's own cutoff for a failed decode
+MIN_SEGMENT_LOGPROB = -1.5  # Segments the model is this unsure about are dropped outright
+COMPRESSION_RATIO_THRESHOLD = 2.4  # Above this a segment is a repetition loop
+SPEECH_OVER_NOISE = 2.5  # RMS speech threshold as a multiple of the calibrated noise level
+MIN_VOICED_SECONDS = 0.25  # Less speech than this in a recording is not worth decoding
+ADAPTIVE_MODELS = ("tiny", "base", "small", "medium")  # Smallest first; the configured model is the largest used
+ESCALATE_AVG_LOGPROB = -0.7  # Mean segment confidence below this re-decodes with a larger model
+TYPE_CHUNK_CHARS = 400  # Longest text handed to one xdotool/ydotool type call
+PASTE_AFTER_SECONDS = 1.0  # Paste instead of typing when typing would take longer
+CLIPBOARD_RESTORE_DELAY_SECONDS = 0.3  # Time the target app gets to read a paste
+PAPAGAIO_CACHE_DIR = os.path.expanduser("~/.cache/papagaio")
+CONFIG_FILE = os.path.expanduser("~/.config/papagaio/config.ini")
+TUNE_COMPUTE_TYPES = ("int8", "int8_float32", "int16", "float32")  # CPU compute types tried by `papagaio tune`
+TUNE_MAX_WORD_ERROR = 0.1  # Word error rate against float32 above which a tuned profile is rejected
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.25, 0.35, 0.5,
+                   0.75, 1, 1.5, 2, 3, 5, 7.5, 10, 15, 30, 60, 120)  # Stage histogram bounds (seconds)
 
 # Multilingual messages
 MESSAGES = {
@@ -184,8 +279,1558 @@ MESSAGES = {
 }
 
 
+class CaptureBuffer:
+    """Block-allocated int16 sample store that audio chunks are copied into directly.
+
+    Blocks are never reallocated or concatenated, so growing is O(1) and the only
+    full pass over the recording is the final float32 conversion.
+    """
+
+    def __init__(self, block_samples=CAPTURE_BLOCK_SECONDS * SAMPLE_RATE):
+        self.block_samples = block_samples
+        self._blocks = []
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def append(self, data):
+        """Copy a chunk (bytes or int16 array) into the buffer and return it as an int16 array"""
+        chunk = np.frombuffer(data, dtype=np.int16)
+        written = 0
+        while written < len(chunk):
+            offset = self.length % self.block_samples
+            if offset == 0 and self.length // self.block_samples == len(self._blocks):
+                self._blocks.append(np.empty(self.block_samples, dtype=np.int16))
+            block = self._blocks[self.length // self.block_samples]
+            n = min(len(chunk) - written, self.block_samples - offset)
+            block[offset:offset + n] = chunk[written:written + n]
+            written += n
+            self.length += n
+        return chunk
+
+    def to_float32(self, start=0, end=None):
+        """Convert samples [start, end) to a new float32 array in [-1, 1) in a single pass"""
+        end = self.length if end is None else min(end, self.length)
+        start = max(0, min(start, end))
+        out = np.empty(end - start, dtype=np.float32)
+        scale = np.float32(1.0 / 32768.0)
+        pos = start
+        while pos < end:
+            index, offset = divmod(pos, self.block_samples)
+            n = min(end - pos, self.block_samples - offset)
+            np.multiply(self._blocks[index][offset:offset + n], scale, out=out[pos - start:pos - start + n])
+            pos += n
+        return out
+
+
+class AudioCapture:
+    """PortAudio callback-mode input stream.
+
+    The callback only hands raw chunks to a SimpleQueue (no locks, no VAD, no
+    printing), so stalls in the consumer cannot make PortAudio drop input.
+    Input overflows reported by PortAudio are counted instead of hidden.
+    """
+
+    def __init__(self, daemon):
+        self.daemon = daemon
+        self.chunks = queue.SimpleQueue()
+        self.overflows = 0
+        self._audio = None
+        self._stream = None
+
+    def open(self):
+        self._audio = pyaudio.PyAudio()
+        try:
+            self._stream = self._audio.open(
+                format=self.daemon.FORMAT,
+                channels=self.daemon.CHANNELS,
+                rate=self.daemon.RATE,
+                input=True,
+                frames_per_buffer=self.daemon.CHUNK,
+                stream_callback=self._callback
+            )
+            self._stream.start_stream()
+        except Exception:
+            self._audio.terminate()
+            self._audio = None
+            raise
+
+    def _callback(self, in_data, frame_count, time_info, status_flags):
+        if status_flags & pyaudio.paInputOverflow:
+            self.overflows += 1
+        self.chunks.put(in_data)
+        return (None, pyaudio.paContinue)
+
+    @property
+    def active(self):
+        try:
+            return self._stream is not None and self._stream.is_active()
+        except Exception:
+            return False
+
+    @property
+    def backlog(self):
+        """Chunks captured but not consumed yet"""
+        return self.chunks.qsize()
+
+    def read(self, timeout=1.0):
+        """Next captured chunk, or None if nothing arrived within timeout"""
+        try:
+            return self.chunks.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        try:
+            if self._stream:
+                self._stream.stop_stream()
+                self._stream.close()
+        except Exception:
+            pass
+        finally:
+            self._stream = None
+            if self._audio:
+                self._audio.terminate()
+                self._audio = None
+
+
+class LevelMeter:
+    """Prints the recording level meter from its own thread.
+
+    Writing to stdout can block (journald back-pressure), so the capture
+    consumer only queues the characters and never waits on the terminal.
+    """
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            text = self._queue.get()
+            if text is None:
+                return
+            # Coalesce whatever piled up while we were blocked
+            parts = [text]
+            while True:
+                try:
+                    text = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if text is None:
+                    sys.stdout.write("".join(parts))
+                    sys.stdout.flush()
+                    return
+                parts.append(text)
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
+
+    def show(self, text):
+        self._queue.put(text)
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join(timeout=1)
+
+
+class ColdMicrophone:
+    """Capture session that opens the input stream on demand and calibrates first"""
+
+    def __init__(self, daemon):
+        self.preroll = []
+        self._capture = AudioCapture(daemon)
+        self._capture.open()
+        daemon._mark("mic_open")
+
+        # Auto-calibrate noise floor
+        print(f"[Papagaio] 🎚️  Calibrating...")
+        try:
+            self.threshold = daemon.calibrate_noise_floor(self._capture, CALIBRATION_DURATION_SECONDS)
+        except Exception:
+            self._capture.close()
+            raise
+        daemon._mark("calibration")
+        print(f"[Papagaio] Threshold: {self.threshold} (auto)")
+        self._overflows_at_start = self._capture.overflows
+
+    @property
+    def overflows(self):
+        return self._capture.overflows - self._overflows_at_start
+
+    @property
+    def backlog(self):
+        return self._capture.backlog
+
+    def read(self):
+        return self._capture.read()
+
+    def close(self):
+        self._capture.close()
+
+
+class WarmMicrophone:
+    """Input stream kept open for the daemon's lifetime.
+
+    While idle, a consumer thread keeps the last PREROLL_MS of audio in a ring
+    buffer and tracks the noise floor, so a session starts instantly with the
+    pre-roll and without a blocking calibration.
+    """
+
+    def __init__(self, daemon, preroll_ms=PREROLL_MS):
+        self.daemon = daemon
+        self._ring = collections.deque(maxlen=max(1, int(preroll_ms / 1000 * daemon.RATE / daemon.CHUNK)))
+        self._levels = collections.deque(maxlen=int(NOISE_FLOOR_WINDOW_SECONDS * daemon.RATE / daemon.CHUNK))
+        self._lock = threading.Lock()
+        self._session = None  # Queue of chunks while a recording is active
+        self._capture = None
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while self._running:
+            try:
+                if self._capture is None:
+                    capture = AudioCapture(self.daemon)
+                    capture.open()
+                    self._capture = capture
+                    print("[Papagaio] Warm microphone open", flush=True)
+            except Exception as e:
+                print(f"[Papagaio] Warm microphone error: {e}", flush=True)
+                time.sleep(2.0)
+                continue
+
+            data = self._capture.read()
+            if data is None:
+                if not self._capture.active:
+                    print("[Papagaio] Warm microphone stream stopped, reopening", flush=True)
+                    self._capture.close()
+                    self._capture = None
+                continue
+
+            with self._lock:
+                session = self._session
+                if session is None:
+                    self._ring.append(data)
+            if session is not None:
+                session.put(data)
+            else:
+                self._levels.append(self.daemon.get_rms(data))
+        if self._capture:
+            self._capture.close()
+
+    @property
+    def healthy(self):
+        return self._capture is not None and self._capture.active
+
+    def noise_threshold(self):
+        """Speech threshold derived from recent idle audio (same scale as calibration)"""
+        levels = list(self._levels)
+        if not levels:
+            return self.daemon.SILENCE_THRESHOLD
+        # Lower quartile ignores speech and bumps that happened while idle
+        noise = float(np.percentile(levels, 25))
+        return max(100, int(noise * SPEECH_OVER_NOISE))
+
+    def open_session(self):
+        """Start a capture session, or return None if the stream is not running"""
+        if not self.healthy:
+            return None
+        with self._lock:
+            session = WarmMicrophone._Session(self, list(self._ring), self.noise_threshold())
+            self._ring.clear()
+            self._session = session.chunks
+        return session
+
+    def _end_session(self, chunks):
+        with self._lock:
+            if self._session is chunks:
+                self._session = None
+
+    def close(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    class _Session:
+        def __init__(self, mic, preroll, threshold):
+            self._mic = mic
+            self._capture = mic._capture
+            self._overflows_at_start = self._capture.overflows
+            self.preroll = preroll
+            self.threshold = threshold
+            self.chunks = queue.SimpleQueue()
+            self._pending = collections.deque(preroll)
+
+        @property
+        def overflows(self):
+            return self._capture.overflows - self._overflows_at_start
+
+        @property
+        def backlog(self):
+            return self._capture.backlog + self.chunks.qsize()
+
+        def read(self):
+            """Next chunk (pre-roll first), or None if the stream stalled"""
+            if self._pending:
+                return self._pending.popleft()
+            try:
+                return self.chunks.get(timeout=1.0)
+            except queue.Empty:
+                return None
+
+        def close(self):
+            self._mic._end_session(self.chunks)
+
+
+class RmsEndpointer:
+    """Speech/silence decision from chunk volume against the calibrated threshold"""
+
+    name = "rms"
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+
+    def is_speech(self, samples, rms):
+        return rms > self.threshold
+
+
+class SileroEndpointer:
+    """Speech/silence decision from the Silero VAD model bundled with faster-whisper.
+
+    Each chunk is scored together with the preceding VAD_CONTEXT_SECONDS of
+    audio, and a hysteresis band keeps short dips from ending speech.
+    """
+
+    name = "silero"
+    WINDOW = 512  # Samples per Silero frame at 16kHz
+
+    def __init__(self, threshold=VAD_SPEECH_THRESHOLD, rate=SAMPLE_RATE):
+        from faster_whisper.vad import get_vad_model
+        self.model = get_vad_model()
+        self.threshold = threshold
+        self.neg_threshold = max(threshold - 0.15, 0.01)
+        context = int(VAD_CONTEXT_SECONDS * rate)
+        self._context = np.zeros(context - context % self.WINDOW, dtype=np.float32)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self.speaking = False
+        self.last_probability = 0.0
+
+    def is_speech(self, samples, rms):
+        audio = np.concatenate((self._pending, samples.astype(np.float32) / 32768.0))
+        usable = len(audio) - len(audio) % self.WINDOW
+        self._pending = audio[usable:]
+        if usable:
+            new = audio[:usable][-len(self._context):]
+            self._context = np.concatenate((self._context[len(new):], new))
+            probs = np.asarray(self.model(self._context)).ravel()
+            self.last_probability = float(probs[-(usable // self.WINDOW):].max())
+
+        if self.last_probability >= self.threshold:
+            self.speaking = True
+        elif self.last_probability < self.neg_threshold:
+            self.speaking = False
+        return self.speaking
+
+
+def _slice_regions(regions, start, end):
+    """Clip (start, end) sample regions to [start, end) and make them relative to start"""
+    if regions is None:
+        return None
+    return [(max(s, start) - start, min(e, end) - start) for s, e in regions if e > start and s < end]
+
+
+def _speech_only(audio, regions, pad=int(SPEECH_REGION_PAD_SECONDS * SAMPLE_RATE)):
+    """Concatenate the padded speech regions of audio, merging regions whose pads overlap"""
+    merged = []
+    for start, end in regions:
+        start, end = max(0, start - pad), min(len(audio), end + pad)
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    if len(merged) == 1 and merged[0] == [0, len(audio)]:
+        return audio
+    return np.concatenate([audio[start:end] for start, end in merged]) if merged else audio[:0]
+
+
+def _batch_clips(regions, total, pad=int(SPEECH_REGION_PAD_SECONDS * SAMPLE_RATE),
+                 max_clip=int(BATCH_CLIP_SECONDS * SAMPLE_RATE)):
+    """Pack speech regions into clips of at most max_clip samples, split only at silence
+
+    Returns clip_timestamps (seconds) for BatchedInferencePipeline. A region
+    longer than a Whisper window is the only thing ever cut mid-speech.
+    """
+    clips = []
+    for start, end in regions:
+        start, end = max(0, start - pad), min(total, end + pad)
+        if clips and end - clips[-1][0] <= max_clip:
+            clips[-1][1] = max(clips[-1][1], end)
+            continue
+        if clips and start < clips[-1][1]:
+            start = clips[-1][1]
+        while end - start > max_clip:
+            clips.append([start, start + max_clip])
+            start += max_clip
+        if end > start:
+            clips.append([start, end])
+    return [{"start": start / SAMPLE_RATE, "end": end / SAMPLE_RATE} for start, end in clips]
+
+
+class Recording:
+    """Captured audio plus the speech regions the endpointer found while recording.
+
+    speech_regions is a list of (start, end) sample offsets, or None when the
+    endpointer is not precise enough to replace Whisper's own VAD pass.
+    voiced_seconds, peak_rms and noise_floor are the capture-time energy
+    statistics used to skip decoding recordings with no real speech.
+    """
+
+    def __init__(self, audio, speech_regions=None, voiced_seconds=None, peak_rms=None, noise_floor=None):
+        self.audio = audio
+        self.speech_regions = speech_regions
+        self.voiced_seconds = voiced_seconds
+        self.peak_rms = peak_rms
+        self.noise_floor = noise_floor
+
+    @property
+    def duration(self):
+        return len(self.audio) / SAMPLE_RATE
+
+
+class StreamingTranscriber:
+    """Decode finished parts of a recording in the background while capture continues.
+
+    record_audio() hands over audio at silence boundaries through submit(); when
+    the recording stops, finish() only has to decode the unprocessed tail.
+    """
+
+    def __init__(self, daemon):
+        self.daemon = daemon
+        self.language = daemon.transcription_language
+        self.consumed = 0  # Samples already handed to the decoder
+        self.texts = []
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                audio, speech_regions = item
+                text, info = self.daemon._decode(audio, language=self.language, speech_regions=speech_regions)
+                # Pin the language detected on the first segment, like the batch
+                # path which detects it once for the whole recording
+                if self.language is None:
+                    self.language = info.language
+                    print(f"[Papagaio] Language: {info.language} ({info.language_probability:.0%} confidence)")
+                if text:
+                    self.texts.append(text)
+            except Exception as e:
+                print(f"[Papagaio] Streaming decode failed: {e}", flush=True)
+            finally:
+                self._queue.task_done()
+
+    def submit(self, audio, speech_regions=None):
+        """Queue a finished segment (float32 samples following the last one)"""
+        self.consumed += len(audio)
+        if speech_regions != []:
+            self._queue.put((audio, speech_regions))
+
+    def finish(self, recording):
+        """Decode the remaining tail of the recording and return the full text"""
+        tail = recording.audio[self.consumed:]
+        if len(tail) >= int(MIN_RECORDING_DURATION_SECONDS * SAMPLE_RATE):
+            regions = _slice_regions(recording.speech_regions, self.consumed, len(recording.audio))
+            if regions != []:
+                self._queue.put((tail, regions))
+        self._queue.join()
+        self._queue.put(None)
+
+        text = " ".join(self.texts).strip()
+        if _is_hallucination(text):
+            print(f"[Papagaio] ⚠ Filtered hallucination: {text[:50]}")
+            return ""
+        return text
+
+    def cancel(self):
+        """Drop pending segments and stop the background decoder"""
+        try:
+            while True:
+                self._queue.get_nowait()
+                self._queue.task_done()
+        except queue.Empty:
+            pass
+        self._queue.put(None)
+
+
+def _transcription_worker_main(conn, model_kwargs):
+    """Entry point of the out-of-process transcription worker.
+
+    Protocol (over conn): the daemon sends ("transcribe", shm_name, samples,
+    options, batch_size); the worker answers ("info", dict), one ("segment",
+    dict) per decoded segment and finally ("done",), or ("error", message).
+    """
+    from multiprocessing import shared_memory
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        from faster_whisper import WhisperModel
+        model = WhisperModel(**model_kwargs)
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready",))
+    pipeline = None
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] != "transcribe":
+            continue
+        _, shm_name, samples, options, batch_size = message
+
+        shm = shared_memory.SharedMemory(name=shm_name)
+        audio = None
+        try:
+            audio = np.ndarray((samples,), dtype=np.float32, buffer=shm.buf)
+            if batch_size:
+                if pipeline is None:
+                    from faster_whisper import BatchedInferencePipeline
+                    pipeline = BatchedInferencePipeline(model=model)
+                segments, info = pipeline.transcribe(audio, batch_size=batch_size, **options)
+            else:
+                segments, info = model.transcribe(audio, **options)
+            conn.send(("info", {"language": info.language,
+                                "language_probability": info.language_probability,
+                                "duration": info.duration}))
+            for segment in segments:
+                conn.send(("segment", {"text": segment.text, "start": segment.start, "end": segment.end,
+                                       "avg_logprob": segment.avg_logprob,
+                                       "no_speech_prob": segment.no_speech_prob,
+                                       "compression_ratio": segment.compression_ratio}))
+            conn.send(("done",))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+        finally:
+            del audio
+            shm.close()
+
+
+class WorkerWhisperModel:
+    """WhisperModel hosted in a dedicated worker process.
+
+    Offers the same transcribe() call as WhisperModel. Audio is handed over
+    through multiprocessing.shared_memory instead of being pickled, and
+    segments stream back over a pipe. A watcher thread restarts the worker
+    when it dies, so a crash in the model never takes the daemon down.
+    """
+
+    RESTART_DELAY_SECONDS = 2.0
+
+    def __init__(self, model_kwargs):
+        import multiprocessing
+        self.model_kwargs = model_kwargs
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._closing = False
+        self._ready = threading.Event()
+        self._spawn()
+        threading.Thread(target=self._watch, daemon=True).start()
+
+    def _spawn(self):
+        self._ready.clear()
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_transcription_worker_main,
+            args=(child_conn, self.model_kwargs),
+            name="papagaio-transcriber",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        try:
+            message = parent_conn.recv() if parent_conn.poll(600) else ("error", "worker did not start")
+        except (EOFError, OSError):
+            message = ("error", f"worker exited with code {process.exitcode}")
+        if message[0] != "ready":
+            process.kill()
+            raise RuntimeError(f"Transcription worker failed: {message[-1]}")
+        self._process, self._conn = process, parent_conn
+        self._ready.set()
+        print(f"[Papagaio] Transcription worker ready (PID {process.pid})", flush=True)
+
+    def _watch(self):
+        from multiprocessing.connection import wait
+        while not self._closing:
+            process = self._process
+            wait([process.sentinel])
+            if self._closing:
+                return
+            process.join(timeout=1)
+            print(f"[Papagaio] ✗ Transcription worker exited (code {process.exitcode}), restarting...", flush=True)
+            self._ready.clear()
+            while not self._closing:
+                try:
+                    with self._lock:
+                        self._spawn()
+                    break
+                except Exception as e:
+                    print(f"[Papagaio] Worker restart failed: {e}", flush=True)
+                    time.sleep(self.RESTART_DELAY_SECONDS)
+
+    def transcribe(self, audio, batch_size=None, **options):
+        """Same contract as WhisperModel.transcribe(): returns (segments, info)"""
+        from multiprocessing import shared_memory
+        import types
+
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        if not self._ready.wait(timeout=600):
+            raise RuntimeError("Transcription worker is not available")
+        self._lock.acquire()
+        shm = None
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+            np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+            self._conn.send(("transcribe", shm.name, len(audio), options, batch_size))
+            message = self._receive()
+            if message[0] != "info":
+                raise RuntimeError(f"Transcription worker error: {message[-1]}")
+            info = types.SimpleNamespace(**message[1])
+        except BaseException:
+            self._release(shm)
+            raise
+
+        def segments():
+            finished = False
+            try:
+                while True:
+                    message = self._receive()
+                    if message[0] == "segment":
+                        yield types.SimpleNamespace(**message[1])
+                    else:
+                        finished = True
+                        if message[0] == "done":
+                            return
+                        raise RuntimeError(f"Transcription worker error: {message[-1]}")
+            finally:
+                try:
+                    # Closed early: read the rest, so the next decode starts on a clean pipe
+                    while not finished and self._receive()[0] == "segment":
+                        pass
+                except RuntimeError:
+                    pass  # The worker died; the watcher restarts it
+                finally:
+                    self._release(shm)
+
+        return segments(), info
+
+    def _receive(self):
+        try:
+            return self._conn.recv()
+        except (EOFError, OSError):
+            raise RuntimeError("Transcription worker died while decoding")
+
+    def _release(self, shm):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+        self._lock.release()
+
+    def close(self):
+        self._closing = True
+        if self._process and self._process.is_alive():
+            self._conn.close()
+            self._process.join(timeout=2)
+            if self._process.is_alive():
+                self._process.kill()
+
+
+def _text_chunks(text, size=TYPE_CHUNK_CHARS):
+    """Split text into pieces of at most size characters, at spaces where possible"""
+    start = 0
+    while start < len(text):
+        end = start + size
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            if space > start:
+                end = space + 1
+        yield text[start:end]
+        start = end
+
+
+class OutputThroughput:
+    """Measured speed of each text output backend on this machine.
+
+    Keeps the last few (characters, seconds) samples per backend and fits
+    seconds = overhead + characters / rate. Until a backend has enough varied
+    samples, a conservative prior is used. Samples persist across restarts.
+    """
+
+    # backend -> (overhead seconds, seconds per character)
+    PRIORS = {
+        "xtest": (0.005, 0.0005),
+        "uinput": (0.005, 0.0006),
+        "xdotool": (0.05, 0.006),
+        "ydotool": (0.1, 0.03),
+        "pynput": (0.05, 0.004),
+        "clipboard_paste": (0.15, 0.0),
+        "clipboard": (0.05, 0.0),
+    }
+    DEFAULT_PRIOR = (0.1, 0.01)  # For keys missing from PRIORS
+
+    def __init__(self, path, max_samples=20):
+        self.path = path
+        self.max_samples = max_samples
+        self.samples = {}
+        try:
+            with open(path) as f:
+                self.samples = {k: [tuple(x) for x in v][-max_samples:] for k, v in json.load(f).items()}
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def record(self, backend, chars, seconds):
+        samples = self.samples.setdefault(backend, [])
+        samples.append((chars, round(seconds, 4)))
+        del samples[:-self.max_samples]
+        self._save()
+
+    def forget(self, backend):
+        """Drop the samples of backend, e.g. after its settings changed"""
+        if self.samples.pop(backend, None) is not None:
+            self._save()
+
+    def _save(self):
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.samples, f)
+        except OSError:
+            pass
+
+    def estimate(self, backend, chars):
+        """Predicted seconds to output chars characters with backend"""
+        overhead, per_char = self.PRIORS.get(backend, self.DEFAULT_PRIOR)
+        samples = self.samples.get(backend, [])
+        if len(samples) >= 3 and len({c for c, _ in samples}) > 1:
+            # Least-squares line through the samples
+            n = len(samples)
+            mean_c = sum(c for c, _ in samples) / n
+            mean_s = sum(t for _, t in samples) / n
+            var = sum((c - mean_c) ** 2 for c, _ in samples)
+            per_char = max(0.0, sum((c - mean_c) * (t - mean_s) for c, t in samples) / var)
+            overhead = max(0.0, mean_s - per_char * mean_c)
+        return overhead + per_char * chars
+
+
+class DecodeSpeed(OutputThroughput):
+    """Measured decode time of each Whisper model on this machine.
+
+    Samples are (audio seconds, decode seconds on an idle CPU), fitted the
+    same way as output backends. Priors are for int8 on a recent CPU.
+    """
+
+    # model -> (overhead seconds, seconds per second of audio)
+    PRIORS = {
+        "tiny": (0.1, 0.04),
+        "base": (0.15, 0.08),
+        "small": (0.3, 0.25),
+        "medium": (0.6, 0.7),
+        "distil-large-v3": (0.8, 0.6),
+        "turbo": (0.8, 0.5),
+        "large-v3": (1.0, 1.5),
+    }
+    DEFAULT_PRIOR = PRIORS["large-v3"]  # Unknown models (large-v2, custom paths...) assumed slow
+
+    def estimate(self, model, audio_seconds):
+        samples = self.samples.get(model, [])
+        if samples and (len(samples) < 3 or len({a for a, _ in samples}) == 1):
+            # Too few lengths for a line: scale the prior to the measured speed
+            overhead, per_second = self.PRIORS.get(model, self.DEFAULT_PRIOR)
+            measured = sum(t for _, t in samples) / sum(overhead + per_second * a for a, _ in samples)
+            return (overhead + per_second * audio_seconds) * measured
+        return super().estimate(model, audio_seconds)
+
+
+def _cpu_count():
+    """CPUs this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class CpuProfiles:
+    """Fastest CPU settings per Whisper model, found by `papagaio tune`.
+
+    A profile is kept only for the CPU count it was measured on, so copying
+    the cache to another machine falls back to the defaults.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.profiles = {}
+        try:
+            with open(path) as f:
+                self.profiles = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def get(self, model):
+        profile = self.profiles.get(model)
+        if isinstance(profile, dict) and profile.get("cpus") == _cpu_count():
+            return profile
+        return None
+
+    def save(self, model, profile):
+        self.profiles[model] = dict(profile, cpus=_cpu_count(), tuned=int(time.time()))
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(self.profiles, f, indent=2)
+
+
+def _sha256(path):
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ModelStore:
+    """Whisper models downloaded into the cache dir, indexed in a manifest.
+
+    The manifest records each model's snapshot path, revision and the size,
+    modification time and SHA-256 of its files. Only pull() talks to the
+    Hugging Face hub; models in the manifest are loaded from their local path.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.path = os.path.join(root, "papagaio-models.json")
+        self.models = {}
+        try:
+            with open(self.path) as f:
+                self.models = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def entry(self, name):
+        return self.models.get(name)
+
+    def pull(self, name, local_only=False):
+        """Download name, or with local_only find it in the cache, and index its files"""
+        from faster_whisper.utils import download_model
+        path = download_model(name, cache_dir=self.root, local_files_only=local_only)
+        files = {}
+        for filename in sorted(os.listdir(path)):
+            full = os.path.join(path, filename)
+            if os.path.isfile(full):
+                files[filename] = {"size": os.path.getsize(full), "mtime": os.stat(full).st_mtime_ns,
+                                   "sha256": _sha256(full)}
+        self.models[name] = {"path": path, "revision": os.path.basename(path), "files": files,
+                             "pulled": int(time.time())}
+        self._save()
+        return path
+
+    def check(self, name):
+        """None if name can be loaded, else the problem
+
+        Quick while files are untouched: sizes are compared, and only a file
+        whose modification time changed since it was indexed is hashed again.
+        """
+        entry = self.models.get(name)
+        if entry is None:
+            return "not in the local store"
+        changed = False
+        for filename, meta in entry["files"].items():
+            full = os.path.join(entry["path"], filename)
+            if not os.path.isfile(full):
+                return f"{filename} is missing"
+            if os.path.getsize(full) != meta["size"]:
+                return f"{filename} is {os.path.getsize(full)} bytes, expected {meta['size']}"
+            mtime = os.stat(full).st_mtime_ns
+            if meta.get("mtime") != mtime:  # Rewritten in place, or indexed by an older version
+                if _sha256(full) != meta["sha256"]:
+                    return f"{filename} does not match its checksum"
+                meta["mtime"] = mtime
+                changed = True
+        if changed:
+            self._save()
+        return None
+
+    def verify(self, name):
+        """Problems found by checking every file against its checksum"""
+        problem = self.check(name)
+        if problem:
+            return [problem]
+        entry = self.models[name]
+        return [f"{filename} does not match its checksum" for filename, meta in entry["files"].items()
+                if _sha256(os.path.join(entry["path"], filename)) != meta["sha256"]]
+
+    def remove(self, name):
+        """Forget name and delete its files unless another entry shares them"""
+        entry = self.models.pop(name)
+        self._save()
+        repo = os.path.dirname(os.path.dirname(entry["path"]))  # models--org--name/snapshots/<revision>
+        shared = any(other["path"].startswith(repo + os.sep) for other in self.models.values())
+        if os.path.basename(repo).startswith("models--") and not shared:
+            shutil.rmtree(repo, ignore_errors=True)
+
+    def _save(self):
+        os.makedirs(self.root, exist_ok=True)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w") as f:
+            json.dump(self.models, f, indent=2)
+        os.replace(temporary, self.path)
+
+
+def _word_error_rate(reference, hypothesis):
+    """Word-level edit distance over the reference length, ignoring case and punctuation"""
+    def words(text):
+        return [w.strip(".,!?;:\"'()").lower() for w in text.split()]
+    ref, hyp = words(reference), words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        current = [i]
+        for j, h in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (r != h)))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def _adaptive_ladder(model_size):
+    """Model sizes a latency budget chooses from, smallest first, up to model_size"""
+    if model_size not in ADAPTIVE_MODELS:
+        return list(ADAPTIVE_MODELS) + [model_size]
+    return list(ADAPTIVE_MODELS[:ADAPTIVE_MODELS.index(model_size) + 1])
+
+
+def _xkb_layout():
+    """The session's first XKB layout, as "us" or "us(intl)", or None if it cannot be told"""
+    layout, variant = os.environ.get("XKB_DEFAULT_LAYOUT", ""), os.environ.get("XKB_DEFAULT_VARIANT", "")
+    if not layout:
+        try:
+            status = subprocess.run(["localectl", "status"], capture_output=True, text=True, timeout=2).stdout
+        except (OSError, subprocess.SubprocessError):
+            status = ""
+        fields = dict(line.strip().split(":", 1) for line in status.splitlines() if ":" in line)
+        layout, variant = fields.get("X11 Layout", ""), fields.get("X11 Variant", "")
+    layout, variant = layout.split(",")[0].strip(), variant.split(",")[0].strip()
+    if not layout:
+        return None
+    return f"{layout}({variant})" if variant else layout
+
+
+def _cpu_contention():
+    """How much slower than on an idle machine a CPU decode should run now (>= 1)"""
+    if _has_cuda():
+        return 1.0
+    try:
+        return max(1.0, os.getloadavg()[0] / _cpu_count())
+    except (OSError, AttributeError):
+        return 1.0
+
+
+class X11Session:
+    """X connections, kept for the daemon's lifetime, for focus and key injection.
+
+    Does in-process what the daemon used to spawn xdotool for: read and set
+    the active window (EWMH _NET_ACTIVE_WINDOW), and press keys or type text
+    through the XTEST extension. Characters missing from the keyboard map are
+    typed by briefly binding them to a spare keycode, as xdotool does. Window
+    queries use a second connection, so a new dictation can look up its
+    target while earlier text is still being typed.
+    """
+
+    MODIFIERS = ("Control_L", "Control_R", "Shift_L", "Shift_R", "Alt_L", "Alt_R", "Super_L", "Super_R")
+    KEY_NAMES = {"ctrl": "Control_L", "shift": "Shift_L", "alt": "Alt_L", "super": "Super_L"}
+    SYNC_EVERY_CHARS = 32  # Round-trip to the server this often while typing
+
+    def __init__(self):
+        self.display = xlib_display.Display()
+        if not self.display.has_extension("XTEST"):
+            self.display.close()
+            raise RuntimeError("X server has no XTEST extension")
+        self._net_active_window = self.display.intern_atom("_NET_ACTIVE_WINDOW")
+        self._lock = threading.Lock()  # Key injection on self.display
+        self._window_display = xlib_display.Display()
+        self._window_root = self._window_display.screen().root
+        self._window_lock = threading.Lock()
+        self._scratch_keycode = self._find_spare_keycode()
+        self.typed = 0  # Characters of the last type() the server has confirmed
+
+    def _find_spare_keycode(self):
+        info = self.display.display.info
+        first, count = info.min_keycode, info.max_keycode - info.min_keycode + 1
+        for offset, keysyms in enumerate(self.display.get_keyboard_mapping(first, count)):
+            if not any(keysyms):
+                return first + offset
+        return None
+
+    def active_window(self):
+        with self._window_lock:
+            prop = self._window_root.get_full_property(self._net_active_window, X.AnyPropertyType)
+        if prop is None or not len(prop.value) or not prop.value[0]:
+            return None
+        return int(prop.value[0])
+
+    def activate(self, window_id):
+        """Ask the window manager to focus window_id (like xdotool windowactivate)"""
+        with self._window_lock:
+            window = self._window_display.create_resource_object("window", window_id)
+            message = xlib_event.ClientMessage(
+                window=window, client_type=self._net_active_window,
+                data=(32, [2, X.CurrentTime, 0, 0, 0])  # 2 = request from a pager/tool
+            )
+            self._window_root.send_event(message, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask)
+            self._window_display.sync()
+
+    def _refresh_keymap(self):
+        """Apply pending MappingNotify events to Xlib's keysym cache (caller holds the lock)
+
+        The server sends one whenever the keyboard map changes: a layout
+        switch, or our own spare-keycode bindings. Without this, lookups keep
+        the old map and type the wrong characters.
+        """
+        while self.display.pending_events():
+            event = self.display.next_event()
+            if event.type == X.MappingNotify and event.request == X.MappingKeyboard:
+                self.display.refresh_keyboard_mapping(event)
+
+    def release_modifiers(self):
+        with self._lock:
+            self._refresh_keymap()
+            for name in self.MODIFIERS:
+                keycode = self.display.keysym_to_keycode(XK.string_to_keysym(name))
+                if keycode:
+                    xtest.fake_input(self.display, X.KeyRelease, keycode)
+            self.display.sync()
+
+    def key(self, combo, repeat=1):
+        """Press and release a combo such as "ctrl+v" or "Return", repeat times"""
+        with self._lock:
+            self._refresh_keymap()
+            keycodes = []
+            for name in combo.split("+"):
+                keysym = XK.string_to_keysym(self.KEY_NAMES.get(name.lower(), name))
+                keycode = self.display.keysym_to_keycode(keysym)
+                if not keycode:
+                    raise ValueError(f"No key for {name!r}")
+                keycodes.append(keycode)
+            for _ in range(repeat):
+                for keycode in keycodes:
+                    xtest.fake_input(self.display, X.KeyPress, keycode)
+                for keycode in reversed(keycodes):
+                    xtest.fake_input(self.display, X.KeyRelease, keycode)
+            self.display.sync()
+
+    @staticmethod
+    def _char_keysym(char):
+        if char == "\n":
+            return XK.string_to_keysym("Return")
+        if char == "\t":
+            return XK.string_to_keysym("Tab")
+        code = ord(char)
+        # Latin-1 keysyms equal their code points; the rest use the Unicode range
+        return code if 0x20 <= code <= 0x7e or 0xa0 <= code <= 0xff else 0x01000000 | code
+
+    def type(self, text):
+        """Type text; after a failure, self.typed tells how much got through"""
+        with self._lock:
+            self.typed = 0
+            self._refresh_keymap()
+            shift = self.display.keysym_to_keycode(XK.string_to_keysym("Shift_L"))
+            remapped = False
+            try:
+                for index, char in enumerate(text):
+                    keysym = self._char_keysym(char)
+                    keycode = self.display.keysym_to_keycode(keysym)
+                    shifted = False
+                    if keycode:
+                        if self.display.keycode_to_keysym(keycode, 0) != keysym:
+                            shifted = self.display.keycode_to_keysym(keycode, 1) == keysym
+                            if not shifted:
+                                keycode = 0  # Needs AltGr or similar: use the spare key
+                    scratch = not keycode
+                    if scratch:
+                        if self._scratch_keycode is None:
+                            self.display.sync()
+                            self.typed = index
+                            raise RuntimeError(f"Cannot type {char!r}: no spare keycode")
+                        keycode = self._scratch_keycode
+                        self.display.change_keyboard_mapping(keycode, [(keysym, keysym)])
+                        self.display.sync()
+                        remapped = True
+
+                    if shifted:
+                        xtest.fake_input(self.display, X.KeyPress, shift)
+                    xtest.fake_input(self.display, X.KeyPress, keycode)
+                    xtest.fake_input(self.display, X.KeyRelease, keycode)
+                    if shifted:
+                        xtest.fake_input(self.display, X.KeyRelease, shift)
+                    if scratch:
+                        # Let the client read the key before the spare keycode is rebound
+                        self.display.sync()
+                        time.sleep(0.01)
+                        self.typed = index + 1
+                    elif (index + 1) % self.SYNC_EVERY_CHARS == 0:
+                        self.display.sync()
+                        self.typed = index + 1
+                self.display.sync()
+                self.typed = len(text)
+            finally:
+                if remapped:
+                    self.display.change_keyboard_mapping(self._scratch_keycode, [(0, 0)])
+                    self.display.sync()
+
+    def close(self):
+        with self._window_lock:
+            self._window_display.close()
+        with self._lock:
+            self.display.close()
+
+
+class UInputKeyboard:
+    """Virtual keyboard on /dev/uinput, created once, for typing on Wayland.
+
+    Key codes go through the compositor's keymap, so characters map to keys
+    as on a US layout (as with ydotool). can_type() tells whether text can be
+    typed that way: on another layout, or with characters the map lacks, the
+    daemon pastes instead. Events are packed into one write() per batch of
+    characters, each key followed by its own SYN_REPORT.
+    """
+
+    BATCH_CHARS = 16  # Characters per write()
+    BATCH_DELAY_SECONDS = 0.004  # Lets the compositor keep up between batches
+    EVENT = "llHHi"  # struct input_event (timestamps are filled in by the kernel)
+
+    def __init__(self):
+        e = evdev.ecodes
+        self.layout = _xkb_layout()  # None: unknown, assumed US
+        self._keymap = self._build_keymap()
+        self.typed = 0  # Characters of the last type() written to the device
+        self._names = {"ctrl": e.KEY_LEFTCTRL, "shift": e.KEY_LEFTSHIFT, "alt": e.KEY_LEFTALT,
+                       "super": e.KEY_LEFTMETA, "return": e.KEY_ENTER, "enter": e.KEY_ENTER,
+                       "backspace": e.KEY_BACKSPACE}
+        keys = {code for code, _ in self._keymap.values()} | set(self._names.values())
+        self.device = evdev.UInput({e.EV_KEY: sorted(keys)}, name="papagaio-keyboard")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_keymap():
+        """char -> (key code, needs shift) for a US layout"""
+        e = evdev.ecodes.ecodes
+        keymap = {}
+        for char in "abcdefghijklmnopqrstuvwxyz":
+            keymap[char] = (e[f"KEY_{char.upper()}"], False)
+            keymap[char.upper()] = (e[f"KEY_{char.upper()}"], True)
+        for digit, shifted in zip("1234567890", "!@#$%^&*()"):
+            keymap[digit] = (e[f"KEY_{digit}"], False)
+            keymap[shifted] = (e[f"KEY_{digit}"], True)
+        for plain, shifted, name in (("-", "_", "MINUS"), ("=", "+", "EQUAL"), ("[", "{", "LEFTBRACE"),
+                                     ("]", "}", "RIGHTBRACE"), ("\\", "|", "BACKSLASH"), (";", ":", "SEMICOLON"),
+                                     ("'", '"', "APOSTROPHE"), ("`", "~", "GRAVE"), (",", "<", "COMMA"),
+                                     (".", ">", "DOT"), ("/", "?", "SLASH")):
+            keymap[plain] = (e[f"KEY_{name}"], False)
+            keymap[shifted] = (e[f"KEY_{name}"], True)
+        keymap[" "] = (e["KEY_SPACE"], False)
+        keymap["\n"] = (e["KEY_ENTER"], False)
+        keymap["\t"] = (e["KEY_TAB"], False)
+        return keymap
+
+    def _tap(self, events, code, modifiers=()):
+        e = evdev.ecodes
+        for modifier in modifiers:
+            events += [(e.EV_KEY, modifier, 1), (e.EV_SYN, e.SYN_REPORT, 0)]
+        events += [(e.EV_KEY, code, 1), (e.EV_SYN, e.SYN_REPORT, 0),
+                   (e.EV_KEY, code, 0), (e.EV_SYN, e.SYN_REPORT, 0)]
+        for modifier in reversed(modifiers):
+            events += [(e.EV_KEY, modifier, 0), (e.EV_SYN, e.SYN_REPORT, 0)]
+
+    def _write(self, events):
+        os.write(self.device.fd, b"".join(struct.pack(self.EVENT, 0, 0, *event) for event in events))
+
+    def key(self, combo, repeat=1):
+        """Press and release a combo such as "ctrl+v" or "Return", repeat times"""
+        codes = []
+        for name in combo.lower().split("+"):
+            code = self._names.get(name) or self._keymap.get(name, (None,))[0]
+            if code is None:
+                raise ValueError(f"No key for {name!r}")
+            codes.append(code)
+        events = []
+        for _ in range(repeat):
+            self._tap(events, codes[-1], codes[:-1])
+        with self._lock:
+            self._write(events)
+
+    def can_type(self, text):
+        """Whether every character of text comes out as itself on the session's layout"""
+        return self.layout in (None, "us") and all(char in self._keymap for char in text)
+
+    def type(self, text):
+        self.typed = 0
+        missing = next((char for char in text if char not in self._keymap), None)
+        if missing is not None:
+            raise ValueError(f"No key for {missing!r}")
+        shift = (evdev.ecodes.KEY_LEFTSHIFT,)
+        with self._lock:
+            events = []
+            for index, char in enumerate(text):
+                code, shifted = self._keymap[char]
+                self._tap(events, code, shift if shifted else ())
+                if (index + 1) % self.BATCH_CHARS == 0:
+                    self._write(events)
+                    self.typed = index + 1
+                    events = []
+                    time.sleep(self.BATCH_DELAY_SECONDS)
+            if events:
+                self._write(events)
+            self.typed = len(text)
+
+    def close(self):
+        with self._lock:
+            self.device.close()
+
+
+class SessionTimer:
+    """Monotonic timestamps at the stage boundaries of one dictation.
+
+    Each mark() closes a stage: its duration is the time since the previous
+    mark (or since the hotkey was received). Repeated stages add up.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.speech_end = None
+        self.first_output = None
+        self.delivered = None
+        self.stages = {}
+        self._last = self.started
+
+    def mark(self, stage, at=None):
+        now = time.monotonic() if at is None else at
+        self.stages[stage] = self.stages.get(stage, 0.0) + max(0.0, now - self._last)
+        self._last = now
+
+
+class DictationSession:
+    """One dictation on its way through the capture -> decode -> output pipeline"""
+
+    def __init__(self, number):
+        self.number = number
+        self.timer = SessionTimer()
+        self.target_window = None  # Window focused when the hotkey was pressed
+        self.recording = None
+        self.streamer = None
+        self.incremental = False
+        self.draft_model = None  # Set when a fast draft is typed before the final text
+        self.texts = queue.Queue()  # Decoded text for the output stage, then None
+        self.error = None
+
+
+def _histogram_quantile(counts, buckets, q):
+    """Estimate quantile q from bucket counts (last count is the +Inf bucket)"""
+    total = sum(counts)
+    if not total:
+        return None
+    rank = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if seen + count >= rank and count:
+            if index == len(buckets):
+                return buckets[-1]  # Beyond the last bound, like Prometheus
+            lower = buckets[index - 1] if index else 0.0
+            return lower + (buckets[index] - lower) * (rank - seen) / count
+        seen += count
+    return buckets[-1]
+
+
+class LatencyStats:
+    """In-memory per-stage latency histograms for the daemon's lifetime.
+
+    After every session a JSON snapshot is written for `papagaio stats`, and
+    optionally a Prometheus text file (for node_exporter's textfile collector).
+    """
+
+    def __init__(self, stats_file, metrics_file=None, buckets=LATENCY_BUCKETS):
+        self.stats_file = stats_file
+        self.metrics_file = metrics_file
+        self.buckets = buckets
+        self.sessions = 0
+        self.started = time.time()
+        self.stages = {}  # stage -> {"counts": [...], "sum": seconds}
+        self.queues = {}  # pipeline queue -> {"depth": sessions waiting, "peak": most seen}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        hist = self.stages.setdefault(stage, {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0})
+        index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+        hist["counts"][index] += 1
+        hist["sum"] += seconds
+
+    def queue_depth(self, name, depth):
+        with self._lock:
+            stats = self.queues.setdefault(name, {"depth": 0, "peak": 0})
+            stats["depth"] = depth
+            stats["peak"] = max(stats["peak"], depth)
+
+    def record(self, timer):
+        """Add a finished session and refresh the exported files"""
+        with self._lock:
+            self.sessions += 1
+            for stage, seconds in timer.stages.items():
+                self.observe(stage, seconds)
+            if timer.delivered is not None:
+                self.observe("total", timer.delivered - timer.started)
+                if timer.speech_end is not None and timer.first_output is not None:
+                    self.observe("first_output", timer.first_output - timer.speech_end - timer.stages.get("edit", 0.0))
+                if timer.speech_end is not None:
+                    # End of speech to text delivered, minus time spent in the edit dialog
+                    response = timer.delivered - timer.speech_end - timer.stages.get("edit", 0.0)
+                    self.observe("response", response)
+            snapshot = self.snapshot()
+            metrics = self.prometheus() if self.metrics_file else None
+
+        try:
+            self._write(self.stats_file, json.dumps(snapshot))
+            if metrics is not None:
+                self._write(self.metrics_file, metrics)
+        except OSError as e:
+            print(f"[Papagaio] Could not write latency stats: {e}", flush=True)
+
+    def snapshot(self):
+        return {
+            "pid": os.getpid(),
+            "started": self.started,
+            "updated": time.time(),
+            "sessions": self.sessions,
+            "buckets": list(self.buckets),
+            "stages": {stage: {"counts": list(h["counts"]), "sum": h["sum"]} for stage, h in self.stages.items()},
+            "queues": {name: dict(stats) for name, stats in self.queues.items()},
+        }
+
+    def prometheus(self):
+        lines = [
+            "# HELP papagaio_sessions_total Dictation sessions since the daemon started",
+            "# TYPE papagaio_sessions_total counter",
+            f"papagaio_sessions_total {self.sessions}",
+            "# HELP papagaio_stage_seconds Time spent in each dictation stage",
+            "# TYPE papagaio_stage_seconds histogram",
+        ]
+        for stage, hist in self.stages.items():
+            cumulative = 0
+            for bound, count in zip(list(self.buckets) + ["+Inf"], hist["counts"]):
+                cumulative += count
+                lines.append(f'papagaio_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'papagaio_stage_seconds_sum{{stage="{stage}"}} {hist["sum"]:.6f}')
+            lines.append(f'papagaio_stage_seconds_count{{stage="{stage}"}} {cumulative}')
+        if self.queues:
+            lines += ["# HELP papagaio_queue_depth Sessions waiting in a pipeline queue",
+                      "# TYPE papagaio_queue_depth gauge"]
+            lines += [f'papagaio_queue_depth{{queue="{name}"}} {q["depth"]}' for name, q in self.queues.items()]
+            lines += ["# HELP papagaio_queue_peak_depth Most sessions seen waiting in a pipeline queue",
+                      "# TYPE papagaio_queue_peak_depth gauge"]
+            lines += [f'papagaio_queue_peak_depth{{queue="{name}"}} {q["peak"]}' for name, q in self.queues.items()]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write(path, content):
+        # Atomic replace, so readers never see a half-written file
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+
+def show_stats(stats_file):
+    """Print p50/p95 per stage from the daemon's latest stats snapshot"""
+    try:
+        with open(stats_file) as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        print("No latency statistics yet (start the daemon and dictate something)")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Could not read {stats_file}: {e}")
+        return 1
+
+    buckets = snapshot["buckets"]
+    started = time.strftime("%Y-%m-%d %H:%M", time.localtime(snapshot["started"]))
+    print(f"Sessions: {snapshot['sessions']} since {started} (PID {snapshot['pid']})")
+    print(f"{'stage':<22} {'count':>6} {'p50':>9} {'p95':>9} {'mean':>9}")
+    for stage, hist in snapshot["stages"].items():
+        count = sum(hist["counts"])
+        p50 = _histogram_quantile(hist["counts"], buckets, 0.5)
+        p95 = _histogram_quantile(hist["counts"], buckets, 0.95)
+        print(f"{stage:<22} {count:>6} {p50 * 1000:>7.0f}ms {p95 * 1000:>7.0f}ms {hist['sum'] / count * 1000:>7.0f}ms")
+    queues = snapshot.get("queues")
+    if queues:
+        print("Queues: " + ", ".join(f"{name} {q['depth']} waiting (peak {q['peak']})" for name, q in queues.items()))
+    return 0
+
+
+class Inotify:
+    """Minimal inotify(7) wrapper over libc, for blocking on file changes.
+
+    fileno() can be registered with select/epoll; read() returns
+    (watch descriptor, mask, name) tuples. Raises OSError where inotify is
+    not available.
+    """
+
+    IN_MODIFY = 0x2
+    IN_ATTRIB = 0x4
+    IN_CLOSE_WRITE = 0x8
+    IN_MOVED_TO = 0x80
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_CLOEXEC = 0o2000000
+    EVENT = struct.Struct("iIII")  # wd, mask, cookie, len, then the name
+
+    def __init__(self):
+        try:
+            self._libc = ctypes.CDLL(None, use_errno=True)
+            self.fd = self._libc.inotify_init1(self.IN_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            raise OSError(f"inotify unavailable: {e}")
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def fileno(self):
+        return self.fd
+
+    def add_watch(self, path, mask):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch {path} failed")
+        return wd
+
+    def read(self):
+        data = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+def control_socket_path():
+    """Per-user path of the daemon's control socket"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "papagaio.sock")
+    return os.path.join(tempfile.gettempdir(), f"papagaio-{os.getuid()}.sock")
+
+
+class ControlServer:
+    """Unix socket accepting one-line commands (toggle, stop, cancel, status).
+
+    Every command gets a one-line reply: "ok <detail>" or "error <detail>".
+    Used by papagaio-send, which xbindkeys and desktop shortcuts call.
+
+    "subscribe" keeps the connection open and pushes a "state <name> [detail]"
+    line on every state change, starting with the current one (for the tray).
+    """
+
+    def __init__(self, daemon, path):
+        self.daemon = daemon
+        self.path = path
+        self._sock = None
+        self._thread = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        # A socket left behind by a crashed daemon; the PID lock already
+        # guarantees no other instance is running
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.path)
+        os.chmod(self.path, 0o600)
+        self._sock.listen(8)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return  # Socket closed
+            try:
+                conn.settimeout(2)
+                command = conn.makefile().readline().strip()
+                if command == "subscribe":
+                    self._subscribe(conn)
+                    continue
+                conn.sendall(f"{self.daemon.handle_command(command)}\n".encode())
+            except OSError:
+                pass
+            except Exception as e:
+                print(f"[Papagaio] Control command failed: {e}", flush=True)
+            conn.close()
+
+    def _subscribe(self, conn):
+        with self._lock:
+            conn.sendall(f"ok subscribed\n{self._state_line()}".encode())
+            self._subscribers.append(conn)
+
+    def _state_line(self):
+        detail = self.daemon.state_detail
+        return f"state {self.daemon.state} {detail}\n" if detail else f"state {self.daemon.state}\n"
+
+    def publish(self):
+        """Push the daemon's current state to every subscriber"""
+        with self._lock:
+            line = self._state_line().encode()
+            for conn in list(self._subscribers):
+                try:
+                    conn.sendall(line)
+                except OSError:
+                    self._subscribers.remove(conn)
+                    conn.close()
+
+    def close(self):
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+            with self._lock:
+                for conn in self._subscribers:
+                    conn.close()
+                self._subscribers = []
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
 class VoiceDaemon:
-    def __init__(self, model_size="small", hotkey="<ctrl>+<shift>+<alt>+v", secondary_hotkey="", auto_enter=False, use_ydotool=False, model_cache_dir=None, lang="en", silence_threshold=None, silence_duration=None, transcription_language="auto", edit_before_send=False):
+    def __init__(self, model_size="small", hotkey="<ctrl>+<shift>+<alt>+v", secondary_hotkey="", auto_enter=False, use_ydotool=False, model_cache_dir=None, lang="en", silence_threshold=None, silence_duration=None, transcription_language="auto", edit_before_send=False, streaming=False, warm_microphone=False, preroll_ms=PREROLL_MS, endpointing=ENDPOINTING_MODE, vad_threshold=VAD_SPEECH_THRESHOLD, batched_decoding=True, batch_size=BATCH_SIZE, worker_process=False, metrics_file=None, paste_long_text=True, incremental_output=False, latency_budget=0, draft_model=None):
         self.model_size = model_size
         self.hotkey = hotkey
         self.secondary_hotkey = secondary_hotkey
@@ -195,6 +1840,25 @@ class VoiceDaemon:
         self.lang = lang if lang in MESSAGES else "en"
         self.transcription_language = transcription_language if transcription_language != "auto" else None
         self.edit_before_send = edit_before_send
+        self.streaming = streaming
+        self.warm_microphone = warm_microphone
+        self.preroll_ms = preroll_ms
+        self.warm_mic = None
+        self.endpointing = self._endpointing_mode(endpointing)
+        self.vad_threshold = vad_threshold
+        self.batched_decoding = batched_decoding
+        self.batch_size = batch_size
+        self._batched = None
+        self.worker_process = worker_process
+        self.paste_long_text = paste_long_text
+        self.incremental_output = incremental_output
+        self.latency_budget = latency_budget  # Seconds per decode; 0 keeps model_size for everything
+        self.draft_model = draft_model or None  # Fast model typed first, corrected by model_size
+        self._unavailable_models = set()  # Smaller ladder models missing from the store
+        self.extra_models = {}  # Other sizes, loaded on first use
+        self.decode_speed = DecodeSpeed(os.path.join(PAPAGAIO_CACHE_DIR, "decode-speed.json"))
+        self.cpu_profiles = CpuProfiles(os.path.join(PAPAGAIO_CACHE_DIR, "cpu-profiles.json"))
+        self.session_stats = {}  # Capture statistics of the last recording
         self.model = None
         self.is_recording = False
         self.stop_recording_flag = False  # For manual stop (hotkey pressed again)
@@ -202,10 +1866,28 @@ class VoiceDaemon:
         self.recording_thread = None
         self.esc_listener = None
         self.pid_file = os.path.join(tempfile.gettempdir(), "papagaio.pid")
-        self._hotkey_cooldown = 0
+        self.stats_file = os.path.join(tempfile.gettempdir(), "papagaio-stats.json")
+        self.control = None
+        self.state = "idle"  # idle, recording, transcribing, typing or error
+        self.state_detail = ""
+        self.latency = LatencyStats(self.stats_file, metrics_file or None)
+        self._hotkey_cooldown = 0  # When the hotkey last fired; debounces presses, not output
         self._stop_listener = False
-        self._target_window_id = None
         self._typing_in_progress = False
+        self._typed_chars = 0  # Characters a failed output backend got out before failing
+        self._clipboard_lock = threading.Lock()  # Serializes pastes and clipboard restores
+        self._clipboard_restore = None  # Pending Timer that puts the user's clipboard back
+        self._local = threading.local()  # The DictationSession a pipeline thread is working on
+        self._session_count = 0
+        self._decode_queue = queue.Queue()
+        self._output_queue = queue.Queue()
+        self._pipeline_threads = []
+        self._pipeline_lock = threading.Lock()
+        self._in_flight = 0  # Sessions queued for decoding and not yet delivered
+        self.config = None  # load_config() result the running settings came from
+        self._reload_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._warm_mic_stale = False  # Warm microphone settings changed during a recording
 
         # Cache tool availability (avoids repeated PATH lookups)
         self._has_xdotool = bool(shutil.which("xdotool"))
@@ -213,6 +1895,10 @@ class VoiceDaemon:
         self._has_wl_copy = bool(shutil.which("wl-copy"))
         self._has_ydotool = bool(shutil.which("ydotool"))
         self._has_notify_send = bool(shutil.which("notify-send"))
+        self._has_wl_paste = bool(shutil.which("wl-paste"))
+        self.x11 = None  # X11Session, opened in start()
+        self.uinput = None  # UInputKeyboard, opened in start() on Wayland
+        self.throughput = OutputThroughput(os.path.join(PAPAGAIO_CACHE_DIR, "output-throughput.json"))
 
         # Audio settings for VAD
         self.CHUNK = CHUNK_SIZE
@@ -224,12 +1910,12 @@ class VoiceDaemon:
         self.MAX_RECORDING_TIME = MAX_RECORDING_DURATION_SECONDS
 
     _EVDEV_KEY_MAP = {
-        '<ctrl>': {evdev.ecodes.KEY_LEFTCTRL, evdev.ecodes.KEY_RIGHTCTRL} if HAS_EVDEV else set(),
-        '<shift>': {evdev.ecodes.KEY_LEFTSHIFT, evdev.ecodes.KEY_RIGHTSHIFT} if HAS_EVDEV else set(),
-        '<alt>': {evdev.ecodes.KEY_LEFTALT, evdev.ecodes.KEY_RIGHTALT} if HAS_EVDEV else set(),
-        '<super>': {evdev.ecodes.KEY_LEFTMETA, evdev.ecodes.KEY_RIGHTMETA} if HAS_EVDEV else set(),
-        '<cmd>': {evdev.ecodes.KEY_LEFTMETA, evdev.ecodes.KEY_RIGHTMETA} if HAS_EVDEV else set(),
-        '<esc>': {evdev.ecodes.KEY_ESC} if HAS_EVDEV else set(),
+        '<ctrl>': ('KEY_LEFTCTRL', 'KEY_RIGHTCTRL'),
+        '<shift>': ('KEY_LEFTSHIFT', 'KEY_RIGHTSHIFT'),
+        '<alt>': ('KEY_LEFTALT', 'KEY_RIGHTALT'),
+        '<super>': ('KEY_LEFTMETA', 'KEY_RIGHTMETA'),
+        '<cmd>': ('KEY_LEFTMETA', 'KEY_RIGHTMETA'),
+        '<esc>': ('KEY_ESC',),
     }
 
     _EVDEV_CHAR_MAP = {
@@ -247,7 +1933,7 @@ class VoiceDaemon:
         for part in hotkey_str.lower().split('+'):
             part = part.strip()
             if part in self._EVDEV_KEY_MAP:
-                modifier_groups.append(self._EVDEV_KEY_MAP[part])
+                modifier_groups.append({getattr(evdev.ecodes, name) for name in self._EVDEV_KEY_MAP[part]})
             elif part.strip('<>') in self._EVDEV_CHAR_MAP:
                 char = part.strip('<>')
                 trigger_key = getattr(evdev.ecodes, self._EVDEV_CHAR_MAP[char])
@@ -258,49 +1944,111 @@ class VoiceDaemon:
     def _get_evdev_keyboards(self):
         devices = []
         for path in evdev.list_devices():
-            try:
-                dev = evdev.InputDevice(path)
-                caps = dev.capabilities()
-                if evdev.ecodes.EV_KEY in caps:
-                    key_caps = caps[evdev.ecodes.EV_KEY]
-                    if evdev.ecodes.KEY_A in key_caps or evdev.ecodes.KEY_ENTER in key_caps:
-                        devices.append(dev)
-            except PermissionError:
-                continue
+            dev = self._open_evdev_keyboard(path)
+            if dev is not None:
+                devices.append(dev)
         return devices
 
+    def _open_evdev_keyboard(self, path):
+        """Open an input device if it is a keyboard we can read, else None"""
+        try:
+            dev = evdev.InputDevice(path)
+        except OSError:
+            return None  # No permission (yet) or already gone
+        try:
+            key_caps = dev.capabilities().get(evdev.ecodes.EV_KEY, [])
+            is_keyboard = evdev.ecodes.KEY_A in key_caps or evdev.ecodes.KEY_ENTER in key_caps
+        except OSError:
+            is_keyboard = False
+        if not is_keyboard or dev.name == "papagaio-keyboard":
+            dev.close()
+            return None
+        return dev
+
     def _evdev_listener_loop(self):
-        keyboards = self._get_evdev_keyboards()
+        """Read hotkeys straight from the keyboards; blocks until the daemon stops.
+
+        One epoll set holds every keyboard plus an inotify watch on
+        /dev/input, so keyboards plugged in later are picked up and ones
+        that go away are dropped, without any timeout wakeups.
+        """
+        keyboards = {dev.fd: dev for dev in self._get_evdev_keyboards()}
         if not keyboards:
             return False
 
-        kb_names = [k.name for k in keyboards]
-        print(f"[Papagaio] evdev keyboards: {kb_names}", flush=True)
-
-        modifier_groups, trigger_key = self._parse_hotkey_evdev(self.hotkey)
+        print(f"[Papagaio] evdev keyboards: {[k.name for k in keyboards.values()]}", flush=True)
+        hotkey = self.hotkey
+        modifier_groups, trigger_key = self._parse_hotkey_evdev(hotkey)
         print(f"[Papagaio] evdev hotkey: modifiers={modifier_groups} trigger={trigger_key}", flush=True)
-        pressed = set()
-        heartbeat = 0
-        while not self._stop_listener:
-            heartbeat += 1
-            if heartbeat <= 3:
-                print(f"[Papagaio] evdev loop tick {heartbeat}", flush=True)
-            r, _, _ = _select_mod.select(keyboards, [], [], 0.5)
-            for dev in r:
-                try:
-                    for event in dev.read():
+
+        epoll = _select_mod.epoll()
+        for fd in keyboards:
+            epoll.register(fd, _select_mod.EPOLLIN)
+        try:
+            # udev chmods new nodes after creating them, so IN_ATTRIB is when they become readable
+            inotify = Inotify()
+            inotify.add_watch("/dev/input", Inotify.IN_CREATE | Inotify.IN_ATTRIB | Inotify.IN_DELETE)
+            epoll.register(inotify.fileno(), _select_mod.EPOLLIN)
+        except OSError as e:
+            print(f"[Papagaio] Keyboard hotplug unavailable: {e}", flush=True)
+            inotify = None
+
+        def add(path):
+            if any(dev.path == path for dev in keyboards.values()):
+                return
+            dev = self._open_evdev_keyboard(path)
+            if dev is not None:
+                keyboards[dev.fd] = dev
+                epoll.register(dev.fd, _select_mod.EPOLLIN)
+                print(f"[Papagaio] evdev keyboard added: {dev.name}", flush=True)
+
+        def drop(fd):
+            dev = keyboards.pop(fd)
+            pressed.pop(fd, None)
+            epoll.unregister(fd)
+            try:
+                dev.close()
+            except OSError:
+                pass
+            print(f"[Papagaio] evdev keyboard removed: {dev.name}", flush=True)
+
+        pressed = {}  # fd -> key codes held on that keyboard
+        try:
+            while not self._stop_listener:
+                for fd, mask in epoll.poll():
+                    if inotify is not None and fd == inotify.fileno():
+                        for _, event_mask, name in inotify.read():
+                            if not name.startswith("event"):
+                                continue
+                            path = os.path.join("/dev/input", name)
+                            if event_mask & Inotify.IN_DELETE:
+                                gone = [k for k, dev in keyboards.items() if dev.path == path]
+                                for k in gone:
+                                    drop(k)
+                            else:
+                                add(path)
+                        continue
+                    if fd not in keyboards:
+                        continue
+                    try:
+                        events = keyboards[fd].read()
+                    except BlockingIOError:
+                        continue
+                    except OSError:
+                        drop(fd)  # Unplugged
+                        continue
+                    if self.hotkey != hotkey:  # Changed by a config reload
+                        hotkey = self.hotkey
+                        modifier_groups, trigger_key = self._parse_hotkey_evdev(hotkey)
+                    held = pressed.setdefault(fd, set())
+                    for event in events:
                         if event.type != evdev.ecodes.EV_KEY:
                             continue
                         if event.value == 1:  # key down
-                            pressed.add(event.code)
-                            if event.code in (29, 97, 42, 54, 56, 100, trigger_key):
-                                key_name = evdev.ecodes.KEY.get(event.code, event.code)
-                                print(f"[Papagaio] MOD key={key_name} pressed={pressed}", flush=True)
+                            held.add(event.code)
                             if event.code == trigger_key:
-                                modifiers_held = all(
-                                    any(k in pressed for k in group)
-                                    for group in modifier_groups
-                                )
+                                down = set().union(*pressed.values())
+                                modifiers_held = all(any(k in down for k in group) for group in modifier_groups)
                                 now = time.monotonic()
                                 if modifiers_held and now - self._hotkey_cooldown > 2.0:
                                     self._hotkey_cooldown = now
@@ -308,9 +2056,13 @@ class VoiceDaemon:
                             if event.code == evdev.ecodes.KEY_ESC and self.is_recording:
                                 self.cancel_recording_flag = True
                         elif event.value == 0:  # key up
-                            pressed.discard(event.code)
-                except OSError:
-                    pass
+                            held.discard(event.code)
+        finally:
+            epoll.close()
+            if inotify is not None:
+                inotify.close()
+            for dev in keyboards.values():
+                dev.close()
         return True
 
     # X11 keysym values for modifier keys
@@ -354,6 +2106,8 @@ class VoiceDaemon:
 
     def _release_modifiers(self):
         """Release all modifier keys to prevent stuck keys after hotkey activation"""
+        if self._x11_call("release_modifiers")[0]:
+            return
         if IS_LINUX and self._has_xdotool:
             try:
                 subprocess.run(
@@ -388,6 +2142,39 @@ class VoiceDaemon:
         pid = os.getpid()
         rc_path = os.path.join(tempfile.gettempdir(), f"papagaio_{pid}.xbindkeysrc")
 
+        # Prefer the control socket client; fall back to signalling the daemon
+        client = self._send_client()
+        action = f"{client} toggle" if client and self.control else f"kill -USR1 {pid}"
+
+        signal.signal(signal.SIGUSR1, self._on_hotkey_signal)
+
+        proc = None
+        try:
+            while True:
+                hotkeys = (self.hotkey, self.secondary_hotkey)
+                proc = self._spawn_xbindkeys(rc_path, action)
+                # Respawn with a new rc file when a config reload changes the hotkeys
+                while proc.poll() is None and (self.hotkey, self.secondary_hotkey) == hotkeys:
+                    time.sleep(0.5)
+                if proc.poll() is not None:
+                    break
+                proc.terminate()
+                proc.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGUSR1, signal.SIG_DFL)
+            if proc is not None:
+                proc.terminate()
+                proc.wait()
+            try:
+                os.unlink(rc_path)
+            except OSError:
+                pass
+        return True
+
+    def _spawn_xbindkeys(self, rc_path, action):
+        """Write the rc file for the current hotkeys and start xbindkeys on it"""
         combos = []
         xbk_primary = self._resolve_xbindkeys_combo(self.hotkey)
         combos.append(xbk_primary)
@@ -399,7 +2186,7 @@ class VoiceDaemon:
 
         with open(rc_path, "w") as f:
             for combo in combos:
-                f.write(f'"kill -USR1 {pid}"\n')
+                f.write(f'"{action}"\n')
                 f.write(f"  {combo}\n\n")
 
         self._xbindkeys_proc = proc = subprocess.Popen(
@@ -407,56 +2194,93 @@ class VoiceDaemon:
             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
 
-        signal.signal(signal.SIGUSR1, self._on_hotkey_signal)
-
         combo_str = " + ".join(combos) if len(combos) > 1 else combos[0]
         print(f"[Papagaio] xbindkeys listener started (combos={combo_str})", flush=True)
+        return proc
 
-        try:
-            while proc.poll() is None:
-                time.sleep(0.5)
-        except KeyboardInterrupt:
-            pass
-        finally:
-            signal.signal(signal.SIGUSR1, signal.SIG_DFL)
-            proc.terminate()
-            proc.wait()
-            try:
-                os.unlink(rc_path)
-            except OSError:
-                pass
-        return True
+    @staticmethod
+    def _send_client():
+        """Shell command that runs papagaio-send, or None if it is not installed"""
+        client = shutil.which("papagaio-send")
+        if client:
+            return client
+        client = os.path.join(os.path.dirname(os.path.abspath(__file__)), "papagaio-send")
+        if os.path.isfile(client):
+            return f'{sys.executable} {client}'
+        return None
 
     def _on_hotkey_signal(self, signum, frame):
         """Handle SIGUSR1 from xbindkeys"""
-        if self._typing_in_progress:
-            return
+        self._toggle("xbindkeys")
+
+    def _toggle(self, source):
+        """Start or stop recording for an external trigger; returns the reply
+
+        A new recording may start while the previous text is still typed:
+        sessions are delivered in order.
+        """
         if self.is_recording:
             self.stop_recording_flag = True
-            return
+            return "ok stopping"
 
         now = time.monotonic()
-        if now - self._hotkey_cooldown > 2.0:
-            self._hotkey_cooldown = now
-            print("[Papagaio] Hotkey detected via xbindkeys", flush=True)
-            threading.Thread(target=self._hotkey_thread, daemon=True).start()
+        if now - self._hotkey_cooldown <= 2.0:
+            return "error ignored (cooldown)"
+        self._hotkey_cooldown = now
+        print(f"[Papagaio] Hotkey detected via {source}", flush=True)
+        threading.Thread(target=self._hotkey_thread, daemon=True).start()
+        return "ok recording"
+
+    def handle_command(self, command):
+        """Run a control socket command and return its one-line reply"""
+        if command == "toggle":
+            return self._toggle("control socket")
+        if command in ("stop", "cancel"):
+            if not self.is_recording:
+                return "error busy typing" if self._typing_in_progress else "error not recording"
+            if command == "stop":
+                self.stop_recording_flag = True
+                return "ok stopping"
+            self.cancel_recording_flag = True
+            return "ok cancelling"
+        if command == "reload":
+            try:
+                return f"ok {self.reload_config()}"
+            except Exception as e:
+                return f"error reload failed: {e}"
+        if command == "status":
+            queued = f"({self._in_flight} queued)" if self._in_flight else ""
+            return " ".join(part for part in ("ok", self.state, self.state_detail, queued) if part)
+        return f"error unknown command: {command}"
+
+    def _set_state(self, state, detail=""):
+        """Record the daemon state and push it to control socket subscribers"""
+        if self.is_recording and state in ("transcribing", "typing"):
+            return  # Earlier dictations still in the pipeline; recording is what matters
+        self.state = state
+        self.state_detail = " ".join(detail.split())  # Keep it on one line
+        if self.control:
+            self.control.publish()
 
     def _hotkey_thread(self):
         """Run hotkey activation in a separate thread (signal handlers must be fast)"""
         try:
-            time.sleep(0.02)
-            self._release_modifiers()
             self.on_activate()
+            # Release the hotkey's modifiers only after recording has started
+            self._release_modifiers()
         except Exception as e:
             print(f"[Papagaio] Hotkey thread error: {e}", flush=True)
             import traceback
             traceback.print_exc()
 
     def _pynput_listener_loop(self):
-        modifier_keysym_sets, trigger_char = self._parse_hotkey_pynput(self.hotkey)
+        parsed = {"hotkey": self.hotkey, "combo": self._parse_hotkey_pynput(self.hotkey)}
         pressed_keysyms = set()
 
         def on_press(key):
+            if parsed["hotkey"] != self.hotkey:  # Changed by a config reload
+                parsed.update(hotkey=self.hotkey, combo=self._parse_hotkey_pynput(self.hotkey))
+            modifier_keysym_sets, trigger_char = parsed["combo"]
             keysym = self._key_to_keysym(key)
             if keysym is not None:
                 pressed_keysyms.add(keysym)
@@ -496,37 +2320,135 @@ class VoiceDaemon:
         """Get translated message"""
         return MESSAGES[self.lang].get(key, MESSAGES["en"].get(key, key))
 
+    @property
+    def _session_timer(self):
+        session = getattr(self._local, "session", None)
+        return session.timer if session is not None else None
+
+    @property
+    def _target_window_id(self):
+        session = getattr(self._local, "session", None)
+        return session.target_window if session is not None else None
+
+    def _mark(self, stage, at=None):
+        """Close a latency stage of the current session (no-op outside one)"""
+        timer = self._session_timer
+        if timer is not None:
+            timer.mark(stage, at)
+
+    @staticmethod
+    def _endpointing_mode(value):
+        if value in ("silero", "rms"):
+            return value
+        print(f"[Papagaio] ⚠ Unknown endpointing {value!r} (expected silero or rms), using {ENDPOINTING_MODE}",
+              flush=True)
+        return ENDPOINTING_MODE
+
     def initialize_model(self):
+        """Load the Whisper model if needed and return it"""
+        with self._model_lock:
+            self._load_model()
+            return self.model
+
+    def _load_model(self):
         if self.model is None:
-            import multiprocessing
+            self.model = self._create_model(self.model_size)
+
+    def model_for(self, size):
+        """The model of the given size, loaded on first use into the shared cache dir"""
+        if size is None or size == self.model_size:
+            return self.initialize_model()
+        with self._model_lock:
+            if size not in self.extra_models:
+                self.extra_models[size] = self._create_model(size)
+            return self.extra_models[size]
+
+    def _model_path(self, size):
+        """Local directory to load model size from
+
+        Models in the store load without touching the network. One that was
+        downloaded before the store existed is indexed from the cache; one
+        that is not on disk at all is pulled.
+        """
+        if os.path.isdir(size):
+            return size
+        store = ModelStore(self.model_cache_dir)
+        if store.entry(size) is None:
+            try:
+                store.pull(size, local_only=True)
+            except (OSError, ValueError):
+                print(f"[Papagaio] Model {size} is not downloaded yet, pulling it...", flush=True)
+                store.pull(size)
+        problem = store.check(size)
+        if problem:
+            raise RuntimeError(f"Model {size}: {problem} (repair with 'papagaio models pull {size}')")
+        return store.entry(size)["path"]
+
+    def _check_models(self):
+        """Report missing or damaged models before the listener starts; False if the main one is"""
+        ladder = _adaptive_ladder(self.model_size)[:-1] if self.latency_budget else []
+        for size in dict.fromkeys(filter(None, [self.model_size, self.draft_model] + ladder)):
+            try:
+                self._model_path(size)
+            except Exception as e:
+                print(f"[Papagaio] ✗ {e}", flush=True)
+                if size == self.model_size:
+                    return False
+                if size == self.draft_model:
+                    print("[Papagaio] Draft model disabled", flush=True)
+                    self.draft_model = None
+                if size in ladder:
+                    print(f"[Papagaio] Latency budget will not use {size}", flush=True)
+                    self._unavailable_models.add(size)
+        return True
+
+    def _create_model(self, size):
+        import multiprocessing
+
+        path = self._model_path(size)
 
-            os.makedirs(self.model_cache_dir, exist_ok=True)
+        # Use optimal worker count (CPU cores - 1, max 8)
+        optimal_workers = min(max(multiprocessing.cpu_count() - 1, 1), 8)
+        cpu_threads = 0  # CTranslate2's default
 
-            # Auto-detect optimal device and compute type
-            if HAS_CUDA:
-                device = "cuda"
-                compute_type = "float16"  # GPU: use float16 for speed
-                print(f"[Papagaio] 🚀 Using GPU (CUDA) for transcription")
+        # Auto-detect optimal device and compute type
+        if _has_cuda():
+            device = "cuda"
+            compute_type = "float16"  # GPU: use float16 for speed
+            print(f"[Papagaio] 🚀 Using GPU (CUDA) for transcription")
+        else:
+            device = "cpu"
+            compute_type = "int8"  # CPU: use int8 quantization
+            profile = self.cpu_profiles.get(size)
+            if profile:
+                # Decodes run one at a time, so one worker with the tuned thread count
+                compute_type = profile["compute_type"]
+                cpu_threads = profile["cpu_threads"]
+                optimal_workers = 1
+                print(f"[Papagaio] Using CPU for transcription (tuned profile)")
             else:
-                device = "cpu"
-                compute_type = "int8"  # CPU: use int8 quantization
-                print(f"[Papagaio] Using CPU for transcription")
-
-            # Use optimal worker count (CPU cores - 1, max 8)
-            optimal_workers = min(max(multiprocessing.cpu_count() - 1, 1), 8)
-
-            print(f"[Papagaio] Loading Whisper {self.model_size} model...")
-            print(f"[Papagaio] Device: {device}, Compute: {compute_type}, Workers: {optimal_workers}")
-            print(f"[Papagaio] Cache dir: {self.model_cache_dir}")
-
-            self.model = WhisperModel(
-                self.model_size,
-                device=device,
-                compute_type=compute_type,
-                num_workers=optimal_workers,
-                download_root=self.model_cache_dir
-            )
-            print(f"[Papagaio] ✓ Model loaded!")
+                print(f"[Papagaio] Using CPU for transcription (run 'papagaio tune' to optimize)")
+
+        print(f"[Papagaio] Loading Whisper {size} model...")
+        threads = f", Threads: {cpu_threads}" if cpu_threads else ""
+        print(f"[Papagaio] Device: {device}, Compute: {compute_type}, Workers: {optimal_workers}{threads}")
+        print(f"[Papagaio] Model path: {path}")
+
+        model_kwargs = dict(
+            model_size_or_path=path,
+            device=device,
+            compute_type=compute_type,
+            num_workers=optimal_workers,
+            cpu_threads=cpu_threads
+        )
+        if self.worker_process:
+            print(f"[Papagaio] Starting transcription worker process...")
+            model = WorkerWhisperModel(model_kwargs)
+        else:
+            from faster_whisper import WhisperModel
+            model = WhisperModel(**model_kwargs)
+        print(f"[Papagaio] ✓ Model loaded!")
+        return model
 
     def get_rms(self, data):
         """Calculate RMS (volume) of audio chunk - optimized with NumPy"""
@@ -535,119 +2457,309 @@ class VoiceDaemon:
         # Vectorized RMS calculation (5-10x faster than Python loop)
         return np.sqrt(np.mean(audio_data.astype(np.float32) ** 2))
 
-    def calibrate_noise_floor(self, stream, duration=0.5):
+    def calibrate_noise_floor(self, capture, duration=0.5):
         """Measure ambient noise level for adaptive threshold"""
         samples = int(duration * self.RATE / self.CHUNK)
         rms_values = []
 
         for _ in range(samples):
-            data = stream.read(self.CHUNK, exception_on_overflow=False)
+            data = capture.read()
+            if data is None:
+                break
             rms_values.append(self.get_rms(data))
 
         if rms_values:
             avg_noise = sum(rms_values) / len(rms_values)
-            return max(100, int(avg_noise * 2.5))
+            return max(100, int(avg_noise * SPEECH_OVER_NOISE))
         return self.SILENCE_THRESHOLD
 
-    def record_audio(self):
-        """Record audio until silence is detected"""
-        audio = pyaudio.PyAudio()
+    def create_endpointer(self, threshold):
+        """Build the speech/silence detector for a recording"""
+        if self.endpointing == "silero":
+            try:
+                return SileroEndpointer(self.vad_threshold)
+            except Exception as e:
+                print(f"[Papagaio] Silero endpointing unavailable ({e}), using RMS", flush=True)
+                self.endpointing = "rms"
+        return RmsEndpointer(threshold)
+
+    def record_audio(self, on_segment=None):
+        """Record audio until silence is detected
+
+        Returns a Recording, or None if nothing was said. If on_segment is given,
+        it is called with each finished segment (float32 samples and its speech
+        regions) at silence boundaries so decoding can start during recording.
+        """
+        mic = self.warm_mic.open_session() if self.warm_mic else None
+        if mic is not None:
+            self._mark("mic_open")
+            print(f"[Papagaio] Threshold: {mic.threshold} (tracked), pre-roll: {len(mic.preroll) * self.CHUNK / self.RATE:.2f}s")
+        else:
+            mic = ColdMicrophone(self)
 
         try:
-            stream = audio.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.RATE,
-                input=True,
-                frames_per_buffer=self.CHUNK
-            )
-
-            # Auto-calibrate noise floor
-            print(f"[Papagaio] 🎚️  Calibrating...")
-            adaptive_threshold = self.calibrate_noise_floor(stream)
-            print(f"[Papagaio] Threshold: {adaptive_threshold} (auto)")
+            adaptive_threshold = mic.threshold
 
             print(f"[Papagaio] {self.msg('speak_now')}")
             print(f"[Papagaio] {self.msg('press_hotkey_manual')}")
             self.show_notification("Papagaio", self.msg("speak_now") + "\n" + self.msg("press_again_to_stop").format(hotkey=self.hotkey), "low")
 
-            frames = []
+            buffer = CaptureBuffer()
+            chunk_count = 0
             silence_chunks = 0
             max_silence_chunks = int(self.SILENCE_DURATION * self.RATE / self.CHUNK)
             started_speaking = False
             min_recording_chunks = int(MIN_RECORDING_DURATION_SECONDS * self.RATE / self.CHUNK)
             speech_threshold = adaptive_threshold  # Use calibrated threshold
-
+            endpointer = self.create_endpointer(speech_threshold)
+            regions = []  # Speech regions as [start, end] sample offsets
+            in_speech = False
+            last_speech_at = None
+
+            # Streaming boundaries (chunk indexes into buffer)
+            segment_start = 0
+            cut_silence_chunks = int(STREAMING_CUT_SILENCE_SECONDS * self.RATE / self.CHUNK)
+            min_segment_chunks = int(STREAMING_MIN_SEGMENT_SECONDS * self.RATE / self.CHUNK)
+            max_segment_chunks = int(STREAMING_MAX_SEGMENT_SECONDS * self.RATE / self.CHUNK)
+
+            meter = LevelMeter()
+            max_backlog = 0
+            voiced_chunks = 0
+            peak_rms = 0
+            stop_reason = None  # Printed once the meter has stopped
             try:
                 while True:
                     # Check for manual stop or cancel flags
                     if self.cancel_recording_flag:
-                        print(f"\n[Papagaio] {self.msg('cancelled')}")
+                        stop_reason = self.msg("cancelled")
                         self.show_notification("Papagaio", self.msg("cancelled"), "normal")
                         return None
 
                     if self.stop_recording_flag:
-                        print(f"\n[Papagaio] {self.msg('manually_stopped')}")
+                        stop_reason = self.msg("manually_stopped")
                         break
 
-                    data = stream.read(self.CHUNK, exception_on_overflow=False)
-                    frames.append(data)
-
-                    rms = self.get_rms(data)
-
-                    if rms > speech_threshold:
+                    data = mic.read()
+                    if data is None:
+                        continue
+                    samples = buffer.append(data)
+                    chunk_count += 1
+                    max_backlog = max(max_backlog, mic.backlog)
+
+                    rms = self.get_rms(samples)
+
+                    if endpointer.is_speech(samples, rms):
+                        if not in_speech:
+                            regions.append([len(buffer) - len(samples), len(buffer)])
+                            in_speech = True
+                        regions[-1][1] = len(buffer)
+                        last_speech_at = time.monotonic()
+                        voiced_chunks += 1
+                        peak_rms = max(peak_rms, rms)
                         started_speaking = True
                         silence_chunks = 0
                         # Visual feedback: show audio level
-                        level = min(10, int(rms / speech_threshold * 3))
-                        print("█" * level, end="", flush=True)
+                        level = max(1, min(10, int(rms / speech_threshold * 3)))
+                        meter.show("█" * level)
                     else:
+                        in_speech = False
                         if started_speaking:
                             silence_chunks += 1
-                            print("·", end="", flush=True)
+                            meter.show("·")
+
+                    if on_segment is not None and started_speaking and silence_chunks > 0:
+                        segment_chunks = chunk_count - segment_start
+                        # Cut in the middle of a pause, or on any quiet chunk once
+                        # the segment gets long, so the tail left at stop stays short
+                        if (silence_chunks == cut_silence_chunks and segment_chunks >= min_segment_chunks) \
+                                or segment_chunks >= max_segment_chunks:
+                            cut = chunk_count - min(silence_chunks, cut_silence_chunks) // 2
+                            start, end = segment_start * self.CHUNK, cut * self.CHUNK
+                            segment_regions = _slice_regions(regions, start, end) if endpointer.name == "silero" else None
+                            on_segment(buffer.to_float32(start, end), segment_regions)
+                            segment_start = cut
 
                     if started_speaking and silence_chunks > max_silence_chunks:
-                        if len(frames) > min_recording_chunks:
-                            print(f"\n[Papagaio] {self.msg('silence_detected')} {self.SILENCE_DURATION}s")
+                        if chunk_count > min_recording_chunks:
+                            stop_reason = f"{self.msg('silence_detected')} {self.SILENCE_DURATION}s"
                             break
 
                     # Check max recording time
-                    if len(frames) > int(self.MAX_RECORDING_TIME * self.RATE / self.CHUNK):
-                        print(f"\n[Papagaio] {self.msg('max_time_reached')} ({self.MAX_RECORDING_TIME}s)")
+                    if chunk_count > int(self.MAX_RECORDING_TIME * self.RATE / self.CHUNK):
+                        stop_reason = f"{self.msg('max_time_reached')} ({self.MAX_RECORDING_TIME}s)"
                         break
 
             except KeyboardInterrupt:
                 pass
             finally:
-                stream.stop_stream()
-                stream.close()
+                meter.stop()
+                if stop_reason:
+                    print(f"\n[Papagaio] {stop_reason}")
+                if last_speech_at is not None and self._session_timer is not None:
+                    # Split capture into talking and waiting for the endpoint
+                    self._mark("recording", at=last_speech_at)
+                    self._session_timer.speech_end = last_speech_at
+                self._mark("endpointing")
+                self.session_stats = {
+                    "recorded_seconds": round(len(buffer) / self.RATE, 2),
+                    "chunks": chunk_count,
+                    "preroll_chunks": len(mic.preroll),
+                    "overflows": mic.overflows,
+                    "max_backlog_chunks": max_backlog,
+                    "voiced_seconds": round(voiced_chunks * self.CHUNK / self.RATE, 2),
+                    "peak_rms": int(peak_rms),
+                    "threshold": speech_threshold,
+                }
         finally:
-            audio.terminate()
+            mic.close()
+
+        if self.session_stats["overflows"]:
+            print(f"[Papagaio] ⚠ {self.session_stats['overflows']} input overflow(s) during capture", flush=True)
 
         if not started_speaking:
             return None
 
-        duration = len(frames) * self.CHUNK / self.RATE
+        duration = len(buffer) / self.RATE
         print(f"[Papagaio] {self.msg('recorded')}: {duration:.1f}s")
 
-        # Convert raw bytes to float32 numpy array (faster-whisper native format)
-        audio_array = np.frombuffer(b"".join(frames), dtype=np.int16).astype(np.float32) / 32768.0
-        return audio_array
+        # Single int16 -> float32 pass (faster-whisper native format). RMS regions
+        # are too coarse to replace Whisper's VAD, so only Silero's are passed on
+        speech_regions = [tuple(r) for r in regions] if endpointer.name == "silero" else None
+        return Recording(buffer.to_float32(), speech_regions, voiced_seconds=voiced_chunks * self.CHUNK / self.RATE,
+                         peak_rms=peak_rms, noise_floor=speech_threshold / SPEECH_OVER_NOISE)
 
-    def transcribe(self, audio_data):
+    def _decode_skip_reason(self, recording):
+        """Why capture statistics say a recording holds no real speech, or None to decode it"""
+        if recording.voiced_seconds is None:
+            return None
+        if recording.voiced_seconds < MIN_VOICED_SECONDS:
+            return f"only {recording.voiced_seconds:.2f}s of speech"
+        # Not the speech threshold: Silero also finds soft speech below it
+        if recording.noise_floor is not None and recording.peak_rms <= recording.noise_floor:
+            return f"speech never rose above the room noise (peak {recording.peak_rms:.0f} <= {recording.noise_floor:.0f})"
+        return None
+
+    def _batched_pipeline(self, model):
+        """BatchedInferencePipeline around the given model (None if unsupported)"""
+        if isinstance(model, WorkerWhisperModel):
+            return model  # The worker builds its own pipeline when given batch_size
+        if self._batched is None or self._batched.model is not model:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                print("[Papagaio] Batched decoding needs faster-whisper >= 1.1, decoding sequentially", flush=True)
+                self.batched_decoding = False
+                return None
+            self._batched = BatchedInferencePipeline(model=model)
+        return self._batched
+
+    def transcribe(self, audio_data, speech_regions=None, model_size=None):
         """Transcribe audio data to text (accepts numpy array or file path)"""
-        self.initialize_model()
+        text, info = self._decode(audio_data, speech_regions=speech_regions, model_size=model_size)
+
+        detected_lang = info.language
+        confidence = info.language_probability
+        print(f"[Papagaio] Language: {detected_lang} ({confidence:.0%} confidence)")
+
+        # Filter hallucinations and stutters
+        if _is_hallucination(text):
+            print(f"[Papagaio] ⚠ Filtered hallucination: {text[:50]}")
+            return ""
+
+        return text
+
+    def _decode(self, audio_data, language=None, speech_regions=None, model_size=None):
+        """Run Whisper on audio and return (text, info) after the segment gate
+
+        Unless model_size is given, a latency budget picks the model per call
+        and the audio is decoded again with the next larger model while
+        confidence is poor.
+        """
+        seconds = len(audio_data) / SAMPLE_RATE if hasattr(audio_data, "shape") else None
+        size = model_size or self._pick_model(seconds)
+        while True:
+            self.model_for(size)  # Load outside the timing
+            start = time.monotonic()
+            segments, info = self._segments(audio_data, language, speech_regions, model_size=size)
+            segments = list(segments)
+            if seconds:
+                self.decode_speed.record(size or self.model_size, seconds,
+                                         (time.monotonic() - start) / _cpu_contention())
+            larger = self._larger_model(size) if model_size is None else None
+            if larger is None or not self._poor_confidence(segments):
+                break
+            print(f"[Papagaio] Low confidence with {size}, decoding again with {larger}", flush=True)
+            size = larger
+        text = " ".join(self._segment_texts(segments))
+        return text.strip(), info
+
+    def _model_ladder(self):
+        """Model sizes adaptive mode chooses from, smallest first, up to model_size"""
+        return [size for size in _adaptive_ladder(self.model_size) if size not in self._unavailable_models]
+
+    def _pick_model(self, seconds):
+        """Largest model predicted to decode seconds of audio within the latency budget
+
+        None (the configured model) without a budget. Predictions come from
+        measured decode speed scaled by the current CPU load.
+        """
+        if not self.latency_budget or not seconds:
+            return None
+        contention = _cpu_contention()
+        ladder = self._model_ladder()
+        predicted = {size: self.decode_speed.estimate(size, seconds) * contention for size in ladder}
+        fits = [size for size in ladder if predicted[size] <= self.latency_budget]
+        size = fits[-1] if fits else ladder[0]
+        print(f"[Papagaio] Model: {size} (~{predicted[size]:.1f}s for {seconds:.1f}s of audio, "
+              f"budget {self.latency_budget:g}s)", flush=True)
+        return size
+
+    def _larger_model(self, size):
+        """Next model up the ladder for escalation, or None"""
+        if size is None:
+            return None
+        ladder = self._model_ladder()
+        index = ladder.index(size)
+        return ladder[index + 1] if index + 1 < len(ladder) else None
 
-        if HAS_CUDA:
+    @staticmethod
+    def _poor_confidence(segments):
+        if not segments:
+            return False  # Nothing said; a larger model will not find more
+        mean_logprob = sum(s.avg_logprob for s in segments) / len(segments)
+        return mean_logprob < ESCALATE_AVG_LOGPROB or any(
+            s.compression_ratio > COMPRESSION_RATIO_THRESHOLD for s in segments)
+
+    def _segment_texts(self, segments):
+        """Text of each segment that passes the confidence gate, stutters collapsed"""
+        for segment in segments:
+            reason = _segment_rejection(segment)
+            if reason:
+                print(f"[Papagaio] ⚠ Dropped segment, {reason}: {segment.text.strip()[:50]}", flush=True)
+                continue
+            text = _collapse_stutters(segment.text.strip())
+            if text:
+                yield text
+
+    def _segments(self, audio_data, language=None, speech_regions=None, model_size=None):
+        """Start decoding; returns faster-whisper's lazy (segments, info)
+
+        With speech_regions (sample offsets from capture), only those regions
+        are decoded and Whisper's own VAD pass is skipped. model_size picks
+        another model than the configured one.
+        """
+        # Local reference: a config reload may swap self.model mid-decode
+        model = self.model_for(model_size)
+
+        if _has_cuda():
             beam_size = 2
             best_of = 1
         else:
             beam_size = 1
             best_of = 1
 
-        segments, info = self.model.transcribe(
-            audio_data,
-            language=self.transcription_language,
+        options = dict(
+            language=language or self.transcription_language,
             beam_size=beam_size,
             best_of=best_of,
             vad_filter=True,
@@ -662,20 +2774,51 @@ class VoiceDaemon:
             condition_on_previous_text=False
         )
 
-        detected_lang = info.language
-        confidence = info.language_probability
-        print(f"[Papagaio] Language: {detected_lang} ({confidence:.0%} confidence)")
-
-        # More efficient string joining with generator
-        text = " ".join(segment.text.strip() for segment in segments)
-        text = text.strip()
-
-        # Filter hallucinations and stutters
-        if _is_hallucination(text):
-            print(f"[Papagaio] ⚠ Filtered hallucination: {text[:50]}")
-            return ""
+        pipeline = None
+        if self.batched_decoding and hasattr(audio_data, "shape") and len(audio_data) >= BATCHED_MIN_SECONDS * SAMPLE_RATE:
+            pipeline = self._batched_pipeline(model)
+
+        if pipeline is not None:
+            # Long recording: split at silence and decode the clips in batches
+            if speech_regions:
+                options["vad_filter"] = False
+                options["clip_timestamps"] = _batch_clips(speech_regions, len(audio_data))
+            del options["condition_on_previous_text"]
+            segments, info = pipeline.transcribe(audio_data, batch_size=self.batch_size, **options)
+        else:
+            if speech_regions:
+                options["vad_filter"] = False
+                audio_data = _speech_only(audio_data, speech_regions)
+            segments, info = model.transcribe(audio_data, **options)
+
+        return segments, info
+
+    def transcribe_incremental(self, audio_data, speech_regions=None):
+        """Yield text as Whisper decodes it, so typing can start before it finishes
+
+        The confidence gate runs per segment. Text is held back until it is
+        longer than MIN_VALID_TRANSCRIPTION_LENGTH, like the batch path.
+        """
+        # Text is typed as it arrives, so there is no escalating to a larger model
+        seconds = len(audio_data) / SAMPLE_RATE
+        segments, info = self._segments(audio_data, speech_regions=speech_regions, model_size=self._pick_model(seconds))
+        print(f"[Papagaio] Language: {info.language} ({info.language_probability:.0%} confidence)")
+
+        delivered = False
+        pending = ""
+        for text in self._segment_texts(segments):
+            pending = f"{pending} {text}" if pending else text
+            if len(pending) <= MIN_VALID_TRANSCRIPTION_LENGTH and not delivered:
+                continue
+            self._mark("transcribe")
+            yield pending
+            delivered = True
+            pending = ""
 
-        return text
+        if pending and delivered:
+            self._mark("transcribe")
+            yield pending
+        self._mark("transcribe")
 
     def type_text_pynput(self, text):
         """Type text using pynput (cross-platform)"""
@@ -684,7 +2827,7 @@ class VoiceDaemon:
 
         try:
             time.sleep(TYPING_DELAY_SECONDS)
-            kb = KeyboardController()
+            kb = keyboard.Controller()
             kb.type(text)
             # Don't press Enter - let user decide
             print(f"[Papagaio] ✓ Typed (pynput): {text[:50]}...")
@@ -698,21 +2841,26 @@ class VoiceDaemon:
         if not text:
             return False
 
+        typed = 0
         try:
             if not self._has_ydotool:
                 return False
 
             time.sleep(TYPING_DELAY_SECONDS)
 
-            subprocess.run(
-                ["ydotool", "type", "--", text],
-                check=True, timeout=10
-            )
+            # One call per chunk, so long text never hits a single timeout
+            for chunk in _text_chunks(text):
+                subprocess.run(
+                    ["ydotool", "type", "--", chunk],
+                    check=True, timeout=max(10, self.throughput.estimate("ydotool", len(chunk)) * 3)
+                )
+                typed += len(chunk)
 
             print(f"[Papagaio] Typed (ydotool): {text[:50]}...")
             return True
 
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            self._typed_chars = typed
             return False
 
     def type_text_clipboard_paste(self, text):
@@ -732,27 +2880,39 @@ class VoiceDaemon:
 
             time.sleep(TYPING_DELAY_SECONDS)
 
-            if clipboard_tool == "xclip":
-                subprocess.run(
-                    ["xclip", "-selection", "clipboard"],
-                    input=text.encode(), check=True, timeout=5
-                )
-            else:
-                subprocess.run(
-                    ["wl-copy", text],
-                    check=True, timeout=5
-                )
+            with self._clipboard_lock:
+                pending = self._clipboard_restore
+                if pending is not None:
+                    # Back-to-back pastes: the clipboard still holds our last text,
+                    # the user's own is the one saved for the pending restore
+                    pending.cancel()
+                    previous = pending.args[1]
+                else:
+                    previous = self._read_clipboard(clipboard_tool)
+                self._clipboard_restore = None
+                restore = previous is not None and previous != text
+                try:
+                    self._write_clipboard(clipboard_tool, text)
 
-            if self._has_xdotool:
-                subprocess.run(
-                    ["xdotool", "key", "ctrl+v"],
-                    check=True, timeout=5
-                )
-            elif self._has_ydotool:
-                subprocess.run(["ydotool", "key", "29:1", "47:1", "47:0", "29:0"], check=True, timeout=5)
-            else:
-                print("[Papagaio] Copied to clipboard, paste manually with Ctrl+V")
-                return True
+                    if self._send_key("ctrl+v"):
+                        pass
+                    elif self._has_xdotool:
+                        subprocess.run(
+                            ["xdotool", "key", "ctrl+v"],
+                            check=True, timeout=5
+                        )
+                    elif self._has_ydotool:
+                        subprocess.run(["ydotool", "key", "29:1", "47:1", "47:0", "29:0"], check=True, timeout=5)
+                    else:
+                        restore = False
+                        print("[Papagaio] Copied to clipboard, paste manually with Ctrl+V")
+                        return True
+                finally:
+                    if restore:
+                        # Put the user's clipboard back once the target app has pasted
+                        self._clipboard_restore = threading.Timer(
+                            CLIPBOARD_RESTORE_DELAY_SECONDS, self._restore_clipboard, args=(clipboard_tool, previous))
+                        self._clipboard_restore.start()
 
             print(f"[Papagaio] Typed (clipboard paste): {text[:50]}...")
             return True
@@ -761,24 +2921,130 @@ class VoiceDaemon:
             print(f"[Papagaio] Clipboard paste failed: {e}")
             return False
 
+    def _read_clipboard(self, tool):
+        """Current clipboard text, or None if empty, not text, or unreadable"""
+        if tool == "xclip":
+            cmd = ["xclip", "-selection", "clipboard", "-o"]
+        elif self._has_wl_paste:
+            cmd = ["wl-paste", "--no-newline"]
+        else:
+            return None
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=1)
+            if result.returncode != 0:
+                return None
+            return result.stdout.decode()
+        except (subprocess.SubprocessError, OSError, UnicodeDecodeError):
+            return None
+
+    def _write_clipboard(self, tool, text):
+        if tool == "xclip":
+            subprocess.run(
+                ["xclip", "-selection", "clipboard"],
+                input=text.encode(), check=True, timeout=5
+            )
+        else:
+            subprocess.run(
+                ["wl-copy", text],
+                check=True, timeout=5
+            )
+
+    def _restore_clipboard(self, tool, previous):
+        with self._clipboard_lock:
+            if self._clipboard_restore is not threading.current_thread():
+                return  # A later paste took over the restore
+            self._clipboard_restore = None
+            try:
+                self._write_clipboard(tool, previous)
+            except (subprocess.SubprocessError, OSError) as e:
+                print(f"[Papagaio] Could not restore clipboard: {e}", flush=True)
+
+    def _x11_call(self, operation, *args):
+        """Run an X11Session operation in-process; returns (ok, result).
+
+        ok is False when there is no X11 session or the call failed, and the
+        caller falls back to xdotool. A lost connection disables the session.
+        """
+        if self.x11 is None:
+            return False, None
+        try:
+            return True, getattr(self.x11, operation)(*args)
+        except Exception as e:
+            print(f"[Papagaio] X11 {operation} failed ({e}), falling back to xdotool", flush=True)
+            if isinstance(e, (OSError, Xlib.error.ConnectionClosedError)):
+                self.x11 = None
+            return False, None
+
+    def _uinput_call(self, operation, *args):
+        """Run a UInputKeyboard operation; returns True on success.
+
+        A failed write (device gone, permissions revoked) disables the
+        virtual keyboard and the caller falls back to ydotool.
+        """
+        if self.uinput is None:
+            return False
+        try:
+            getattr(self.uinput, operation)(*args)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"[Papagaio] uinput {operation} failed ({e}), falling back", flush=True)
+            if isinstance(e, OSError):
+                self.uinput = None
+            return False
+
+    def _send_key(self, combo, repeat=1):
+        """Send a key combo in-process (virtual keyboard or XTest); False if neither worked"""
+        if self.use_ydotool:
+            return self._uinput_call("key", combo, repeat) or self._x11_call("key", combo, repeat)[0]
+        return self._x11_call("key", combo, repeat)[0] or self._uinput_call("key", combo, repeat)
+
+    def type_text_uinput(self, text):
+        """Type text through the daemon's own uinput virtual keyboard"""
+        if not text or self.uinput is None:
+            return False
+        time.sleep(TYPING_DELAY_SECONDS)
+        uinput = self.uinput  # _uinput_call drops it if the device fails
+        if not self._uinput_call("type", text):
+            self._typed_chars = uinput.typed
+            return False
+        print(f"[Papagaio] Typed (uinput): {text[:50]}...")
+        return True
+
+    def type_text_xtest(self, text):
+        """Type text through the daemon's own X connection (XTEST)"""
+        if not text or self.x11 is None:
+            return False
+        time.sleep(TYPING_DELAY_SECONDS)
+        x11 = self.x11  # _x11_call drops it if the connection is lost
+        if not self._x11_call("type", text)[0]:
+            self._typed_chars = x11.typed
+            return False
+        print(f"[Papagaio] Typed (XTest): {text[:50]}...")
+        return True
+
     def type_text_xdotool(self, text):
         """Type text using xdotool (X11 only)"""
         if not text:
             return False
 
+        typed = 0
         try:
             if not self._has_xdotool:
                 return False
 
             time.sleep(TYPING_DELAY_SECONDS)
 
-            cmd = ["xdotool", "type", "--delay", "2", "--", text]
-            subprocess.run(cmd, check=True, timeout=30)
+            # One call per chunk, so long text never hits a single timeout
+            for chunk in _text_chunks(text):
+                cmd = ["xdotool", "type", "--delay", "2", "--", chunk]
+                subprocess.run(cmd, check=True, timeout=max(10, self.throughput.estimate("xdotool", len(chunk)) * 3))
+                typed += len(chunk)
 
             print(f"[Papagaio] Typed (xdotool type): {text[:50]}...")
             return True
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+            self._typed_chars = typed
             return False
 
     def type_text_clipboard(self, text):
@@ -801,10 +3067,15 @@ class VoiceDaemon:
 
     def _refocus_target_window(self):
         """Refocus the window that was active when hotkey was pressed"""
-        if self._target_window_id and IS_LINUX and self._has_xdotool:
+        if not self._target_window_id or not IS_LINUX:
+            return
+        if self._x11_call("activate", self._target_window_id)[0]:
+            time.sleep(0.05)
+            print(f"[Papagaio] Refocused window {self._target_window_id}")
+        elif self._has_xdotool:
             try:
                 subprocess.run(
-                    ["xdotool", "windowactivate", self._target_window_id],
+                    ["xdotool", "windowactivate", str(self._target_window_id)],
                     check=True, timeout=2
                 )
                 time.sleep(0.05)
@@ -814,49 +3085,147 @@ class VoiceDaemon:
 
     def _press_enter(self):
         """Press Enter key after typing"""
+        if self._send_key("Return"):
+            return
         if IS_LINUX and self._has_xdotool:
             subprocess.run(["xdotool", "key", "Return"], check=False, timeout=5)
         elif IS_LINUX and self.use_ydotool and self._has_ydotool:
             subprocess.run(["ydotool", "key", "28:1", "28:0"], check=False, timeout=5)
         else:
-            kb = KeyboardController()
-            kb.press(Key.enter)
-            kb.release(Key.enter)
+            kb = keyboard.Controller()
+            kb.press(keyboard.Key.enter)
+            kb.release(keyboard.Key.enter)
 
-    def type_text(self, text):
-        """Type text using available tool (cross-platform)"""
+    def _erase(self, count):
+        """Delete count characters before the cursor"""
+        if count <= 0 or self._send_key("BackSpace", count):
+            return
+        if IS_LINUX and self._has_xdotool:
+            subprocess.run(["xdotool", "key", "--repeat", str(count), "--delay", "2", "BackSpace"],
+                           check=False, timeout=5 + count * 0.05)
+        elif IS_LINUX and self.use_ydotool and self._has_ydotool:
+            subprocess.run(["ydotool", "key", *["14:1", "14:0"] * count], check=False, timeout=5 + count * 0.05)
+        else:
+            kb = keyboard.Controller()
+            for _ in range(count):
+                kb.press(keyboard.Key.backspace)
+                kb.release(keyboard.Key.backspace)
+
+    def type_text(self, text, refocus=True, press_enter=None):
+        """Type text using available tool (cross-platform)
+
+        Returns the backend that finished the output ("clipboard" if the
+        text was only copied), or None if every backend failed.
+        """
         self._typing_in_progress = True
+        self._set_state("typing")
         try:
-            self._refocus_target_window()
+            if refocus:
+                self._refocus_target_window()
+                self._mark("refocus")
             result = self._type_text_impl(text)
-            if self.auto_enter:
+            timer = self._session_timer
+            if result and timer is not None and timer.first_output is None:
+                timer.first_output = time.monotonic()
+            if self.auto_enter if press_enter is None else press_enter:
                 time.sleep(0.03)
                 self._press_enter()
+                self._mark("auto_enter")
                 print("[Papagaio] Auto-enter: pressed Enter", flush=True)
             return result
         finally:
             self._typing_in_progress = False
-            self._hotkey_cooldown = time.monotonic()
 
     def _type_text_impl(self, text):
+        """Output text through the first backend that works; returns its name, or None
+
+        A backend that fails after part of the text is out sets
+        _typed_chars, and the next backend carries on after that part
+        instead of typing it again.
+        """
+        for backend in self._output_plan(text):
+            self._typed_chars = 0
+            if self._type_with(backend, text):
+                return backend
+            if self._typed_chars:
+                print(f"[Papagaio] {backend} failed after {self._typed_chars} characters, "
+                      f"continuing with the rest", flush=True)
+                text = text[self._typed_chars:]
+        return None
+
+    def _output_backends(self):
+        """Output backends in fallback order for this platform"""
         if IS_WINDOWS or IS_MACOS:
-            if not self.type_text_pynput(text):
-                self.type_text_clipboard(text)
-        elif self.use_ydotool:
-            if not self.type_text_ydotool(text):
-                if not self.type_text_clipboard_paste(text):
-                    if not self.type_text_xdotool(text):
-                        self.type_text_clipboard(text)
-        else:
-            if not self.type_text_xdotool(text):
-                if not self.type_text_clipboard_paste(text):
-                    if not self.type_text_pynput(text):
-                        self.type_text_clipboard(text)
+            return ["pynput", "clipboard"]
+        if self.use_ydotool:
+            return ["uinput", "ydotool", "clipboard_paste", "xtest", "xdotool", "clipboard"]
+        return ["xtest", "xdotool", "clipboard_paste", "pynput", "clipboard"]
+
+    def _output_plan(self, text):
+        """Backends to try, fastest expected first.
+
+        Text is typed with the first available typing backend unless that is
+        predicted to take longer than PASTE_AFTER_SECONDS and a clipboard paste
+        would be quicker, or is the uinput keyboard and cannot type the text
+        on this layout. The rest of the fallback chain follows unchanged.
+        """
+        chain = self._output_backends()
+        typer = next((b for b in chain if b in ("uinput", "xtest", "xdotool", "ydotool", "pynput") and self._output_available(b)), None)
+        if typer is None or not self._output_available("clipboard_paste"):
+            return chain
+        if typer == "uinput" and not self.uinput.can_type(text):
+            # ydotool maps keys the same way, so paste rather than type wrong characters
+            print(f"[Papagaio] Output: clipboard paste (text not typeable on the "
+                  f"{self.uinput.layout or 'us'} layout)", flush=True)
+            return ["clipboard_paste"] + [b for b in chain if b != "clipboard_paste"]
+        if not self.paste_long_text:
+            return chain
+
+        type_seconds = self.throughput.estimate(typer, len(text))
+        paste_seconds = self.throughput.estimate("clipboard_paste", len(text))
+        if type_seconds > PASTE_AFTER_SECONDS and paste_seconds < type_seconds:
+            print(f"[Papagaio] Output: clipboard paste (~{paste_seconds:.1f}s vs ~{type_seconds:.1f}s typing "
+                  f"{len(text)} chars)", flush=True)
+            return ["clipboard_paste"] + [b for b in chain if b != "clipboard_paste"]
+        return chain
+
+    def _output_available(self, backend):
+        if backend == "uinput":
+            return self.uinput is not None
+        if backend == "xtest":
+            return self.x11 is not None
+        if backend == "xdotool":
+            return IS_LINUX and self._has_xdotool
+        if backend == "ydotool":
+            return IS_LINUX and self._has_ydotool
+        if backend == "clipboard_paste":
+            key_sender = self.x11 is not None or self.uinput is not None or self._has_xdotool or self._has_ydotool
+            return IS_LINUX and (self._has_xclip or self._has_wl_copy) and key_sender
+        return True
+
+    def _type_with(self, backend, text):
+        """Run one output backend, timed as its own stage (failed attempts too)"""
+        start = time.monotonic()
+        ok = False
+        try:
+            ok = getattr(self, f"type_text_{backend}")(text)
+            return ok
+        finally:
+            if ok:
+                self.throughput.record(backend, len(text), time.monotonic() - start)
+            self._mark(f"type_{backend}")
 
     def show_edit_dialog(self, text):
         """Show GTK dialog to edit text before sending"""
         if not HAS_GTK:
             return text
+        try:
+            import gi
+            gi.require_version('Gtk', '3.0')
+            from gi.repository import Gtk, GLib
+        except (ImportError, ValueError) as e:
+            print(f"[Papagaio] Edit dialog unavailable: {e}")
+            return text
 
         result = [text]  # Use list to allow modification in nested function
 
@@ -937,6 +3306,7 @@ class VoiceDaemon:
                     stderr=subprocess.DEVNULL
                 )
             elif HAS_PLYER:
+                from plyer import notification as plyer_notification
                 plyer_notification.notify(
                     title=title,
                     message=message,
@@ -974,15 +3344,39 @@ class VoiceDaemon:
             self.esc_listener = None
 
     def process_voice_input(self):
-        """Process voice input in a separate thread"""
+        """Start capturing a dictation; decoding and typing follow in the pipeline
+
+        A new dictation can start as soon as the previous one has finished
+        recording. Capture hands sessions to the decode stage, which hands
+        them to the output stage, one thread each, so text is always typed
+        in the order it was spoken.
+        """
         if self.is_recording:
             return
 
         self.is_recording = True
+        self._set_state("recording")
+        self._start_pipeline()
+        self._session_count += 1
+        session = DictationSession(self._session_count)
         # Reset flags for new recording session
         self.stop_recording_flag = False
         self.cancel_recording_flag = False
 
+        if self.x11 is not None or (IS_LINUX and self._has_xdotool):
+            session.target_window = self._active_window()
+            if session.target_window:
+                print(f"[Papagaio] Saved target window: {session.target_window}")
+            session.timer.mark("window_lookup")
+
+        self.recording_thread = threading.Thread(target=self._capture_stage, args=(session,))
+        self.recording_thread.start()
+
+    def _active_window(self):
+        """ID of the focused window, or None if it cannot be found out (e.g. Wayland)"""
+        found, window = self._x11_call("active_window")
+        if found:
+            return window
         if IS_LINUX and self._has_xdotool:
             try:
                 result = subprocess.run(
@@ -990,59 +3384,277 @@ class VoiceDaemon:
                     capture_output=True, text=True, timeout=2
                 )
                 if result.returncode == 0 and result.stdout.strip():
-                    self._target_window_id = result.stdout.strip()
-                    print(f"[Papagaio] Saved target window: {self._target_window_id}")
+                    return int(result.stdout.strip())
             except Exception:
-                self._target_window_id = None
-
-        def record_and_transcribe():
-            try:
-                # Start ESC listener
-                self.start_esc_listener()
-
-                audio_data = self.record_audio()
-
-                # Stop ESC listener
-                self.stop_esc_listener()
-
-                if audio_data is not None:
-                    print("[Papagaio] 🔄 Transcribing...", flush=True)
-
-                    text = self.transcribe(audio_data)
-
-                    if text and len(text) > MIN_VALID_TRANSCRIPTION_LENGTH:
-                        print(f"[Papagaio] {self.msg('transcribed')}: {text}", flush=True)
+                pass
+        return None
 
-                        # Allow editing before sending if enabled
-                        if self.edit_before_send and HAS_GTK:
-                            print("[Papagaio] ✏️  Opening edit dialog...")
-                            edited_text = self.show_edit_dialog(text)
-                            if edited_text is None:
-                                print(f"[Papagaio] {self.msg('cancelled')}")
-                                self.show_notification("Papagaio", self.msg("cancelled"), "normal")
-                                return
-                            text = edited_text
+    def _start_pipeline(self):
+        if self._pipeline_threads:
+            return
+        self._pipeline_threads = [threading.Thread(target=stage, daemon=True)
+                                  for stage in (self._decode_stage, self._output_stage)]
+        for thread in self._pipeline_threads:
+            thread.start()
+
+    def _capture_stage(self, session):
+        """Record one dictation and queue it for decoding"""
+        self._local.session = session
+        queued = False
+        try:
+            # Start ESC listener
+            self.start_esc_listener()
+
+            streamer = StreamingTranscriber(self) if self.streaming else None
+            recording = self.record_audio(on_segment=streamer.submit if streamer else None)
+
+            # Stop ESC listener
+            self.stop_esc_listener()
+
+            skip = recording is not None and self._decode_skip_reason(recording)
+            if skip:
+                # Accidental activation: don't spend a full decode on it
+                print(f"[Papagaio] Skipping transcription: {skip}", flush=True)
+                recording = None
+
+            if recording is None:
+                if streamer:
+                    streamer.cancel()
+                print(f"[Papagaio] {self.msg('no_audio')}")
+                self.show_notification("Papagaio", self.msg("no_speech"), "normal")
+                return
+
+            session.recording = recording
+            session.streamer = streamer
+            # Typing segment by segment needs the decoder's segment stream
+            # and no edit dialog holding the text back
+            session.incremental = self.incremental_output and not streamer and not (self.edit_before_send and HAS_GTK)
+            # The draft is typed before the final text exists, so no edit dialog either
+            if self.draft_model and self.draft_model != self.model_size and not session.incremental \
+                    and not streamer and not (self.edit_before_send and HAS_GTK):
+                session.draft_model = self.draft_model
+            with self._pipeline_lock:
+                self._in_flight += 1
+            self._decode_queue.put(session)
+            queued = True
+            self._update_queue_depth()
 
-                        self.type_text(text)
-                        self.show_notification("Papagaio", f"✓ {text[:50]}", "normal")
+        except Exception as e:
+            self._session_failed(session, e)
+        finally:
+            self.stop_esc_listener()
+            self._local.session = None
+            self.is_recording = False
+            self.stop_recording_flag = False
+            self.cancel_recording_flag = False
+            if self._warm_mic_stale:
+                self._apply_warm_microphone()
+            if queued:
+                if self.state == "recording":
+                    self._set_state("transcribing")
+            else:
+                self._finish_session(session, counted=False)
+
+    def _decode_stage(self):
+        """Decode queued recordings one at a time, oldest first"""
+        while True:
+            session = self._decode_queue.get()
+            self._local.session = session
+            self._mark("decode_queue")
+            self._update_queue_depth()
+            handed_over = False
+            try:
+                self._set_state("transcribing")
+                print(f"[Papagaio] 🔄 Transcribing #{session.number}...", flush=True)
+                recording = session.recording
+                if session.incremental:
+                    # The output stage types each piece as it arrives
+                    self._output_queue.put(session)
+                    handed_over = True
+                    self._update_queue_depth()
+                    for text in self.transcribe_incremental(recording.audio, recording.speech_regions):
+                        session.texts.put(text)
+                else:
+                    if session.streamer:
+                        text = session.streamer.finish(recording)
+                    elif session.draft_model:
+                        text = self.transcribe(recording.audio, recording.speech_regions, model_size=session.draft_model)
+                        self._mark("draft")
+                        # Typed while the final pass runs
+                        session.texts.put(text)
+                        self._output_queue.put(session)
+                        handed_over = True
+                        self._update_queue_depth()
+                        text = self.transcribe(recording.audio, recording.speech_regions)
                     else:
-                        print(f"[Papagaio] {self.msg('no_speech')}")
-                        self.show_notification("Papagaio", self.msg("no_speech"), "normal")
+                        text = self.transcribe(recording.audio, recording.speech_regions)
+                    self._mark("transcribe")
+                    session.texts.put(text)
+            except Exception as e:
+                self._session_failed(session, e)
+            finally:
+                session.texts.put(None)
+                if not handed_over:
+                    self._output_queue.put(session)
+                    self._update_queue_depth()
+                session.recording = None  # Free the audio while the session waits for output
+                self._local.session = None
+                self._decode_queue.task_done()
+
+    def _output_stage(self):
+        """Type decoded sessions in the order they were recorded"""
+        while True:
+            session = self._output_queue.get()
+            self._local.session = session
+            self._mark("output_queue")
+            self._update_queue_depth()
+            try:
+                if session.incremental:
+                    text = self._deliver_incremental(session)
+                elif session.draft_model:
+                    text = self._deliver_speculative(session)
                 else:
-                    print(f"[Papagaio] {self.msg('no_audio')}")
+                    text = self._deliver(session)
+                if text:
+                    session.timer.delivered = time.monotonic()
+                    self.show_notification("Papagaio", f"✓ {text[:50]}", "normal")
+                elif session.error is None:
+                    print(f"[Papagaio] {self.msg('no_speech')}")
                     self.show_notification("Papagaio", self.msg("no_speech"), "normal")
-
             except Exception as e:
-                print(f"[Papagaio] ✗ Error: {e}")
-                self.show_notification("Papagaio", f"✗ Error: {str(e)}", "critical")
+                self._session_failed(session, e)
             finally:
-                self.stop_esc_listener()
-                self.is_recording = False
-                self.stop_recording_flag = False
-                self.cancel_recording_flag = False
+                self._local.session = None
+                self._finish_session(session)
+                self._output_queue.task_done()
+
+    def _deliver(self, session):
+        """Type a whole transcription; returns the text typed, or None"""
+        text = session.texts.get()
+        if text is not None:
+            session.texts.get()  # End of session marker
+        if not text or len(text) <= MIN_VALID_TRANSCRIPTION_LENGTH:
+            return None
+        print(f"[Papagaio] {self.msg('transcribed')}: {text}", flush=True)
+
+        # Allow editing before sending if enabled
+        if self.edit_before_send and HAS_GTK:
+            print("[Papagaio] ✏️  Opening edit dialog...")
+            edited_text = self.show_edit_dialog(text)
+            self._mark("edit")
+            if edited_text is None:
+                print(f"[Papagaio] {self.msg('cancelled')}")
+                self.show_notification("Papagaio", self.msg("cancelled"), "normal")
+                return None
+            text = edited_text
+
+        self.type_text(text)
+        return text
 
-        self.recording_thread = threading.Thread(target=record_and_transcribe)
-        self.recording_thread.start()
+    def _deliver_incremental(self, session):
+        """Type pieces of a transcription as the decode stage produces them"""
+        delivered = []
+        while True:
+            text = session.texts.get()
+            if text is None:
+                break
+            # Pieces after the first go to the same place: no refocus
+            self.type_text(f" {text}" if delivered else text, refocus=not delivered, press_enter=False)
+            self._set_state("transcribing")
+            delivered.append(text)
+
+        text = " ".join(delivered)
+        if text:
+            print(f"[Papagaio] {self.msg('transcribed')}: {text}", flush=True)
+            if self.auto_enter:
+                self._press_enter()
+                self._mark("auto_enter")
+                print("[Papagaio] Auto-enter: pressed Enter", flush=True)
+        return text
+
+    def _deliver_speculative(self, session):
+        """Type the draft now, then correct it in place once the final text arrives
+
+        The correction backspaces over the end of the draft that differs and
+        types the rest of the final text. It only happens if the window that
+        got the draft still has focus; otherwise the draft is left alone.
+        """
+        draft = session.texts.get()
+        if draft is None:
+            return None
+        typed = window = None
+        if len(draft) > MIN_VALID_TRANSCRIPTION_LENGTH:
+            print(f"[Papagaio] Draft ({session.draft_model}): {draft}", flush=True)
+            backend = self.type_text(draft, press_enter=False)
+            # Only text that was typed or pasted into the window can be corrected;
+            # the copy-only fallback leaves nothing there to backspace over
+            if backend and backend != "clipboard":
+                typed = draft
+                window = self._active_window()
+            self._set_state("transcribing")
+
+        final = session.texts.get()
+        if final is not None:
+            session.texts.get()  # End of session marker
+        if typed is None:
+            if not final or len(final) <= MIN_VALID_TRANSCRIPTION_LENGTH:
+                return None
+            print(f"[Papagaio] {self.msg('transcribed')}: {final}", flush=True)
+            self.type_text(final)
+            return final
+
+        if final is None:
+            final = typed  # The final pass failed: keep the draft
+        if len(final) <= MIN_VALID_TRANSCRIPTION_LENGTH:
+            final = ""  # The accurate model heard nothing worth typing
+        if final != typed:
+            if window is not None and self._active_window() == window:
+                self._reconcile(typed, final)
+                print(f"[Papagaio] Corrected draft: {final}", flush=True)
+            else:
+                print("[Papagaio] ⚠ Focus moved, leaving the draft as typed", flush=True)
+                self.show_notification("Papagaio", f"Draft kept (focus moved): {final[:50]}", "normal")
+                final = typed
+        if final:
+            print(f"[Papagaio] {self.msg('transcribed')}: {final}", flush=True)
+            if self.auto_enter:
+                self._press_enter()
+                self._mark("auto_enter")
+                print("[Papagaio] Auto-enter: pressed Enter", flush=True)
+        return final or None
+
+    def _reconcile(self, typed, final):
+        """Turn already typed text into final text with backspaces and typing"""
+        keep = len(os.path.commonprefix([typed, final]))
+        self._typing_in_progress = True
+        try:
+            self._erase(len(typed) - keep)
+        finally:
+            self._typing_in_progress = False
+        if final[keep:]:
+            self.type_text(final[keep:], refocus=False, press_enter=False)
+        self._mark("reconcile")
+
+    def _session_failed(self, session, error):
+        session.error = error
+        print(f"[Papagaio] ✗ Error: {error}")
+        self._set_state("error", str(error))
+        self.show_notification("Papagaio", f"✗ Error: {str(error)}", "critical")
+
+    def _finish_session(self, session, counted=True):
+        """Record a session's latency and go idle once the pipeline is empty"""
+        self.latency.record(session.timer)
+        with self._pipeline_lock:
+            if counted:
+                self._in_flight -= 1
+            idle = self._in_flight == 0 and not self.is_recording
+        # An error stays visible until the next dictation starts
+        if idle and self.state != "error":
+            self._set_state("idle")
+
+    def _update_queue_depth(self):
+        self.latency.queue_depth("decode", self._decode_queue.qsize())
+        self.latency.queue_depth("output", self._output_queue.qsize())
 
     def on_activate(self):
         """Called when hotkey is pressed"""
@@ -1090,15 +3702,34 @@ class VoiceDaemon:
         except (OSError, ValueError):
             pass
 
-    def start(self):
-        """Start the daemon"""
-        self.write_pid()
+    def _select_typing_tool(self):
+        """Open the in-process keyboards and pick the typing backend; returns its name"""
+        # One X connection for focus and key injection; xdotool stays the fallback
+        if self.x11 is None and IS_LINUX and HAS_XLIB and os.environ.get("DISPLAY"):
+            try:
+                self.x11 = X11Session()
+            except Exception as e:
+                print(f"[Papagaio] In-process X11 unavailable ({e}), using xdotool", flush=True)
+
+        # Wayland has no XTEST: type through our own virtual keyboard, ydotool stays the fallback
+        if self.uinput is None and IS_LINUX and HAS_EVDEV and (os.environ.get("WAYLAND_DISPLAY") or self.use_ydotool):
+            try:
+                self.uinput = UInputKeyboard()
+            except Exception as e:
+                print(f"[Papagaio] uinput virtual keyboard unavailable ({e}), "
+                      "add yourself to the input group or check /dev/uinput permissions", flush=True)
 
         # Detect which typing tool to use
         if IS_WINDOWS or IS_MACOS:
             tool_name = "pynput (native)"
+        elif self.uinput is not None and (self.use_ydotool or self.x11 is None):
+            self.use_ydotool = True
+            tool_name = "uinput virtual keyboard (Wayland)"
         elif self.use_ydotool and self._has_ydotool:
             tool_name = "ydotool (Wayland/X11)"
+        elif self.x11 is not None:
+            self.use_ydotool = False
+            tool_name = "XTest (in-process X11)"
         elif self._has_xdotool:
             self.use_ydotool = False
             tool_name = "xdotool (X11)"
@@ -1107,15 +3738,136 @@ class VoiceDaemon:
             tool_name = "ydotool (Wayland/X11)"
         else:
             tool_name = "pynput (fallback)"
+        return tool_name
+
+    # Config keys copied straight to daemon attributes on reload
+    _CONFIG_ATTRIBUTES = {
+        "model": "model_size", "hotkey": "hotkey", "secondary_hotkey": "secondary_hotkey",
+        "auto_enter": "auto_enter", "use_ydotool": "use_ydotool", "cache_dir": "model_cache_dir",
+        "silence_threshold": "SILENCE_THRESHOLD", "silence_duration": "SILENCE_DURATION",
+        "edit_before_send": "edit_before_send", "streaming": "streaming",
+        "warm_microphone": "warm_microphone", "preroll_ms": "preroll_ms", "vad_threshold": "vad_threshold",
+        "batched_decoding": "batched_decoding", "batch_size": "batch_size", "worker_process": "worker_process",
+        "paste_long_text": "paste_long_text", "incremental_output": "incremental_output",
+        "latency_budget": "latency_budget", "draft_model": "draft_model",
+    }
+    _MODEL_CONFIG_KEYS = ("model", "cache_dir", "worker_process")
+
+    def reload_config(self):
+        """Re-read config.ini and apply what changed; returns a one-line summary
+
+        Only keys whose value in the file changed since the last load are
+        applied, so command line overrides stay in effect otherwise. The
+        Whisper model is reloaded only when model, cache_dir or
+        worker_process change.
+        """
+        with self._reload_lock:
+            config = load_config()
+            previous = self.config or {}
+            changed = [key for key, value in config.items() if previous.get(key) != value]
+            self.config = config
+            if not changed:
+                return "no changes"
+
+            for key in changed:
+                value = config[key]
+                if key in self._CONFIG_ATTRIBUTES:
+                    setattr(self, self._CONFIG_ATTRIBUTES[key], value)
+                elif key == "language":
+                    self.lang = value if value in MESSAGES else "en"
+                elif key == "transcription_language":
+                    self.transcription_language = value if value != "auto" else None
+                elif key == "endpointing":
+                    self.endpointing = self._endpointing_mode(value)
+                elif key == "metrics_file":
+                    self.latency.metrics_file = value or None
+
+            if "use_ydotool" in changed:
+                print(f"[Papagaio] Typing tool: {self._select_typing_tool()}", flush=True)
+            if "endpointing" in changed or "vad_threshold" in changed:
+                self.create_endpointer(self.SILENCE_THRESHOLD)  # Load Silero now, not on the next hotkey
+            if "warm_microphone" in changed or "preroll_ms" in changed:
+                self._apply_warm_microphone()
+            if any(key in changed for key in self._MODEL_CONFIG_KEYS):
+                self._reload_model()
+
+            summary = ", ".join(changed)
+            print(f"[Papagaio] Configuration reloaded: {summary}", flush=True)
+            return f"reloaded {summary}"
+
+    def _reload_model(self):
+        """Swap in a model for the new settings; a decode already running finishes on the old one"""
+        with self._model_lock:
+            old = [self.model, *self.extra_models.values()]
+            self.model, self._batched, self.extra_models = None, None, {}
+        workers = [model for model in old if isinstance(model, WorkerWhisperModel)]
+        if workers:
+            def close_when_done():
+                for worker in workers:
+                    with worker._lock:  # Held by a transcription in progress
+                        pass
+                    worker.close()
+            threading.Thread(target=close_when_done, daemon=True).start()
+        # Load now rather than on the next dictation
+        threading.Thread(target=self.initialize_model, daemon=True).start()
+
+    def _apply_warm_microphone(self):
+        """Open, close or reopen the warm microphone to match the settings"""
+        if self.is_recording:
+            self._warm_mic_stale = True  # The recording is reading from it; retry when it ends
+            return
+        self._warm_mic_stale = False
+        if self.warm_mic:
+            self.warm_mic.close()
+            self.warm_mic = None
+        if self.warm_microphone:
+            self.warm_mic = WarmMicrophone(self, self.preroll_ms)
+            self.warm_mic.start()
+
+    def _watch_config(self):
+        """Reload the configuration whenever config.ini is saved (inotify, no polling)"""
+        directory = os.path.dirname(CONFIG_FILE)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            inotify = Inotify()
+            # Editors and the settings tools either rewrite the file or rename a new one over it
+            inotify.add_watch(directory, Inotify.IN_CLOSE_WRITE | Inotify.IN_MOVED_TO)
+        except OSError as e:
+            print(f"[Papagaio] Not watching {CONFIG_FILE} ({e}); use `papagaio-send reload`", flush=True)
+            return
+        try:
+            while not self._stop_listener:
+                events = inotify.read()
+                if any(name == os.path.basename(CONFIG_FILE) for _, _, name in events):
+                    try:
+                        self.reload_config()
+                    except Exception as e:
+                        print(f"[Papagaio] Configuration reload failed: {e}", flush=True)
+        finally:
+            inotify.close()
+
+    def start(self):
+        """Start the daemon"""
+        self.write_pid()
+
+        tool_name = self._select_typing_tool()
 
         print("=" * 60)
         print(self.msg("started"))
         print("=" * 60)
         print(f"Hotkey: {self.hotkey}")
         print(f"Model: Whisper {self.model_size}")
+        if self.draft_model:
+            print(f"Draft model: {self.draft_model} (typed first, corrected by {self.model_size})")
+        if self.latency_budget:
+            print(f"Latency budget: {self.latency_budget:g}s (adaptive: {', '.join(self._model_ladder())})")
         print(f"Interface: {self.lang}")
         print(f"Transcription: {self.transcription_language or 'auto'}")
         print(f"Typing tool: {tool_name}")
+        print(f"Streaming: {'ON' if self.streaming else 'OFF'}")
+        print(f"Incremental output: {'ON' if self.incremental_output else 'OFF'}")
+        print(f"Endpointing: {self.endpointing}")
+        print(f"Warm microphone: {f'ON ({self.preroll_ms}ms pre-roll)' if self.warm_microphone else 'OFF'}")
         edit_status = "✓ ON (GTK)" if self.edit_before_send and HAS_GTK else "OFF"
         print(f"Edit mode: {edit_status}")
         print(self.msg("mode"))
@@ -1129,8 +3881,31 @@ class VoiceDaemon:
         print(f"{self.msg('press_ctrl_c')}\n")
 
         # Initialize model on startup
+        if not self._check_models():
+            sys.exit(1)
         self.initialize_model()
 
+        # Load the VAD model now instead of on the first hotkey press
+        self.create_endpointer(self.SILENCE_THRESHOLD)
+
+        if self.warm_microphone:
+            self.warm_mic = WarmMicrophone(self, self.preroll_ms)
+            self.warm_mic.start()
+
+        if not IS_WINDOWS:
+            try:
+                self.control = ControlServer(self, control_socket_path())
+                self.control.start()
+                print(f"[Papagaio] Control socket: {self.control.path}", flush=True)
+            except OSError as e:
+                print(f"[Papagaio] Control socket unavailable: {e}", flush=True)
+                self.control = None
+
+        if self.config is None:
+            self.config = load_config()
+        if IS_LINUX:
+            threading.Thread(target=self._watch_config, daemon=True).start()
+
         self.show_notification(
             "Papagaio (VAD)",
             f"✓ {self.msg('notification_ready').format(hotkey=self.hotkey)}",
@@ -1159,6 +3934,17 @@ class VoiceDaemon:
             print("\n[Papagaio] Stopping...")
         finally:
             self._stop_listener = True
+            if self.control:
+                self.control.close()
+            if self.x11:
+                self.x11.close()
+            if self.uinput:
+                self.uinput.close()
+            if self.warm_mic:
+                self.warm_mic.close()
+            for model in [self.model, *self.extra_models.values()]:
+                if isinstance(model, WorkerWhisperModel):
+                    model.close()
             self.remove_pid()
             self.show_notification("Papagaio", "Stopped", "low")
 
@@ -1166,7 +3952,7 @@ class VoiceDaemon:
 def load_config():
     """Load configuration from config file"""
     import configparser
-    config_file = os.path.expanduser("~/.config/papagaio/config.ini")
+    config_file = CONFIG_FILE
 
     defaults = {
         'model': 'small',
@@ -1179,38 +3965,231 @@ def load_config():
         'silence_threshold': 200,  # Lower for better detection
         'silence_duration': 2.0,   # 2 seconds silence to stop
         'transcription_language': 'auto',
-        'edit_before_send': False
+        'edit_before_send': False,
+        'streaming': False,
+        'warm_microphone': False,
+        'preroll_ms': PREROLL_MS,
+        'endpointing': ENDPOINTING_MODE,
+        'vad_threshold': VAD_SPEECH_THRESHOLD,
+        'batched_decoding': True,
+        'batch_size': BATCH_SIZE,
+        'worker_process': False,
+        'metrics_file': '',
+        'paste_long_text': True,
+        'incremental_output': False,
+        'latency_budget': 0.0,
+        'draft_model': ''
     }
 
     if os.path.exists(config_file):
-        config = configparser.ConfigParser()
+        # The documented example has "key = value  # comment" lines
+        config = configparser.ConfigParser(inline_comment_prefixes=('#',))
         config.read(config_file)
 
+        def number(section, key, kind=float):
+            """A numeric value; an invalid one is reported and the default kept"""
+            value = config[section].get(key, '').strip()
+            try:
+                return kind(value) if value else defaults[key]
+            except ValueError:
+                print(f"[Papagaio] Invalid {key} = {value!r} in {config_file}, using {defaults[key]}")
+                return defaults[key]
+
         if 'General' in config:
             defaults['model'] = config['General'].get('model', defaults['model'])
             defaults['language'] = config['General'].get('language', defaults['language'])
             defaults['hotkey'] = config['General'].get('hotkey', defaults['hotkey'])
             defaults['secondary_hotkey'] = config['General'].get('secondary_hotkey', defaults['secondary_hotkey'])
-            defaults['cache_dir'] = config['General'].get('cache_dir', defaults['cache_dir'])
+            defaults['cache_dir'] = os.path.expanduser(config['General'].get('cache_dir', defaults['cache_dir']))
             defaults['edit_before_send'] = config['General'].get('edit_before_send', 'false').lower() == 'true'
             defaults['auto_enter'] = config['General'].get('auto_enter', 'false').lower() == 'true'
+            defaults['latency_budget'] = number('General', 'latency_budget')
+            defaults['draft_model'] = config['General'].get('draft_model', '').strip()
 
         if 'Audio' in config:
-            defaults['silence_threshold'] = int(config['Audio'].get('silence_threshold', '200'))
-            defaults['silence_duration'] = float(config['Audio'].get('silence_duration', '2.0'))
+            defaults['silence_threshold'] = number('Audio', 'silence_threshold', int)
+            defaults['silence_duration'] = number('Audio', 'silence_duration')
             defaults['transcription_language'] = config['Audio'].get('transcription_language', 'auto')
+            defaults['streaming'] = config['Audio'].get('streaming', 'false').lower() == 'true'
+            defaults['warm_microphone'] = config['Audio'].get('warm_microphone', 'false').lower() == 'true'
+            defaults['preroll_ms'] = number('Audio', 'preroll_ms', int)
+            defaults['endpointing'] = config['Audio'].get('endpointing', ENDPOINTING_MODE).lower()
+            defaults['vad_threshold'] = number('Audio', 'vad_threshold')
+            defaults['incremental_output'] = config['Audio'].get('incremental_output', 'false').lower() == 'true'
 
         if 'Advanced' in config:
             defaults['use_ydotool'] = config['Advanced'].get('use_ydotool', 'false').lower() == 'true'
+            defaults['batched_decoding'] = config['Advanced'].get('batched_decoding', 'true').lower() == 'true'
+            defaults['batch_size'] = number('Advanced', 'batch_size', int)
+            defaults['worker_process'] = config['Advanced'].get('worker_process', 'false').lower() == 'true'
+            metrics_file = config['Advanced'].get('metrics_file', '').strip()
+            # "metrics_file = # comment" with no space-separated value is a comment, not a path
+            defaults['metrics_file'] = '' if metrics_file.startswith('#') else os.path.expanduser(metrics_file)
+            defaults['paste_long_text'] = config['Advanced'].get('paste_long_text', 'true').lower() == 'true'
 
     return defaults
 
 
+def tune_cpu(argv):
+    """`papagaio tune`: time CPU thread counts and compute types per model
+
+    Every combination decodes the same audio through the daemon's own decode
+    options. The fastest one whose text stays within TUNE_MAX_WORD_ERROR of
+    the float32 result is saved to the CPU profile cache, where
+    _create_model() picks it up.
+    """
+    import argparse
+    import ctranslate2
+    from faster_whisper import WhisperModel
+
+    config = load_config()
+    parser = argparse.ArgumentParser(prog="papagaio tune",
+                                     description="Find the fastest CPU settings for Whisper on this machine")
+    parser.add_argument("-m", "--model", nargs="+", default=[config['model']],
+                        choices=["tiny", "base", "small", "medium", "large-v3"])
+    parser.add_argument("--audio", help="Speech clip to decode (default: record one from the microphone)")
+    parser.add_argument("--runs", type=int, default=3, help="Timed decodes per combination")
+    parser.add_argument("--threads", type=int, nargs="+", help="CPU thread counts to try")
+    args = parser.parse_args(argv)
+
+    if _has_cuda():
+        print("CUDA is available: Papagaio decodes on the GPU, CPU tuning does not apply")
+        return 1
+
+    cpus = _cpu_count()
+    threads = sorted(set(args.threads or [t for t in (2, 4, cpus // 4, cpus // 2, cpus) if 1 <= t <= cpus]))
+    supported = ctranslate2.get_supported_compute_types("cpu")
+    compute_types = [c for c in TUNE_COMPUTE_TYPES if c in supported]
+
+    daemon = VoiceDaemon(model_size=args.model[0], transcription_language=config['transcription_language'],
+                         model_cache_dir=config['cache_dir'], batched_decoding=False)
+    if args.audio:
+        from faster_whisper import decode_audio
+        audio = decode_audio(args.audio, sampling_rate=SAMPLE_RATE)
+    else:
+        print("Read a sentence or two aloud; recording stops at silence.")
+        recording = daemon.record_audio()
+        if recording is None:
+            print("Nothing recorded")
+            return 1
+        audio = recording.audio
+    print(f"Clip: {len(audio) / SAMPLE_RATE:.1f}s, {cpus} CPUs, compute types: {', '.join(compute_types)}")
+
+    def decode(model):
+        daemon.model = model
+        segments, _ = daemon._segments(audio)
+        return "".join(segment.text for segment in segments).strip()
+
+    for size in args.model:
+        daemon.model_size = size
+        results = []
+        reference = None
+        print(f"\n{size}: {'compute':<14} {'threads':>7} {'median':>8} {'WER':>6}")
+        # float32 first: its text is the reference for the others
+        for compute_type in sorted(compute_types, key=lambda c: c != "float32"):
+            for count in threads:
+                model = WhisperModel(daemon._model_path(size), device="cpu", compute_type=compute_type,
+                                     cpu_threads=count, num_workers=1)
+                text = decode(model)  # Warm-up
+                times = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    decode(model)
+                    times.append(time.perf_counter() - start)
+                del model
+                if reference is None:
+                    reference = text
+                    if not reference:
+                        print("No speech decoded from the clip; accuracy is not checked")
+                seconds = sorted(times)[len(times) // 2]
+                error = _word_error_rate(reference, text)
+                results.append((seconds, compute_type, count, error))
+                print(f"{'':<{len(size) + 1}} {compute_type:<14} {count:>7} {seconds:>7.2f}s {error:>6.2f}")
+
+        acceptable = [r for r in results if r[3] <= TUNE_MAX_WORD_ERROR]
+        seconds, compute_type, count, error = min(acceptable)
+        daemon.cpu_profiles.save(size, {"compute_type": compute_type, "cpu_threads": count,
+                                        "seconds": round(seconds, 3), "audio_seconds": round(len(audio) / SAMPLE_RATE, 2)})
+        # Decode times measured with the old settings no longer apply
+        daemon.decode_speed.forget(size)
+        print(f"{size}: {compute_type} with {count} threads ({seconds:.2f}s)")
+
+    daemon.model = None
+    print(f"\nSaved to {daemon.cpu_profiles.path}; restart Papagaio to use it (papagaio-ctl restart)")
+    return 0
+
+
+def manage_models(argv):
+    """`papagaio models`: pull, list, verify and prune the local model store"""
+    import argparse
+
+    config = load_config()
+    # With a latency budget the smaller models of the ladder are used too
+    ladder = _adaptive_ladder(config['model']) if config['latency_budget'] else []
+    configured = [m for m in dict.fromkeys([config['model'], config['draft_model']] + ladder)
+                  if m and not os.path.isdir(m)]
+    parser = argparse.ArgumentParser(prog="papagaio models", description="Manage the local Whisper model store")
+    parser.add_argument("--cache-dir", default=config['cache_dir'])
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("pull", help="Download models and index them (default: the configured ones)")
+    command.add_argument("models", nargs="*", default=configured)
+    commands.add_parser("list", help="Show stored models")
+    command = commands.add_parser("verify", help="Check stored files against their checksums (default: all)")
+    command.add_argument("models", nargs="*")
+    command = commands.add_parser("prune", help="Delete stored models except the kept ones")
+    command.add_argument("--keep", nargs="+", default=configured, help="Models to keep (default: the configured ones)")
+    args = parser.parse_args(argv)
+
+    store = ModelStore(args.cache_dir)
+    status = 0
+    if args.command == "pull":
+        for name in args.models:
+            print(f"Pulling {name}...", flush=True)
+            try:
+                if store.entry(name) and store.verify(name):
+                    store.remove(name)  # The hub's cache would keep the damaged files
+                store.pull(name)
+            except Exception as e:
+                print(f"{name}: {e}")
+                status = 1
+                continue
+            entry = store.entry(name)
+            print(f"{name}: revision {entry['revision'][:10]}, {len(entry['files'])} files in {entry['path']}")
+    elif args.command == "list":
+        if not store.models:
+            print(f"No models in {args.cache_dir} (run 'papagaio models pull')")
+        for name, entry in sorted(store.models.items()):
+            megabytes = sum(meta["size"] for meta in entry["files"].values()) / 1e6
+            pulled = time.strftime("%Y-%m-%d", time.localtime(entry["pulled"]))
+            print(f"{name:<12} {entry['revision'][:10]:<11} {megabytes:>7.0f}MB  {pulled}  "
+                  f"{store.check(name) or 'ok'}")
+        for name in configured:
+            if store.entry(name) is None:
+                print(f"{name:<12} configured but not pulled")
+    elif args.command == "verify":
+        for name in args.models or sorted(store.models):
+            problems = store.verify(name)
+            print(f"{name}: {'; '.join(problems) or 'ok'}", flush=True)
+            status = 1 if problems else status
+    elif args.command == "prune":
+        for name in sorted(set(store.models) - set(args.keep)):
+            store.remove(name)
+            print(f"Removed {name}")
+    return status
+
+
 def main():
     import argparse
 
     # License check disabled for development
 
+    if sys.argv[1:2] == ["stats"]:
+        sys.exit(show_stats(os.path.join(tempfile.gettempdir(), "papagaio-stats.json")))
+    if sys.argv[1:2] == ["tune"]:
+        sys.exit(tune_cpu(sys.argv[2:]))
+    if sys.argv[1:2] == ["models"]:
+        sys.exit(manage_models(sys.argv[2:]))
+
     # Load config file defaults
     config = load_config()
 
@@ -1254,6 +4233,25 @@ def main():
         default=config['edit_before_send'],
         help="Show edit dialog before sending text (requires GTK)"
     )
+    parser.add_argument(
+        "-s", "--streaming",
+        action="store_true",
+        default=config['streaming'],
+        help="Transcribe in the background while you are still speaking"
+    )
+    parser.add_argument(
+        "--latency-budget",
+        type=float,
+        default=config['latency_budget'],
+        metavar="SECONDS",
+        help="Pick the model per dictation to decode within this time (0 = always use --model)"
+    )
+    parser.add_argument(
+        "--draft-model",
+        default=config['draft_model'],
+        choices=["", "tiny", "base"],
+        help="Type a fast draft from this model first, then correct it with --model"
+    )
 
     args = parser.parse_args()
 
@@ -1268,8 +4266,22 @@ def main():
         silence_threshold=config['silence_threshold'],
         silence_duration=config['silence_duration'],
         transcription_language=args.transcription_language,
-        edit_before_send=args.edit
+        edit_before_send=args.edit,
+        streaming=args.streaming,
+        warm_microphone=config['warm_microphone'],
+        preroll_ms=config['preroll_ms'],
+        endpointing=config['endpointing'],
+        vad_threshold=config['vad_threshold'],
+        batched_decoding=config['batched_decoding'],
+        batch_size=config['batch_size'],
+        worker_process=config['worker_process'],
+        metrics_file=config['metrics_file'],
+        paste_long_text=config['paste_long_text'],
+        incremental_output=config['incremental_output'],
+        latency_budget=args.latency_budget,
+        draft_model=args.draft_model
     )
+    daemon.config = config
 
     # Handle signals
     def signal_handler(sig, frame):
@@ -1283,4 +4295,6 @@ def main():
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()  # Worker process in PyInstaller builds
     main()
@@ -119,14 +119,14 @@ const translations = {
     version: 'Papagaio',
     cancel: 'Cancel',
     save: 'Save',
-    saveRestart: 'Save & Restart',
+    saveApply: 'Save & Apply',
 
     // Toasts
     configSaved: 'Configuration saved!',
     saveFailed: 'Failed to save:',
-    restarting: 'Restarting daemon...',
-    restartSuccess: 'Daemon restarted successfully!',
-    restartFailed: 'Failed to restart daemon:',
+    applying: 'Applying settings...',
+    applySuccess: 'Settings applied!',
+    applyFailed: 'Failed to apply settings:',
     enterLicenseKey: 'Please enter a license key',
     validatingLicense: 'Validating license...',
     usePapagaioActivate: 'Please use papagaio-activate for license validation'
@@ -252,14 +252,14 @@ const translations = {
     version: 'Papagaio',
     cancel: 'Cancelar',
     save: 'Salvar',
-    saveRestart: 'Salvar e Reiniciar',
+    saveApply: 'Salvar e Aplicar',
 
     // Toasts
     configSaved: 'Configuração salva!',
     saveFailed: 'Falha ao salvar:',
-    restarting: 'Reiniciando daemon...',
-    restartSuccess: 'Daemon reiniciado com sucesso!',
-    restartFailed: 'Falha ao reiniciar daemon:',
+    applying: 'Aplicando configurações...',
+    applySuccess: 'Configurações aplicadas!',
+    applyFailed: 'Falha ao aplicar configurações:',
     enterLicenseKey: 'Por favor, digite uma chave de licença',
     validatingLicense: 'Validando licença...',
     usePapagaioActivate: 'Por favor, use papagaio-activate para validação de licença'
@@ -406,7 +406,7 @@ function applyTranslations() {
   // Footer
   document.getElementById('btn-cancel').textContent = t('cancel');
   document.getElementById('btn-save').textContent = t('save');
-  document.getElementById('btn-save-restart').textContent = t('saveRestart');
+  document.getElementById('btn-save-apply').textContent = t('saveApply');
 }
 
 module.exports = { translations, setLanguage, t, applyTranslations };
@@ -86,6 +86,20 @@ function controlDaemon(action) {
   });
 }
 
+// Apply saved settings to the running daemon without restarting it
+function reloadDaemon() {
+  return new Promise((resolve) => {
+    execFile('papagaio-send', ['reload'], (error) => {
+      if (!error) {
+        resolve({ success: true });
+      } else {
+        // papagaio-send missing or daemon not reachable: (re)start it instead
+        controlDaemon('restart').then(resolve);
+      }
+    });
+  });
+}
+
 // Show notification
 function showNotification(title, body) {
   if (Notification.isSupported()) {
@@ -285,7 +299,8 @@ function parseINI(content) {
 
     const keyValueMatch = line.match(/^([^=]+)=(.*)$/);
     if (keyValueMatch && currentSection) {
-      config[currentSection][keyValueMatch[1].trim()] = keyValueMatch[2].trim();
+      // Drop inline "# comment" text, as the daemon's parser does
+      config[currentSection][keyValueMatch[1].trim()] = keyValueMatch[2].replace(/(^|\s)#.*$/, '').trim();
     }
   });
 
@@ -399,6 +414,15 @@ ipcMain.handle('restart-daemon', async () => {
   return result;
 });
 
+// Apply settings without a restart (keeps the Whisper model loaded)
+ipcMain.handle('reload-daemon', async () => {
+  const result = await reloadDaemon();
+  if (result.success) {
+    updateTrayMenu();
+  }
+  return result;
+});
+
 // Check daemon status using execFile
 ipcMain.handle('check-daemon-status', async () => {
   return checkDaemonStatus();
@@ -102,19 +102,19 @@ async function saveConfig() {
   return result.success;
 }
 
-// Save and restart daemon
-async function saveAndRestart() {
+// Save and apply to the running daemon (no restart, the model stays loaded)
+async function saveAndApply() {
   const saved = await saveConfig();
   if (!saved) return;
 
-  showToast(t('restarting'), 'info');
+  showToast(t('applying'), 'info');
 
-  const result = await ipcRenderer.invoke('restart-daemon');
+  const result = await ipcRenderer.invoke('reload-daemon');
 
   if (result.success) {
-    showToast(t('restartSuccess'), 'success');
+    showToast(t('applySuccess'), 'success');
   } else {
-    showToast(t('restartFailed') + ' ' + result.error, 'error');
+    showToast(t('applyFailed') + ' ' + result.error, 'error');
   }
 
   await updateDaemonStatus();
@@ -225,7 +225,7 @@ function setupEventListeners() {
 
   document.getElementById('btn-save').addEventListener('click', saveConfig);
 
-  document.getElementById('btn-save-restart').addEventListener('click', saveAndRestart);
+  document.getElementById('btn-save-apply').addEventListener('click', saveAndApply);
 
   // External links
   document.querySelectorAll('a[target="_blank"]').forEach(link => {
@@ -193,7 +193,7 @@ try {
     assertTrue(html.includes('id="advanced"'), 'Should have Advanced tab');
     assertTrue(html.includes('id="license"'), 'Should have License tab');
     assertTrue(html.includes('btn-save'), 'Should have Save button');
-    assertTrue(html.includes('btn-save-restart'), 'Should have Save & Restart button');
+    assertTrue(html.includes('btn-save-apply'), 'Should have Save & Apply button');
   });
 
   // Test 8: No Whisper references in UI
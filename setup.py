@@ -60,6 +60,7 @@ setup(
     scripts=[
         "papagaio.py",
         "papagaio-ctl",
+        "papagaio-send",
     ],
     data_files=[
         ("share/doc/papagaio", ["README.md", "CHANGELOG.md", "LICENSE", "CONTRIBUTING.md"]),
@@ -0,0 +1,130 @@
+"""X11Session against an in-memory X server keymap (no display needed)."""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+try:
+    import papagaio
+except SystemExit:
+    pytest.skip("papagaio's dependencies are not installed", allow_module_level=True)
+if not papagaio.HAS_XLIB:
+    pytest.skip("python-xlib is not installed", allow_module_level=True)
+
+from Xlib import X, XK
+from Xlib import display as xlib_display
+from Xlib.protocol import event as xlib_event
+
+MIN_KEYCODE, MAX_KEYCODE = 8, 255
+
+
+class FakeServer:
+    """The server side: one keymap shared by every connection"""
+
+    def __init__(self, keymap):
+        self.keymap = dict(keymap)  # keycode -> (unshifted, shifted) keysyms
+        self.connections = []
+        self.pressed = []  # Keysyms produced by XTEST key presses
+
+    def change(self, keycode, keysyms):
+        self.keymap[keycode] = tuple(keysyms)
+        for connection in self.connections:
+            connection.events.append(xlib_event.MappingNotify(
+                request=X.MappingKeyboard, first_keycode=keycode, count=1))
+
+
+class FakeDisplay(xlib_display.Display):
+    """Xlib's Display with its keymap cache, talking to a FakeServer"""
+
+    def __init__(self, server):
+        self.server = server
+        self.events = []
+        self.display = types.SimpleNamespace(
+            info=types.SimpleNamespace(min_keycode=MIN_KEYCODE, max_keycode=MAX_KEYCODE),
+            pending_events=lambda: len(self.events), next_event=lambda: self.events.pop(0))
+        self._keymap_codes = [()] * 256
+        self._keymap_syms = {}
+        self._update_keymap(MIN_KEYCODE, MAX_KEYCODE - MIN_KEYCODE + 1)
+        server.connections.append(self)
+
+    def get_keyboard_mapping(self, first_keycode, count):
+        return [self.server.keymap.get(code, (X.NoSymbol, X.NoSymbol))
+                for code in range(first_keycode, first_keycode + count)]
+
+    def change_keyboard_mapping(self, first_keycode, keysyms):
+        self.server.change(first_keycode, keysyms[0])
+
+    def has_extension(self, name):
+        return True
+
+    def intern_atom(self, name):
+        return 1
+
+    def screen(self):
+        return types.SimpleNamespace(root=None)
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def us_keymap():
+    keymap = {}
+    for offset, char in enumerate("abcdefghijklmnopqrstuvwxyz"):
+        keymap[24 + offset] = (ord(char), ord(char.upper()))
+    keymap[50] = (XK.string_to_keysym("Shift_L"), X.NoSymbol)
+    keymap[65] = (ord(" "), ord(" "))
+    return keymap
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = FakeServer(us_keymap())
+    shifted = []
+
+    def fake_input(display, kind, keycode):
+        keysyms = server.keymap[keycode]
+        if keysyms[0] == XK.string_to_keysym("Shift_L"):
+            shifted[:] = [kind == X.KeyPress]
+        elif kind == X.KeyPress:
+            server.pressed.append(keysyms[1 if shifted and shifted[0] else 0])
+
+    monkeypatch.setattr(papagaio.xlib_display, "Display", lambda: FakeDisplay(server))
+    monkeypatch.setattr(papagaio.xtest, "fake_input", fake_input)
+    return server
+
+
+def typed(server):
+    return "".join(chr(keysym) for keysym in server.pressed)
+
+
+def test_types_through_the_keymap(server):
+    session = papagaio.X11Session()
+    session.type("Hello world")
+    assert typed(server) == "Hello world"
+    assert session.typed == len("Hello world")
+
+
+def test_follows_a_keyboard_mapping_change(server):
+    session = papagaio.X11Session()
+    session.type("zy")
+    # Switch to a German layout, which swaps Y and Z
+    y_key, z_key = 24 + ord("y") - ord("a"), 24 + ord("z") - ord("a")
+    server.change(y_key, (ord("z"), ord("Z")))
+    server.change(z_key, (ord("y"), ord("Y")))
+    server.pressed.clear()
+    session.type("zy Zy")
+    assert typed(server) == "zy Zy"
+
+
+def test_spare_keycode_bindings_are_read_back(server):
+    session = papagaio.X11Session()
+    session.type("é")
+    session.type("aé")
+    assert typed(server) == "éaé"
+    assert not session.display.keysym_to_keycode(ord("é"))  # The binding was undone
@@ -76,6 +76,10 @@ remove_files() {
         rm -f "$BIN_DIR/papagaio-ctl"
         print_success "Removed papagaio-ctl symlink"
     fi
+    if [ -L "$BIN_DIR/papagaio-send" ]; then
+        rm -f "$BIN_DIR/papagaio-send"
+        print_success "Removed papagaio-send symlink"
+    fi
 
     # Remove installation directory
     if [ -d "$INSTALL_DIR" ]; then